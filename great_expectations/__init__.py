@@ -10,6 +10,7 @@ from .util import (
     from_pandas,
     measure_execution_time,
     read_csv,
+    read_csv_in_chunks,
     read_excel,
     read_feather,
     read_json,
@@ -46,3 +46,46 @@ def store_list(directory):
     except Exception as e:
         send_usage_message(data_context=context, event="cli.store.list", success=False)
         raise e
+
+
+@store.command(name="rebuild-index")
+@click.argument("store_name")
+@click.option(
+    "--directory",
+    "-d",
+    default=None,
+    help="The project's great_expectations directory.",
+)
+def store_rebuild_index(store_name, directory):
+    """Rebuild the key index of a Store from its files.
+
+    This repairs the index of a Store whose backend uses a key index (a TupleFilesystemStoreBackend with
+    use_key_index: true) after files were added or removed outside of Great Expectations.
+    """
+    context = toolkit.load_data_context_with_error_handling(directory)
+    usage_event = "cli.store.rebuild_index"
+
+    if store_name not in context.stores:
+        toolkit.exit_with_failure_message_and_stats(
+            context,
+            usage_event,
+            f"<red>Could not find a store named `{store_name}`.</red> Please check "
+            "the name by running `great_expectations store list` and try again.",
+        )
+    store_backend = context.stores[store_name].store_backend
+    if not getattr(store_backend, "use_key_index", False):
+        toolkit.exit_with_failure_message_and_stats(
+            context,
+            usage_event,
+            f"<red>The store `{store_name}` does not use a key index.</red>",
+        )
+
+    try:
+        key_count = store_backend.rebuild_key_index()
+        cli_message(
+            f"Rebuilt the key index of store `{store_name}`: {key_count} file(s) indexed."
+        )
+        send_usage_message(data_context=context, event=usage_event, success=True)
+    except Exception as e:
+        send_usage_message(data_context=context, event=usage_event, success=False)
+        raise e
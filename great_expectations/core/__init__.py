@@ -1,3 +1,4 @@
+import bisect
 import datetime
 import json
 import logging
@@ -1473,6 +1474,60 @@ class ExpectationConfigurationSchema(Schema):
 #             raise ValidationError("meta information must be json serializable.")
 
 
+class _ExpectationList(list):
+    """The list of expectations of an ExpectationSuite.
+
+    It counts its modifications, so that the suite knows when its index of the expectations is out of date.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.version = 0
+
+    def _modified(self):
+        self.version = getattr(self, "version", 0) + 1
+
+
+def _add_modification_count(method_name):
+    method = getattr(list, method_name)
+
+    def modifying_method(self, *args, **kwargs):
+        self._modified()
+        return method(self, *args, **kwargs)
+
+    modifying_method.__name__ = method_name
+    setattr(_ExpectationList, method_name, modifying_method)
+
+
+for _method_name in [
+    "append",
+    "extend",
+    "insert",
+    "pop",
+    "remove",
+    "clear",
+    "sort",
+    "reverse",
+    "__setitem__",
+    "__delitem__",
+    "__iadd__",
+    "__imul__",
+]:
+    _add_modification_count(_method_name)
+
+
+def _freeze_domain_kwarg(value):
+    """Return a hashable version of a domain kwarg that compares like the value itself."""
+    if isinstance(value, dict):
+        return tuple(
+            sorted((key, _freeze_domain_kwarg(item)) for key, item in value.items())
+        )
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze_domain_kwarg(item) for item in value)
+    hash(value)
+    return value
+
+
 class ExpectationSuite:
     """
     This ExpectationSuite object has create, read, update, and delete functionality for its expectations:
@@ -1480,6 +1535,10 @@ class ExpectationSuite:
         -read: self.find_expectation_indexes()
         -update: self.add_expectation() or self.patch_expectation()
         -delete: self.remove_expectation()
+
+    The suite indexes its expectations by expectation_type and domain kwargs, so finding the expectations matching
+    a configuration only compares it with the expectations of the same domain. The index is kept up to date by
+    the methods above, and rebuilt when the expectations list is modified directly.
     """
 
     def __init__(
@@ -1514,6 +1573,60 @@ class ExpectationSuite:
         ensure_json_serializable(meta)
         self.meta = meta
 
+    @property
+    def expectations(self):
+        return self._expectations
+
+    @expectations.setter
+    def expectations(self, expectations):
+        self._expectations = _ExpectationList(expectations)
+        self._domain_index = None
+
+    @staticmethod
+    def _get_domain_key(expectation_configuration):
+        """Return the key of an expectation in the domain index, or None if its domain kwargs are not hashable."""
+        try:
+            return (
+                expectation_configuration.expectation_type,
+                _freeze_domain_kwarg(expectation_configuration.get_domain_kwargs()),
+            )
+        except (TypeError, InvalidExpectationKwargsError):
+            return None
+
+    def _get_domain_index(self):
+        """Return the positions of the expectations by domain key, rebuilding the index if it is out of date."""
+        if (
+            self._domain_index is None
+            or self._domain_index_version != self._expectations.version
+        ):
+            self._domain_keys = [
+                self._get_domain_key(expectation) for expectation in self._expectations
+            ]
+            self._build_domain_index()
+        return self._domain_index
+
+    def _build_domain_index(self):
+        domain_index = {}
+        for position, domain_key in enumerate(self._domain_keys):
+            domain_index.setdefault(domain_key, []).append(position)
+        self._domain_index = domain_index
+        self._domain_index_version = self._expectations.version
+
+    def _add_to_domain_index(self, position, domain_key):
+        bisect.insort(self._domain_index.setdefault(domain_key, []), position)
+        self._domain_index_version = self._expectations.version
+
+    def _update_domain_index(self, position):
+        """Move the expectation at the given position to the entry of its current domain."""
+        old_domain_key = self._domain_keys[position]
+        new_domain_key = self._get_domain_key(self._expectations[position])
+        if new_domain_key == old_domain_key:
+            self._domain_index_version = self._expectations.version
+            return
+        self._domain_index[old_domain_key].remove(position)
+        self._domain_keys[position] = new_domain_key
+        self._add_to_domain_index(position, new_domain_key)
+
     def add_citation(
         self,
         comment,
@@ -1658,7 +1771,11 @@ class ExpectationSuite:
            Notes:
                May want to add type-checking in the future.
         """
+        self._get_domain_index()
         self.expectations.append(expectation_config)
+        domain_key = self._get_domain_key(expectation_config)
+        self._domain_keys.append(domain_key)
+        self._add_to_domain_index(len(self.expectations) - 1, domain_key)
 
     def remove_expectation(
         self,
@@ -1693,6 +1810,8 @@ class ExpectationSuite:
                 removed_expectations = []
                 for index in sorted(found_expectation_indexes, reverse=True):
                     removed_expectations.append(self.expectations.pop(index))
+                    del self._domain_keys[index]
+                self._build_domain_index()
                 return removed_expectations
             else:
                 raise ValueError(
@@ -1701,7 +1820,10 @@ class ExpectationSuite:
                 )
 
         else:
-            return [self.expectations.pop(found_expectation_indexes[0])]
+            removed_expectation = self.expectations.pop(found_expectation_indexes[0])
+            del self._domain_keys[found_expectation_indexes[0]]
+            self._build_domain_index()
+            return [removed_expectation]
 
     def remove_all_expectations_of_type(
         self, expectation_types: Union[List[str], str]
@@ -1746,9 +1868,21 @@ class ExpectationSuite:
             raise InvalidExpectationConfigurationError(
                 "Ensure that expectation configuration is valid."
             )
+        # Expectations that match on success or runtime kwargs also match on domain, so the candidates are the
+        # expectations of the same domain, and the ones whose domain kwargs could not be indexed
+        domain_index = self._get_domain_index()
+        domain_key = self._get_domain_key(expectation_configuration)
+        if domain_key is None:
+            candidate_indexes = range(len(self.expectations))
+        else:
+            candidate_indexes = sorted(
+                domain_index.get(domain_key, []) + domain_index.get(None, [])
+            )
         match_indexes = []
-        for idx, expectation in enumerate(self.expectations):
-            if expectation.isEquivalentTo(expectation_configuration, match_type):
+        for idx in candidate_indexes:
+            if self.expectations[idx].isEquivalentTo(
+                expectation_configuration, match_type
+            ):
                 match_indexes.append(idx)
 
         return match_indexes
@@ -1761,14 +1895,7 @@ class ExpectationSuite:
         found_expectation_indexes = self.find_expectation_indexes(
             expectation_configuration, match_type
         )
-        if len(found_expectation_indexes) > 0:
-            return [
-                expectation
-                for idx, expectation in enumerate(self.expectations)
-                if idx in found_expectation_indexes
-            ]
-        else:
-            return []
+        return [self.expectations[idx] for idx in found_expectation_indexes]
 
     def patch_expectation(
         self,
@@ -1807,8 +1934,13 @@ class ExpectationSuite:
                 "criteria"
             )
 
-        self.expectations[found_expectation_indexes[0]].patch(op, path, value)
-        return self.expectations[found_expectation_indexes[0]]
+        found_expectation_index = found_expectation_indexes[0]
+        patched_expectation = self.expectations[found_expectation_index].patch(
+            op, path, value
+        )
+        # The patch may have changed the domain of the expectation
+        self._update_domain_index(found_expectation_index)
+        return patched_expectation
 
     def add_expectation(
         self,
@@ -1849,6 +1981,7 @@ class ExpectationSuite:
                 self.expectations[
                     found_expectation_indexes[0]
                 ] = expectation_configuration
+                self._update_domain_index(found_expectation_indexes[0])
             else:
                 raise DataContextError(
                     "A matching ExpectationConfiguration already exists. If you would like to overwrite this "
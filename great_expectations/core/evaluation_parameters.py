@@ -166,10 +166,14 @@ def build_evaluation_parameters(
     evaluation_parameters=None,
     interactive_evaluation=True,
     data_context=None,
+    resolved_urns=None,
 ):
     """Build a dictionary of parameters to evaluate, using the provided evaluation_parameters,
     AND mutate expectation_args by removing any parameter values passed in as temporary values during
     exploratory work.
+
+    If resolved_urns is a dictionary, the values of the store URNs that are resolved are memoized in it; validations
+    pass the same dictionary for all their expectations, so that each store query runs once per validation.
     """
     evaluation_args = copy.deepcopy(expectation_args)
     substituted_parameters = dict()
@@ -197,6 +201,7 @@ def build_evaluation_parameters(
                     value["$PARAMETER"],
                     evaluation_parameters=evaluation_parameters,
                     data_context=data_context,
+                    resolved_urns=resolved_urns,
                 )
                 evaluation_args[key] = parameter_value
                 # Once we've substituted, we also track that we did so
@@ -270,7 +275,10 @@ def find_evaluation_parameter_dependencies(parameter_expression):
 
 
 def parse_evaluation_parameter(
-    parameter_expression, evaluation_parameters=None, data_context=None
+    parameter_expression,
+    evaluation_parameters=None,
+    data_context=None,
+    resolved_urns=None,
 ):
     """Use the provided evaluation_parameters dict to parse a given parameter expression.
 
@@ -279,6 +287,7 @@ def parse_evaluation_parameter(
             and variables to be substituted
         evaluation_parameters (dict): A dictionary of name-value pairs consisting of values to substitute
         data_context (DataContext): A data context to use to obtain metrics, if necessary
+        resolved_urns (dict): A dictionary in which to memoize the values of the store URNs that are resolved
 
     The parser will allow arithmetic operations +, -, /, *, as well as basic functions, including trunc() and round() to
     obtain integer values when needed for certain expectations (e.g. expect_column_value_length_to_be_between).
@@ -300,13 +309,18 @@ def parse_evaluation_parameter(
     if len(L) == 1 and L[0] not in evaluation_parameters:
         # In this special case there were no operations to find, so only one value, but we don't have something to
         # substitute for that value
+        if resolved_urns is not None and L[0] in resolved_urns:
+            return copy.deepcopy(resolved_urns[L[0]])
         try:
             res = ge_urn.parseString(L[0])
             if res["urn_type"] == "stores":
                 store = data_context.stores.get(res["store_name"])
-                return store.get_query_result(
+                query_result = store.get_query_result(
                     res["metric_name"], res.get("metric_kwargs", {})
                 )
+                if resolved_urns is not None:
+                    resolved_urns[L[0]] = copy.deepcopy(query_result)
+                return query_result
             else:
                 logger.error(
                     "Unrecognized urn_type in ge_urn: must be 'stores' to use a metric store."
@@ -96,6 +96,34 @@ class BatchMetric(Metric):
         return self._batch_identifier
 
 
+class BatchMetricIdentifier(MetricIdentifier):
+    """A BatchMetricIdentifier identifies the value of a metric computed on a particular Batch of data."""
+
+    def __init__(self, batch_identifier, metric_name, metric_kwargs_id):
+        super().__init__(metric_name, metric_kwargs_id)
+        self._batch_identifier = batch_identifier
+
+    @property
+    def batch_identifier(self):
+        return self._batch_identifier
+
+    @classmethod
+    def from_object(cls, batch_metric):
+        if not isinstance(batch_metric, BatchMetric):
+            raise GreatExpectationsError(
+                "Unable to build BatchMetricIdentifier from object of type {} when BatchMetric is "
+                "expected.".format(type(batch_metric))
+            )
+        return cls(
+            batch_metric.batch_identifier,
+            batch_metric.metric_name,
+            batch_metric.metric_kwargs_id,
+        )
+
+    def to_tuple(self):
+        return (self.batch_identifier,) + super().to_tuple()
+
+
 class ValidationMetric(Metric):
     def __init__(
         self,
@@ -430,6 +430,7 @@ usage_statistics_record_schema = {
                         "cli.suite.new",
                         "cli.suite.scaffold",
                         "cli.store.list",
+                        "cli.store.rebuild_index",
                         "cli.project.check_config",
                         "cli.checkpoint.list",
                         "cli.datasource.list",
@@ -1,9 +1,11 @@
+import concurrent.futures
 import copy
 import datetime
 import decimal
 import inspect
 import json
 import logging
+import random
 import traceback
 import uuid
 import warnings
@@ -26,6 +28,7 @@ from great_expectations.core import (
 from great_expectations.core.evaluation_parameters import build_evaluation_parameters
 from great_expectations.core.id_dict import BatchKwargs
 from great_expectations.data_asset.util import (
+    get_proportion_confidence_interval,
     parse_result_format,
     recursively_convert_to_json_serializable,
 )
@@ -86,6 +89,10 @@ class DataAsset:
         # This special state variable tracks whether a validation run is going on, which will disable
         # saving expectation config objects
         self._active_validation = False
+        # The values of the store URNs resolved during a validation run, which its expectations share
+        self._resolved_urns = None
+        # How this data asset was sampled from another one, when it is validated as a sample of it
+        self._sampling = None
         if profiler is not None:
             profiler.profile(self)
         if data_context and hasattr(data_context, "_expectation_explorer_manager"):
@@ -703,6 +710,10 @@ class DataAsset:
         only_return_failures=False,
         run_name=None,
         run_time=None,
+        max_workers=None,
+        sample_fraction=None,
+        sample_seed=None,
+        confidence_level=0.95,
     ):
         """Generates a JSON-formatted report describing the outcome of all expectations.
 
@@ -730,6 +741,18 @@ class DataAsset:
                 etc.).
             only_return_failures (boolean): \
                 If True, expectation results are only returned when ``success = False`` \
+            max_workers (int or None): \
+                If greater than 1, expectations on different columns are evaluated concurrently on a pool of \
+                max_workers threads. Results are returned in the same order as a sequential run.
+            sample_fraction (float or None): \
+                If set, only a random sample of about this fraction of the rows is validated. Map expectations then \
+                report in details.sampling the unexpected fraction estimated from the sample, its confidence \
+                interval, and whether the outcome against mostly holds across the interval ("conclusive"). Other \
+                expectations are evaluated on the sample as is. The sampling is recorded in the meta of the result.
+            sample_seed (int or None): \
+                The seed of the sample; if None, a seed is drawn and recorded in the meta of the result.
+            confidence_level (float): \
+                The confidence level of the intervals reported when validating a sample.
 
         Returns:
             A JSON-formatted dictionary containing a list of the validation results. \
@@ -769,6 +792,23 @@ class DataAsset:
         Raises:
            AttributeError - if 'catch_exceptions'=None and an expectation throws an AttributeError
         """
+        if sample_fraction is not None:
+            return self._validate_sample(
+                sample_fraction,
+                sample_seed,
+                confidence_level,
+                expectation_suite=expectation_suite,
+                run_id=run_id,
+                data_context=data_context,
+                evaluation_parameters=evaluation_parameters,
+                catch_exceptions=catch_exceptions,
+                result_format=result_format,
+                only_return_failures=only_return_failures,
+                run_name=run_name,
+                run_time=run_time,
+                max_workers=max_workers,
+            )
+
         try:
             validation_time = datetime.datetime.now(datetime.timezone.utc).strftime(
                 "%Y%m%dT%H%M%S.%fZ"
@@ -796,6 +836,7 @@ class DataAsset:
                 run_id = RunIdentifier(run_name=run_name, run_time=run_time)
 
             self._active_validation = True
+            self._resolved_urns = {}
 
             # If a different validation data context was provided, override
             validate__data_context = self._data_context
@@ -908,63 +949,34 @@ class DataAsset:
             for col in columns:
                 expectations_to_evaluate.extend(columns[col])
 
-            for expectation in expectations_to_evaluate:
-
-                try:
-                    # copy the config so we can modify it below if needed
-                    expectation = copy.deepcopy(expectation)
-
-                    expectation_method = getattr(self, expectation.expectation_type)
-
-                    if result_format is not None:
-                        expectation.kwargs.update({"result_format": result_format})
-
-                    # A missing parameter will raise an EvaluationParameterError
-                    (
-                        evaluation_args,
-                        substituted_parameters,
-                    ) = build_evaluation_parameters(
-                        expectation.kwargs,
-                        runtime_evaluation_parameters,
-                        self._config.get("interactive_evaluation", True),
-                        self._data_context,
-                    )
+            self._prepare_validation(
+                expectations_to_evaluate, runtime_evaluation_parameters
+            )
 
-                    result = expectation_method(
-                        catch_exceptions=catch_exceptions,
-                        include_config=True,
-                        **evaluation_args
+            if max_workers is None or max_workers <= 1:
+                results = self._evaluate_expectations(
+                    expectations_to_evaluate,
+                    runtime_evaluation_parameters,
+                    catch_exceptions=catch_exceptions,
+                    result_format=result_format,
+                )
+            else:
+                # Column groups are evaluated concurrently; the expectations of a group run in order on the same
+                # worker so that they share the metrics cached for their column.
+                with concurrent.futures.ThreadPoolExecutor(
+                    max_workers=max_workers
+                ) as executor:
+                    group_results = executor.map(
+                        lambda group: self._evaluate_expectations(
+                            group,
+                            runtime_evaluation_parameters,
+                            catch_exceptions=catch_exceptions,
+                            result_format=result_format,
+                        ),
+                        columns.values(),
                     )
-
-                except Exception as err:
-                    if catch_exceptions:
-                        raised_exception = True
-                        exception_traceback = traceback.format_exc()
-
-                        result = ExpectationValidationResult(
-                            success=False,
-                            exception_info={
-                                "raised_exception": raised_exception,
-                                "exception_traceback": exception_traceback,
-                                "exception_message": str(err),
-                            },
-                        )
-
-                    else:
-                        raise err
-
-                # if include_config:
-                result.expectation_config = expectation
-
-                # Add an empty exception_info object if no exception was caught
-                if catch_exceptions and result.exception_info is None:
-                    result.exception_info = {
-                        "raised_exception": False,
-                        "exception_traceback": None,
-                        "exception_message": None,
-                    }
-
-                results.append(result)
+                    for results_of_group in group_results:
+                        results.extend(results_of_group)
 
             statistics = _calc_validation_statistics(results)
 
@@ -1010,6 +1022,8 @@ class DataAsset:
             raise
         finally:
             self._active_validation = False
+            self._resolved_urns = None
+            self._finish_validation()
 
         if getattr(data_context, "_usage_statistics_handler", None):
             handler = data_context._usage_statistics_handler
@@ -1020,6 +1034,155 @@ class DataAsset:
             )
         return result
 
+    def _evaluate_expectations(
+        self,
+        expectations,
+        evaluation_parameters,
+        catch_exceptions=True,
+        result_format=None,
+    ) -> List[ExpectationValidationResult]:
+        """Evaluate the given expectations in order, as part of a validation run.
+
+        Returns:
+            list of ExpectationValidationResult, in the order of the expectations
+        """
+        results = []
+        for expectation in expectations:
+
+            try:
+                # copy the config so we can modify it below if needed
+                expectation = copy.deepcopy(expectation)
+
+                expectation_method = getattr(self, expectation.expectation_type)
+
+                if result_format is not None:
+                    expectation.kwargs.update({"result_format": result_format})
+
+                # A missing parameter will raise an EvaluationParameterError
+                (
+                    evaluation_args,
+                    substituted_parameters,
+                ) = build_evaluation_parameters(
+                    expectation.kwargs,
+                    evaluation_parameters,
+                    self._config.get("interactive_evaluation", True),
+                    self._data_context,
+                    resolved_urns=self._resolved_urns,
+                )
+
+                result = expectation_method(
+                    catch_exceptions=catch_exceptions,
+                    include_config=True,
+                    **evaluation_args,
+                )
+
+            except Exception as err:
+                if catch_exceptions:
+                    raised_exception = True
+                    exception_traceback = traceback.format_exc()
+
+                    result = ExpectationValidationResult(
+                        success=False,
+                        exception_info={
+                            "raised_exception": raised_exception,
+                            "exception_traceback": exception_traceback,
+                            "exception_message": str(err),
+                        },
+                    )
+
+                else:
+                    raise err
+
+            # if include_config:
+            result.expectation_config = expectation
+
+            # Add an empty exception_info object if no exception was caught
+            if catch_exceptions and result.exception_info is None:
+                result.exception_info = {
+                    "raised_exception": False,
+                    "exception_traceback": None,
+                    "exception_message": None,
+                }
+
+            results.append(result)
+
+        return results
+
+    def _validate_sample(
+        self,
+        sample_fraction,
+        sample_seed,
+        confidence_level,
+        expectation_suite=None,
+        data_context=None,
+        **kwargs,
+    ):
+        """Validate a random sample of the data asset, drawn with _get_validation_sample; see validate."""
+        if not 0 < sample_fraction <= 1:
+            raise ValueError("sample_fraction must be greater than 0 and at most 1.")
+        if not 0 < confidence_level < 1:
+            raise ValueError("confidence_level must be between 0 and 1.")
+        if sample_seed is None:
+            # Draw the seed here, so that the sample can be drawn again from the seed recorded in the result
+            sample_seed = random.randrange(2 ** 31 - 1)
+        if expectation_suite is None:
+            expectation_suite = self.get_expectation_suite(
+                discard_failed_expectations=False,
+                discard_result_format_kwargs=False,
+                discard_include_config_kwargs=False,
+                discard_catch_exceptions_kwargs=False,
+            )
+
+        sample, sampling = self._get_validation_sample(sample_fraction, sample_seed)
+        sampling.update(
+            {"fraction": sample_fraction, "confidence_level": confidence_level}
+        )
+        sample._sampling = sampling
+        result = sample.validate(
+            expectation_suite=expectation_suite,
+            data_context=data_context or self._data_context,
+            **kwargs,
+        )
+        result.meta["sampling"] = sampling
+        return result
+
+    def _get_validation_sample(self, sample_fraction, sample_seed):
+        """Draw a random sample of the data asset, to be validated in its place.
+
+        The sample is a new data asset of the same type, with the batch_kwargs, batch_markers and batch_parameters of
+        this one but without its data context, so that its metrics are not read from or written to the metric cache
+        of the batch.
+
+        Args:
+            sample_fraction (float): the expected fraction of the rows in the sample
+            sample_seed (int): the seed of the sample
+
+        Returns:
+            (sample, sampling): the sample, and a dict with the sampling "method" and the "seed" it used (None if \
+            the method could not be seeded), and optionally whether drawing the sample again with the seed gives \
+            the same rows ("reproducible")
+        """
+        raise NotImplementedError(
+            "%s does not support validating a sample." % self.__class__.__name__
+        )
+
+    def _prepare_validation(self, expectations, evaluation_parameters):
+        """Called by validate after the expectations to evaluate have been selected and before any of them is run.
+
+        Subclasses can override this to share work across all the expectations of a validation run (for example, to
+        compute the metrics of several expectations with a single query). The default implementation does nothing.
+
+        Args:
+            expectations (list of ExpectationConfiguration): the expectations that will be evaluated, in order
+            evaluation_parameters (dict): the runtime evaluation parameters of the validation run
+        """
+        pass
+
+    def _finish_validation(self):
+        """Called by validate once the validation run is over, whether or not it succeeded, to release any state
+        created by _prepare_validation."""
+        pass
+
     def get_evaluation_parameter(self, parameter_name, default_value=None):
         """Get an evaluation parameter value that has been stored in meta.
 
@@ -1094,6 +1257,7 @@ class DataAsset:
         unexpected_count,
         unexpected_list,
         unexpected_index_list,
+        mostly=None,
     ):
         """Helper function to construct expectation result objects for map_expectations (such as column_map_expectation
         and file_lines_map_expectation).
@@ -1102,7 +1266,8 @@ class DataAsset:
         In each case, the object returned has a different set of populated fields.
         See :ref:`result_format` for more information.
 
-        This function handles the logic for mapping those fields for column_map_expectations.
+        This function handles the logic for mapping those fields for column_map_expectations. When the data asset is
+        a validation sample, the unexpected fraction estimated from it is checked against mostly in details.sampling.
         """
         # NB: unexpected_count parameter is explicit some implementing classes may limit the length of unexpected_list
 
@@ -1143,6 +1308,13 @@ class DataAsset:
             ],
         }
 
+        if self._sampling is not None and success is not None:
+            return_obj["result"]["details"] = {
+                "sampling": self._calc_sampled_map_expectation_details(
+                    nonnull_count, unexpected_count, mostly
+                )
+            }
+
         if result_format["result_format"] == "BASIC":
             return return_obj
 
@@ -1194,6 +1366,44 @@ class DataAsset:
             "Unknown result_format {}.".format(result_format["result_format"])
         )
 
+    def _calc_sampled_map_expectation_details(
+        self, nonnull_count, unexpected_count, mostly
+    ):
+        """Estimate the unexpected fraction of the data a validation sample was drawn from.
+
+        Args:
+            nonnull_count (int): \
+                The number of nonnull values in the sample
+            unexpected_count (int): \
+                The number of unexpected values in the sample
+            mostly (float or None): \
+                The fraction of successes required to pass the expectation; None if all values must succeed.
+
+        Returns:
+            dict with the estimated unexpected_fraction, its unexpected_fraction_interval at the confidence_level of \
+            the sample, and whether the expectation has the same outcome against mostly at both ends of the \
+            interval ("conclusive")
+        """
+        confidence_level = self._sampling["confidence_level"]
+        interval = get_proportion_confidence_interval(
+            unexpected_count, nonnull_count, confidence_level
+        )
+        if interval is None:
+            return {
+                "unexpected_fraction": None,
+                "unexpected_fraction_interval": None,
+                "confidence_level": confidence_level,
+                "conclusive": False,
+            }
+        required_success_fraction = mostly if mostly is not None else 1
+        return {
+            "unexpected_fraction": unexpected_count / nonnull_count,
+            "unexpected_fraction_interval": interval,
+            "confidence_level": confidence_level,
+            "conclusive": (1 - interval[1] >= required_success_fraction)
+            == (1 - interval[0] >= required_success_fraction),
+        }
+
     def _calc_map_expectation_success(self, success_count, nonnull_count, mostly):
         """Calculate success and percent_success for column_map_expectations
 
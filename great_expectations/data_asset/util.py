@@ -7,6 +7,7 @@ from functools import wraps
 
 import numpy as np
 import pandas as pd
+from scipy import stats
 
 from great_expectations.core import (
     ExpectationConfiguration,
@@ -29,6 +30,33 @@ def parse_result_format(result_format):
     return result_format
 
 
+def get_proportion_confidence_interval(count, total, confidence_level=0.95):
+    """Return the Wilson score interval of the proportion count / total observed in a random sample.
+
+    Args:
+        count (int): the number of sampled items with the property
+        total (int): the number of sampled items
+        confidence_level (float): the probability that the interval holds the proportion of the population
+
+    Returns:
+        [lower bound, upper bound] of the proportion, or None if total is 0
+    """
+    if total == 0:
+        return None
+    z = stats.norm.ppf(1 - (1 - confidence_level) / 2)
+    proportion = count / total
+    denominator = 1 + z ** 2 / total
+    center = (proportion + z ** 2 / (2 * total)) / denominator
+    half_width = (
+        z
+        * np.sqrt(proportion * (1 - proportion) / total + z ** 2 / (4 * total ** 2))
+        / denominator
+    )
+    lower_bound = 0.0 if count == 0 else float(max(center - half_width, 0.0))
+    upper_bound = 1.0 if count == total else float(min(center + half_width, 1.0))
+    return [lower_bound, upper_bound]
+
+
 """Docstring inheriting descriptor. Note that this is not a docstring so that this is not added to @DocInherit-\
 decorated functions' hybrid docstrings.
 
@@ -34,6 +34,7 @@ from great_expectations.core.usage_statistics.usage_statistics import (
 )
 from great_expectations.core.util import nested_update
 from great_expectations.data_asset import DataAsset
+from great_expectations.data_context.store import MetricCacheStore
 from great_expectations.data_context.templates import (
     CONFIG_VARIABLES_TEMPLATE,
     PROJECT_TEMPLATE_USAGE_STATISTICS_DISABLED,
@@ -1344,6 +1345,7 @@ class BaseDataContext:
             "data_asset_name"
         )
 
+        metrics = []
         for expectation_suite_dependency, metrics_list in requested_metrics.items():
             if (expectation_suite_dependency != "*") and (
                 expectation_suite_dependency != expectation_suite_name
@@ -1365,19 +1367,21 @@ class BaseDataContext:
                         metric_value = validation_results.get_metric(
                             metric_name, **metric_kwargs
                         )
-                        self.stores[target_store_name].set(
-                            ValidationMetricIdentifier(
-                                run_id=run_id,
-                                data_asset_name=data_asset_name,
-                                expectation_suite_identifier=ExpectationSuiteIdentifier(
-                                    expectation_suite_name
+                        metrics.append(
+                            (
+                                ValidationMetricIdentifier(
+                                    run_id=run_id,
+                                    data_asset_name=data_asset_name,
+                                    expectation_suite_identifier=ExpectationSuiteIdentifier(
+                                        expectation_suite_name
+                                    ),
+                                    metric_name=metric_name,
+                                    metric_kwargs_id=get_metric_kwargs_id(
+                                        metric_name, metric_kwargs
+                                    ),
                                 ),
-                                metric_name=metric_name,
-                                metric_kwargs_id=get_metric_kwargs_id(
-                                    metric_name, metric_kwargs
-                                ),
-                            ),
-                            metric_value,
+                                metric_value,
+                            )
                         )
                     except ge_exceptions.UnavailableMetricError:
                         # This will happen frequently in larger pipelines
@@ -1386,6 +1390,9 @@ class BaseDataContext:
                             "this validation result.".format(metric_name)
                         )
 
+        if metrics:
+            self.stores[target_store_name].set_many(metrics)
+
     def store_validation_result_metrics(
         self, requested_metrics, validation_results, target_store_name
     ):
@@ -1422,6 +1429,17 @@ class BaseDataContext:
     def validations_store(self):
         return self.stores[self.validations_store_name]
 
+    @property
+    def metric_cache_store(self):
+        """The store in which datasets of this context cache their metrics between runs.
+
+        The metric cache is enabled by configuring a store of class MetricCacheStore; this is None otherwise.
+        """
+        for store in self.stores.values():
+            if isinstance(store, MetricCacheStore):
+                return store
+        return None
+
     def _compile_evaluation_parameter_dependencies(self):
         self._evaluation_parameter_dependencies = {}
         for key in self.stores[self.expectations_store_name].list_keys():
@@ -1448,7 +1466,7 @@ class BaseDataContext:
         Args:
             data_asset_name: name of data asset for which to get validation result
             expectation_suite_name: expectation_suite name for which to get validation result (default: "default")
-            run_id: run_id for which to get validation result (if None, fetch the latest result by alphanumeric sort)
+            run_id: run_id for which to get validation result (if None, fetch the latest result by run_time)
             validations_store_name: the name of the store from which to get validation results
             failed_only: if True, filter the result to return only failed expectations
 
@@ -1460,34 +1478,30 @@ class BaseDataContext:
             validations_store_name = self.validations_store_name
         selected_store = self.stores[validations_store_name]
 
-        if run_id is None or batch_identifier is None:
-            # Get most recent run id
+        if run_id is None:
+            # The store finds the latest result in its latest result index, if it keeps one
+            latest_key = selected_store.get_latest_key(
+                expectation_suite_name, batch_identifier=batch_identifier
+            )
+            if latest_key is None:
+                logger.warning("No valid run_id values found.")
+                return {}
+            run_id = latest_key.run_id
+            batch_identifier = latest_key.batch_identifier
+        elif batch_identifier is None:
+            # Get the latest batch of the run
             # NOTE : This method requires a (potentially very inefficient) list_keys call.
-            # It should probably move to live in an appropriate Store class,
-            # but when we do so, that Store will need to function as more than just a key-value Store.
-            key_list = selected_store.list_keys()
-            filtered_key_list = []
-            for key in key_list:
-                if run_id is not None and key.run_id != run_id:
-                    continue
-                if (
-                    batch_identifier is not None
-                    and key.batch_identifier != batch_identifier
-                ):
-                    continue
-                filtered_key_list.append(key)
-
-            # run_id_set = set([key.run_id for key in filtered_key_list])
+            filtered_key_list = [
+                key
+                for key in selected_store.list_keys()
+                if key.expectation_suite_identifier.expectation_suite_name
+                == expectation_suite_name
+                and key.run_id == run_id
+            ]
             if len(filtered_key_list) == 0:
                 logger.warning("No valid run_id values found.")
                 return {}
-
-            filtered_key_list = sorted(filtered_key_list, key=lambda x: x.run_id)
-
-            if run_id is None:
-                run_id = filtered_key_list[-1].run_id
-            if batch_identifier is None:
-                batch_identifier = filtered_key_list[-1].batch_identifier
+            batch_identifier = filtered_key_list[-1].batch_identifier
 
         key = ValidationResultIdentifier(
             expectation_suite_identifier=ExpectationSuiteIdentifier(
@@ -1522,7 +1536,11 @@ class BaseDataContext:
 
     @usage_statistics_enabled_method(event_name="data_context.build_data_docs")
     def build_data_docs(
-        self, site_names=None, resource_identifiers=None, dry_run=False
+        self,
+        site_names=None,
+        resource_identifiers=None,
+        dry_run=False,
+        max_workers=None,
     ):
         """
         Build Data Docs for your project.
@@ -1545,6 +1563,8 @@ class BaseDataContext:
                             these sites. The motivation for adding this flag was to allow
                             the CLI to display the the URLs before building and to let users
                             confirm.
+        :param max_workers: if specified, overrides the max_workers option of the sites: the number of processes
+                            pages are rendered in (None or 1 renders them sequentially)
 
         Returns:
             A dictionary with the names of the updated data documentation sites as keys and the the location info
@@ -1563,6 +1583,10 @@ class BaseDataContext:
 
                 if (site_names and (site_name in site_names)) or not site_names:
                     complete_site_config = site_config
+                    if max_workers is not None:
+                        complete_site_config = dict(
+                            site_config, max_workers=max_workers
+                        )
                     module_name = "great_expectations.render.renderer.site_builder"
                     site_builder = instantiate_class_from_config(
                         config=complete_site_config,
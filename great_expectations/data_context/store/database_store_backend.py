@@ -11,8 +11,10 @@ try:
         String,
         Table,
         and_,
+        bindparam,
         column,
         create_engine,
+        or_,
         select,
         text,
     )
@@ -28,7 +30,34 @@ logger = logging.getLogger(__name__)
 
 
 class DatabaseStoreBackend(StoreBackend):
-    def __init__(self, credentials, table_name, key_columns, fixed_length_key=True):
+    """
+    A DatabaseStoreBackend keeps its values in a table with one column per element of the key and a value column.
+
+    Writes are single statements: dialect-native upserts on PostgreSQL (INSERT ... ON CONFLICT), SQLite
+    (INSERT OR REPLACE) and MySQL (INSERT ... ON DUPLICATE KEY UPDATE); on other databases an UPDATE of the keys
+    that exist followed by an INSERT of the others, in one transaction. Bulk writes are done in a single
+    transaction.
+
+    Args:
+        credentials: the connection parameters of the database, including its drivername
+        table_name: the name of the table, which is created if it does not exist
+        key_columns: the names of the key columns
+        engine_kwargs: keyword arguments passed to sqlalchemy's create_engine, typically to configure the connection
+            pool (e.g. pool_size, max_overflow, pool_recycle, pool_pre_ping)
+    """
+
+    # Bulk operations are sent in chunks that keep the number of bound parameters of a statement below the limits
+    # of the common databases (999 for older SQLite versions)
+    MAX_BULK_PARAMETERS = 900
+
+    def __init__(
+        self,
+        credentials,
+        table_name,
+        key_columns,
+        fixed_length_key=True,
+        engine_kwargs=None,
+    ):
         super().__init__(fixed_length_key=fixed_length_key)
         if not sqlalchemy:
             raise ge_exceptions.DataContextError(
@@ -42,7 +71,7 @@ class DatabaseStoreBackend(StoreBackend):
 
         drivername = credentials.pop("drivername")
         options = URL(drivername, **credentials)
-        self.engine = create_engine(options)
+        self.engine = create_engine(options, **(engine_kwargs or {}))
 
         meta = MetaData()
         self.key_columns = key_columns
@@ -74,43 +103,75 @@ class DatabaseStoreBackend(StoreBackend):
                 )
         self._table = table
 
-    def _get(self, key):
-        sel = (
-            select([column("value")])
-            .select_from(self._table)
-            .where(
-                and_(
-                    *[
-                        getattr(self._table.columns, key_col) == val
-                        for key_col, val in zip(self.key_columns, key)
-                    ]
-                )
-            )
+        # The statements of single-key operations are built once, and their compiled forms reused
+        self._compiled_cache = {}
+        key_clause = and_(
+            *[
+                getattr(self._table.columns, key_col) == bindparam(f"key_{i}")
+                for i, key_col in enumerate(self.key_columns)
+            ]
+        )
+        self._get_statement = select([self._table.columns.value]).where(key_clause)
+        self._has_key_statement = (
+            select([sqlalchemy.func.count()]).select_from(self._table).where(key_clause)
         )
+        self._update_statement = (
+            self._table.update().where(key_clause).values(value=bindparam("new_value"))
+        )
+        self._upsert_statement = self._build_upsert_statement()
+
+    def _build_upsert_statement(self):
+        dialect_name = self.engine.dialect.name
+        if dialect_name == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+
+            statement = insert(self._table)
+            return statement.on_conflict_do_update(
+                index_elements=self.key_columns,
+                set_={"value": statement.excluded.value},
+            )
+        elif dialect_name == "sqlite":
+            # The table has no columns besides the key and the value, so replacing a row is an upsert
+            return self._table.insert().prefix_with("OR REPLACE")
+        elif dialect_name == "mysql":
+            from sqlalchemy.dialects.mysql import insert
+
+            statement = insert(self._table)
+            return statement.on_duplicate_key_update(value=statement.inserted.value)
+        return None
+
+    def _execute(self, connection, statement, *multiparams):
+        return connection.execution_options(
+            compiled_cache=self._compiled_cache
+        ).execute(statement, *multiparams)
+
+    def _build_key_params(self, key):
+        return {f"key_{i}": val for i, val in enumerate(key)}
+
+    def _get(self, key):
         try:
-            return self.engine.execute(sel).fetchone()[0]
-        except (IndexError, SQLAlchemyError) as e:
+            with self.engine.connect() as connection:
+                row = self._execute(
+                    connection, self._get_statement, self._build_key_params(key)
+                ).fetchone()
+        except SQLAlchemyError as e:
             logger.debug("Error fetching value: " + str(e))
+            row = None
+        if row is None:
             raise ge_exceptions.StoreError("Unable to fetch value for key: " + str(key))
+        return row[0]
 
     def _set(self, key, value, allow_update=True):
-        cols = {k: v for (k, v) in zip(self.key_columns, key)}
-        cols["value"] = value
-
-        if allow_update:
-            if self.has_key(key):
-                ins = (
-                    self._table.update()
-                    .where(getattr(self._table.columns, self.key_columns[0]) == key[0])
-                    .values(**cols)
-                )
-            else:
-                ins = self._table.insert().values(**cols)
-        else:
-            ins = self._table.insert().values(**cols)
-
         try:
-            self.engine.execute(ins)
+            with self.engine.begin() as connection:
+                if allow_update:
+                    self._upsert(connection, {tuple(key): value})
+                else:
+                    self._execute(
+                        connection,
+                        self._table.insert(),
+                        dict(zip(self.key_columns, key), value=value),
+                    )
         except IntegrityError as e:
             if self._get(key) == value:
                 logger.info(f"Key {str(key)} already exists with the same value.")
@@ -119,6 +180,146 @@ class DatabaseStoreBackend(StoreBackend):
                     f"Integrity error {str(e)} while trying to store key"
                 )
 
+    def _get_items(self, prefix):
+        sel = (
+            select([column(col) for col in self.key_columns] + [column("value")])
+            .select_from(self._table)
+            .where(self._build_key_clause(prefix))
+        )
+        try:
+            rows = self.engine.execute(sel).fetchall()
+        except SQLAlchemyError as e:
+            logger.debug("Error fetching values: " + str(e))
+            raise ge_exceptions.StoreError(
+                "Unable to fetch values for prefix: " + str(prefix)
+            )
+        return [(tuple(row[:-1]), row[-1]) for row in rows]
+
+    def _get_many(self, keys, **kwargs):
+        values = self._fetch_values(keys)
+        missing_keys = [key for key in keys if tuple(key) not in values]
+        if missing_keys:
+            raise ge_exceptions.StoreError(
+                "Unable to fetch value for keys: " + str(missing_keys)
+            )
+        return [values[tuple(key)] for key in keys]
+
+    def _get_many_missing_ok(self, keys, **kwargs):
+        values = self._fetch_values(keys)
+        return [values.get(tuple(key)) for key in keys]
+
+    def _fetch_values(self, keys):
+        """Fetch the values of the keys that exist, by key tuple, with one query per chunk of keys."""
+        values = {}
+        for chunk in self._chunk_keys(keys):
+            sel = (
+                select([column(col) for col in self.key_columns] + [column("value")])
+                .select_from(self._table)
+                .where(self._build_keys_clause(chunk))
+            )
+            try:
+                for row in self.engine.execute(sel).fetchall():
+                    values[tuple(row[:-1])] = row[-1]
+            except SQLAlchemyError as e:
+                logger.debug("Error fetching values: " + str(e))
+                raise ge_exceptions.StoreError(
+                    "Unable to fetch values for keys: " + str(chunk)
+                )
+        return values
+
+    def _set_many(self, key_value_pairs, allow_update=True, **kwargs):
+        # Later values win, as they would with successive calls to set
+        values = {tuple(key): value for key, value in key_value_pairs}
+        if not values:
+            return
+        try:
+            with self.engine.begin() as connection:
+                if allow_update:
+                    self._upsert(connection, values)
+                else:
+                    self._insert(connection, values)
+        except IntegrityError as e:
+            raise ge_exceptions.StoreBackendError(
+                f"Integrity error {str(e)} while trying to store keys"
+            )
+
+    def _upsert(self, connection, values):
+        """Insert or update the values of a dict of keys in the transaction of connection."""
+        if self._upsert_statement is not None:
+            self._execute(
+                connection,
+                self._upsert_statement,
+                [
+                    dict(zip(self.key_columns, key), value=value)
+                    for key, value in values.items()
+                ],
+            )
+            return
+
+        existing_keys = set()
+        for chunk in self._chunk_keys(list(values)):
+            sel = (
+                select([getattr(self._table.columns, col) for col in self.key_columns])
+                .select_from(self._table)
+                .where(self._build_keys_clause(chunk))
+            )
+            existing_keys.update(
+                tuple(row) for row in connection.execute(sel).fetchall()
+            )
+        if existing_keys:
+            self._execute(
+                connection,
+                self._update_statement,
+                [
+                    dict(self._build_key_params(key), new_value=values[key])
+                    for key in existing_keys
+                ],
+            )
+        self._insert(
+            connection,
+            {key: value for key, value in values.items() if key not in existing_keys},
+        )
+
+    def _insert(self, connection, values):
+        rows = [
+            dict(zip(self.key_columns, key), value=value)
+            for key, value in values.items()
+        ]
+        if rows:
+            self._execute(connection, self._table.insert(), rows)
+
+    def _remove_many(self, keys):
+        try:
+            with self.engine.begin() as connection:
+                for chunk in self._chunk_keys(keys):
+                    connection.execute(
+                        self._table.delete().where(self._build_keys_clause(chunk))
+                    )
+        except SQLAlchemyError as e:
+            raise ge_exceptions.StoreBackendError(
+                f"Unable to delete keys: got sqlalchemy error {str(e)}"
+            )
+
+    def _chunk_keys(self, keys):
+        chunk_size = max(self.MAX_BULK_PARAMETERS // len(self.key_columns), 1)
+        for start in range(0, len(keys), chunk_size):
+            yield keys[start : start + chunk_size]
+
+    def _build_key_clause(self, key):
+        return and_(
+            *[
+                getattr(self._table.columns, key_col) == val
+                for key_col, val in zip(self.key_columns, key)
+            ]
+        )
+
+    def _build_keys_clause(self, keys):
+        if len(self.key_columns) == 1:
+            return getattr(self._table.columns, self.key_columns[0]).in_(
+                [key[0] for key in keys]
+            )
+        return or_(*[self._build_key_clause(key) for key in keys])
+
     def _move(self):
         raise NotImplementedError
 
@@ -141,48 +342,40 @@ class DatabaseStoreBackend(StoreBackend):
         return engine_name + "://" + db_name + "/" + str(key[0])
 
     def _has_key(self, key):
-        sel = (
-            select([sqlalchemy.func.count(column("value"))])
-            .select_from(self._table)
-            .where(
-                and_(
-                    *[
-                        getattr(self._table.columns, key_col) == val
-                        for key_col, val in zip(self.key_columns, key)
-                    ]
-                )
-            )
-        )
         try:
-            return self.engine.execute(sel).fetchone()[0] == 1
+            with self.engine.connect() as connection:
+                return (
+                    self._execute(
+                        connection,
+                        self._has_key_statement,
+                        self._build_key_params(key),
+                    ).fetchone()[0]
+                    == 1
+                )
         except (IndexError, SQLAlchemyError) as e:
             logger.debug("Error checking for value: " + str(e))
             return False
 
     def list_keys(self, prefix=()):
+        return self.list_keys_in_range(None, prefix=prefix)
+
+    def list_keys_in_range(self, key_column, min_value=None, max_value=None, prefix=()):
+        """List the keys that start with prefix and whose key_column is at least min_value and less than
+        max_value, filtering them in the database."""
+        conditions = [self._build_key_clause(prefix)]
+        if min_value is not None:
+            conditions.append(getattr(self._table.columns, key_column) >= min_value)
+        if max_value is not None:
+            conditions.append(getattr(self._table.columns, key_column) < max_value)
         sel = (
             select([column(col) for col in self.key_columns])
             .select_from(self._table)
-            .where(
-                and_(
-                    *[
-                        getattr(self._table.columns, key_col) == val
-                        for key_col, val in zip(self.key_columns[: len(prefix)], prefix)
-                    ]
-                )
-            )
+            .where(and_(*conditions))
         )
         return [tuple(row) for row in self.engine.execute(sel).fetchall()]
 
     def remove_key(self, key):
-        delete_statement = self._table.delete().where(
-            and_(
-                *[
-                    getattr(self._table.columns, key_col) == val
-                    for key_col, val in zip(self.key_columns, key)
-                ]
-            )
-        )
+        delete_statement = self._table.delete().where(self._build_key_clause(key))
         try:
             return self.engine.execute(delete_statement)
         except SQLAlchemyError as e:
@@ -1,7 +1,9 @@
 import inspect
+import json
 import logging
 import os
 from mimetypes import guess_type
+from urllib.parse import quote
 
 from great_expectations.data_context.types.resource_identifiers import (
     ExpectationSuiteIdentifier,
@@ -155,6 +157,23 @@ A HtmlSiteStore facilitates publishing rendered documentation built from Expecta
                 class_name=store_backend["class_name"],
             )
 
+        filepath_suffix = ".sections.js"
+        validation_sections_data_obj = instantiate_class_from_config(
+            config=store_backend,
+            runtime_environment=runtime_environment,
+            config_defaults={
+                "module_name": module_name,
+                "filepath_prefix": filepath_prefix,
+                "filepath_suffix": filepath_suffix,
+            },
+        )
+        if not validation_sections_data_obj:
+            raise ClassInstantiationError(
+                module_name=module_name,
+                package_name=None,
+                class_name=store_backend["class_name"],
+            )
+
         filepath_template = "index.html"
         index_page_obj = instantiate_class_from_config(
             config=store_backend,
@@ -187,11 +206,31 @@ A HtmlSiteStore facilitates publishing rendered documentation built from Expecta
                 class_name=store_backend["class_name"],
             )
 
+        filepath_prefix = ".ge_manifests"
+        filepath_suffix = ".json"
+        manifests_obj = instantiate_class_from_config(
+            config=store_backend,
+            runtime_environment=runtime_environment,
+            config_defaults={
+                "module_name": module_name,
+                "filepath_prefix": filepath_prefix,
+                "filepath_suffix": filepath_suffix,
+            },
+        )
+        if not manifests_obj:
+            raise ClassInstantiationError(
+                module_name=module_name,
+                package_name=None,
+                class_name=store_backend["class_name"],
+            )
+
         self.store_backends = {
             ExpectationSuiteIdentifier: expectation_suite_identifier_obj,
             ValidationResultIdentifier: validation_result_idendifier_obj,
             "index_page": index_page_obj,
             "static_assets": static_assets_obj,
+            "manifests": manifests_obj,
+            "validation_sections_data": validation_sections_data_obj,
         }
 
         # NOTE: Instead of using the filesystem as the source of record for keys,
@@ -219,6 +258,59 @@ A HtmlSiteStore facilitates publishing rendered documentation built from Expecta
             content_type="text/html; charset=utf-8",
         )
 
+    def remove_many(self, keys):
+        """Remove the pages of several resources."""
+        keys_by_type = {}
+        for key in keys:
+            self._validate_key(key)
+            self.keys.discard(key)
+            keys_by_type.setdefault(type(key.resource_identifier), []).append(
+                key.resource_identifier.to_tuple()
+            )
+        for type_, key_tuples in keys_by_type.items():
+            self.store_backends[type_].remove_many(key_tuples)
+        if ValidationResultIdentifier in keys_by_type:
+            sections_data_store_backend = self.store_backends[
+                "validation_sections_data"
+            ]
+            sections_data_store_backend.remove_many(
+                [
+                    key_tuple
+                    for key_tuple in keys_by_type[ValidationResultIdentifier]
+                    if sections_data_store_backend.has_key(key_tuple)
+                ]
+            )
+
+    def set_sections_data(self, key, sections_data):
+        """Write the sections data of a validation result page rendered by a lazy page view."""
+        self._validate_key(key)
+        return self.store_backends["validation_sections_data"].set(
+            key.resource_identifier.to_tuple(),
+            sections_data,
+            content_encoding="utf-8",
+            content_type="text/javascript; charset=utf-8",
+        )
+
+    @staticmethod
+    def get_sections_data_relative_url(resource_identifier):
+        """Return the URL of the sections data of a validation result page, relative to the page."""
+        return quote(str(resource_identifier.to_tuple()[-1])) + ".sections.js"
+
+    def get_manifest(self, site_section_name):
+        """Return the manifest a site section builder recorded the pages it rendered in, or None if there is none."""
+        store_backend = self.store_backends["manifests"]
+        if not store_backend.has_key((site_section_name,)):
+            return None
+        return json.loads(store_backend.get((site_section_name,)))
+
+    def set_manifest(self, site_section_name, manifest):
+        return self.store_backends["manifests"].set(
+            (site_section_name,),
+            json.dumps(manifest),
+            content_encoding="utf-8",
+            content_type="application/json",
+        )
+
     def get_url_for_resource(self, resource_identifier=None, only_if_exists=True):
         """
         Return the URL of the HTML document that renders a resource
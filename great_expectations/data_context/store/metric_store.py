@@ -1,13 +1,27 @@
+import datetime
+import decimal
 import json
+import logging
+import time
+
+import numpy as np
+import pandas as pd
+from dateutil.parser import isoparse
 
 from great_expectations.core import ensure_json_serializable
-from great_expectations.core.metric import ValidationMetricIdentifier
+from great_expectations.core.metric import (
+    BatchMetricIdentifier,
+    ValidationMetricIdentifier,
+)
 from great_expectations.data_context.store.database_store_backend import (
     DatabaseStoreBackend,
 )
 from great_expectations.data_context.store.store import Store
+from great_expectations.exceptions import StoreError
 from great_expectations.util import load_class, verify_dynamic_loading_support
 
+logger = logging.getLogger(__name__)
+
 
 class MetricStore(Store):
     """
@@ -86,8 +100,250 @@ class EvaluationParameterStore(MetricStore):
         super().__init__(store_backend=store_backend)
 
     def get_bind_params(self, run_id):
-        params = {}
-        for k in self._store_backend.list_keys(run_id.to_tuple()):
-            key = self.tuple_to_key(k)
-            params[key.to_evaluation_parameter_urn()] = self.get(key)
-        return params
+        """Return the values of the metrics of a run by their URN, read with a single call to the store backend."""
+        bind_params = {}
+        for key_tuple, value in self._store_backend.get_items(run_id.to_tuple()):
+            key = self.tuple_to_key(key_tuple)
+            bind_params[key.to_evaluation_parameter_urn()] = self.deserialize(
+                key, value
+            )
+        return bind_params
+
+
+class MetricCacheStore(Store):
+    """
+    A MetricCacheStore keeps the metrics computed on batches of data between runs, so that validating a batch whose
+    data has not changed reads its metrics instead of computing them again.
+
+    Entries are keyed by BatchMetricIdentifier: the fingerprint of the batch (its batch_kwargs and batch_markers),
+    the name of the metric and the id of its kwargs. The cache assumes that the data a batch fingerprint refers to
+    does not change while its entries are kept, so ttl_seconds should be set for batches read from mutable sources.
+
+    Args:
+        store_backend: the StoreBackend configuration of the cache (defaults to an InMemoryStoreBackend)
+        ttl_seconds: entries older than this are ignored and removed when read
+        max_entries: when the cache grows past this number of entries, the oldest ones are evicted
+    """
+
+    _key_class = BatchMetricIdentifier
+
+    # The fraction of max_entries evicted at once, so that the entries are not listed on every set
+    _eviction_fraction = 0.1
+
+    def __init__(
+        self,
+        store_backend=None,
+        ttl_seconds=None,
+        max_entries=None,
+        runtime_environment=None,
+    ):
+        if store_backend is not None:
+            store_backend_module_name = store_backend.get(
+                "module_name", "great_expectations.data_context.store"
+            )
+            store_backend_class_name = store_backend.get(
+                "class_name", "InMemoryStoreBackend"
+            )
+            verify_dynamic_loading_support(module_name=store_backend_module_name)
+            store_backend_class = load_class(
+                store_backend_class_name, store_backend_module_name
+            )
+
+            if issubclass(store_backend_class, DatabaseStoreBackend):
+                # Provide defaults for this common case
+                if "table_name" not in store_backend:
+                    store_backend["table_name"] = "ge_metric_cache"
+                if "key_columns" not in store_backend:
+                    store_backend["key_columns"] = [
+                        "batch_identifier",
+                        "metric_name",
+                        "metric_kwargs_id",
+                    ]
+
+        super().__init__(
+            store_backend=store_backend, runtime_environment=runtime_environment
+        )
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entry_count = None
+
+    @staticmethod
+    def _encode_value(value):
+        if value is None or isinstance(value, (bool, str)):
+            return value
+        if isinstance(value, (int, float)):
+            return value
+        if isinstance(value, np.generic) and isinstance(
+            value.item(), (bool, int, float)
+        ):
+            return value.item()
+        if isinstance(value, (list, tuple)):
+            return [MetricCacheStore._encode_value(element) for element in value]
+        if isinstance(value, pd.Series):
+            return {
+                "pandas_series": {
+                    "name": MetricCacheStore._encode_value(value.name),
+                    "index_name": MetricCacheStore._encode_value(value.index.name),
+                    "index": MetricCacheStore._encode_value(value.index.tolist()),
+                    "values": MetricCacheStore._encode_value(value.tolist()),
+                }
+            }
+        # SQL sums and means of NUMERIC columns, and extrema of date and time columns
+        if isinstance(value, decimal.Decimal):
+            return {"decimal": str(value)}
+        if value is pd.NaT:
+            return None
+        if isinstance(value, pd.Timestamp):
+            return {"pandas_timestamp": value.isoformat()}
+        if isinstance(value, datetime.datetime):
+            return {"datetime": value.isoformat()}
+        if isinstance(value, datetime.date):
+            return {"date": value.isoformat()}
+        raise TypeError("Unable to cache a metric of type {}".format(type(value)))
+
+    @staticmethod
+    def _decode_value(value):
+        if isinstance(value, list):
+            return [MetricCacheStore._decode_value(element) for element in value]
+        if not isinstance(value, dict):
+            return value
+        if "pandas_series" in value:
+            series = value["pandas_series"]
+            return pd.Series(
+                MetricCacheStore._decode_value(series["values"]),
+                index=pd.Index(
+                    MetricCacheStore._decode_value(series["index"]),
+                    name=MetricCacheStore._decode_value(series["index_name"]),
+                ),
+                name=MetricCacheStore._decode_value(series["name"]),
+            )
+        if "decimal" in value:
+            return decimal.Decimal(value["decimal"])
+        if "pandas_timestamp" in value:
+            return pd.Timestamp(value["pandas_timestamp"])
+        if "datetime" in value:
+            return isoparse(value["datetime"])
+        if "date" in value:
+            return isoparse(value["date"]).date()
+        raise ValueError("Unable to decode a cached metric: {}".format(value))
+
+    def serialize(self, key, value):
+        return json.dumps(
+            {"value": self._encode_value(value), "created_at": time.time()}
+        )
+
+    def deserialize(self, key, value):
+        if value:
+            return json.loads(value)
+
+    def get_cached_value(self, key):
+        """Look up the value of a metric.
+
+        Returns:
+            a tuple (found, value); found is False if the metric is not cached or its entry has expired
+        """
+        self._validate_key(key)
+        key_tuple = self.key_to_tuple(key)
+        try:
+            # A single lookup: checking for the key first would double the round trips to remote backends
+            serialized_entry = self._store_backend.get(key_tuple)
+        except (KeyError, StoreError):
+            return False, None
+        entry = self.deserialize(key, serialized_entry)
+        if entry is None:
+            return False, None
+        if self._is_expired(entry):
+            self._remove_key_tuple(key_tuple)
+            return False, None
+        return True, self._decode_value(entry["value"])
+
+    def get_cached_values(self, keys):
+        """Look up the values of several metrics with a single call to the store backend.
+
+        Returns:
+            the list of the (found, value) tuples of the keys, in their order, as returned by get_cached_value
+        """
+        keys = list(keys)
+        for key in keys:
+            self._validate_key(key)
+        key_tuples = [self.key_to_tuple(key) for key in keys]
+        serialized_entries = self._store_backend.get_many(key_tuples, missing_ok=True)
+        now = time.time()
+        cached_values = []
+        expired_key_tuples = []
+        for key, key_tuple, serialized_entry in zip(
+            keys, key_tuples, serialized_entries
+        ):
+            entry = (
+                self.deserialize(key, serialized_entry)
+                if serialized_entry is not None
+                else None
+            )
+            if entry is None:
+                cached_values.append((False, None))
+            elif self._is_expired(entry, now):
+                expired_key_tuples.append(key_tuple)
+                cached_values.append((False, None))
+            else:
+                cached_values.append((True, self._decode_value(entry["value"])))
+        if expired_key_tuples:
+            self._store_backend.remove_many(expired_key_tuples)
+            if self._entry_count is not None:
+                self._entry_count -= len(expired_key_tuples)
+        return cached_values
+
+    def set_cached_value(self, key, value):
+        """Cache the value of a metric, evicting the oldest entries if the cache is full.
+
+        Returns:
+            True if the value was cached, False if it is of a type the cache does not support
+        """
+        self._validate_key(key)
+        try:
+            serialized_value = self.serialize(key, value)
+        except TypeError:
+            logger.debug("Not caching metric {}".format(key.to_tuple()))
+            return False
+        key_tuple = self.key_to_tuple(key)
+        if self.max_entries is not None and self._entry_count is None:
+            self._entry_count = len(self._store_backend.list_keys())
+        if self._entry_count is not None and not self._store_backend.has_key(key_tuple):
+            self._entry_count += 1
+        self._store_backend.set(key_tuple, serialized_value)
+        if self.max_entries is not None and self._entry_count > self.max_entries:
+            self._evict()
+        return True
+
+    def _is_expired(self, entry, now=None):
+        if self.ttl_seconds is None:
+            return False
+        if now is None:
+            now = time.time()
+        return now - entry["created_at"] > self.ttl_seconds
+
+    def _remove_key_tuple(self, key_tuple):
+        self._store_backend.remove_key(key_tuple)
+        if self._entry_count is not None:
+            self._entry_count -= 1
+
+    def _evict(self):
+        """Remove the expired entries and, if the cache is still full, the oldest ones."""
+        now = time.time()
+        entries = []
+        for key_tuple in self._store_backend.list_keys():
+            entry = json.loads(self._store_backend.get(key_tuple))
+            if self._is_expired(entry, now):
+                self._store_backend.remove_key(key_tuple)
+            else:
+                entries.append((entry["created_at"], key_tuple))
+        target_size = int(self.max_entries * (1 - self._eviction_fraction))
+        entries.sort()
+        for _, key_tuple in entries[: max(len(entries) - target_size, 0)]:
+            self._store_backend.remove_key(key_tuple)
+        self._entry_count = min(len(entries), target_size)
+
+    def clear(self):
+        """Remove all the entries of the cache."""
+        for key_tuple in self._store_backend.list_keys():
+            self._store_backend.remove_key(key_tuple)
+        self._entry_count = 0
@@ -86,6 +86,41 @@ class Store:
             self.key_to_tuple(key), self.serialize(key, value)
         )
 
+    def get_many(self, keys):
+        """Get the values of several keys with a single call to the store backend.
+
+        Returns:
+            the list of the values, in the order of the keys
+        """
+        keys = list(keys)
+        for key in keys:
+            self._validate_key(key)
+        values = self._store_backend.get_many([self.key_to_tuple(key) for key in keys])
+        return [
+            self.deserialize(key, value) if value else None
+            for key, value in zip(keys, values)
+        ]
+
+    def set_many(self, key_value_pairs):
+        """Set the values of several keys, given as an iterable of (key, value) pairs, with a single call to the
+        store backend."""
+        key_value_pairs = list(key_value_pairs)
+        for key, value in key_value_pairs:
+            self._validate_key(key)
+        return self._store_backend.set_many(
+            [
+                (self.key_to_tuple(key), self.serialize(key, value))
+                for key, value in key_value_pairs
+            ]
+        )
+
+    def remove_many(self, keys):
+        """Remove several keys with a single call to the store backend."""
+        keys = list(keys)
+        for key in keys:
+            self._validate_key(key)
+        return self._store_backend.remove_many([self.key_to_tuple(key) for key in keys])
+
     def list_keys(self):
         return [self.tuple_to_key(key) for key in self._store_backend.list_keys()]
 
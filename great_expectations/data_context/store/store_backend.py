@@ -15,6 +15,9 @@ class StoreBackend(metaclass=ABCMeta):
       - _set
       - list_keys
       - _has_key
+
+    The bulk operations get_many, set_many and remove_many fall back to one operation per key; implementations
+    can override _get_many, _get_many_missing_ok, _set_many and _remove_many to do them in fewer round trips.
     """
 
     IGNORED_FILES = [".ipynb_checkpoints"]
@@ -41,6 +44,52 @@ class StoreBackend(metaclass=ABCMeta):
             logger.debug(str(e))
             raise StoreBackendError("ValueError while calling _set on store backend.")
 
+    def get_many(self, keys, missing_ok=False, **kwargs):
+        """Get the values of several keys.
+
+        Args:
+            missing_ok: if True, None is returned for the keys that are not found instead of raising an error
+
+        Returns:
+            the list of the values, in the order of the keys
+        """
+        keys = list(keys)
+        for key in keys:
+            self._validate_key(key)
+        if missing_ok:
+            return self._get_many_missing_ok(keys, **kwargs)
+        return self._get_many(keys, **kwargs)
+
+    def set_many(self, key_value_pairs, **kwargs):
+        """Set the values of several keys, given as an iterable of (key, value) pairs."""
+        key_value_pairs = list(key_value_pairs)
+        for key, value in key_value_pairs:
+            self._validate_key(key)
+            self._validate_value(value)
+        try:
+            return self._set_many(key_value_pairs, **kwargs)
+        except ValueError as e:
+            logger.debug(str(e))
+            raise StoreBackendError(
+                "ValueError while calling _set_many on store backend."
+            )
+
+    def get_items(self, prefix=()):
+        """Get the keys that start with prefix and their values.
+
+        Returns:
+            the list of the (key, value) pairs
+        """
+        self._validate_key(prefix)
+        return self._get_items(prefix)
+
+    def remove_many(self, keys):
+        """Remove several keys."""
+        keys = list(keys)
+        for key in keys:
+            self._validate_key(key)
+        return self._remove_many(keys)
+
     def move(self, source_key, dest_key, **kwargs):
         self._validate_key(source_key)
         self._validate_key(dest_key)
@@ -99,6 +148,28 @@ class StoreBackend(metaclass=ABCMeta):
     def _has_key(self, key):
         raise NotImplementedError
 
+    def _get_many(self, keys, **kwargs):
+        return [self._get(key, **kwargs) for key in keys]
+
+    def _get_many_missing_ok(self, keys, **kwargs):
+        return [self._get_or_none(key, **kwargs) for key in keys]
+
+    def _get_or_none(self, key, **kwargs):
+        try:
+            return self._get(key, **kwargs)
+        except (KeyError, StoreError):
+            return None
+
+    def _set_many(self, key_value_pairs, **kwargs):
+        return [self._set(key, value, **kwargs) for key, value in key_value_pairs]
+
+    def _remove_many(self, keys):
+        return [self.remove_key(key) for key in keys]
+
+    def _get_items(self, prefix):
+        keys = self.list_keys(prefix)
+        return list(zip(keys, self._get_many(keys)))
+
     def is_ignored_key(self, key):
         for ignored in self.IGNORED_FILES:
             if ignored in key:
@@ -134,3 +205,23 @@ class InMemoryStoreBackend(StoreBackend):
 
     def remove_key(self, key):
         del self._store[key]
+
+    def _get_many(self, keys, **kwargs):
+        return [self._store[key] for key in keys]
+
+    def _get_many_missing_ok(self, keys, **kwargs):
+        return [self._store.get(key) for key in keys]
+
+    def _set_many(self, key_value_pairs, **kwargs):
+        self._store.update(key_value_pairs)
+
+    def _get_items(self, prefix):
+        return [
+            (key, value)
+            for key, value in self._store.items()
+            if key[: len(prefix)] == prefix
+        ]
+
+    def _remove_many(self, keys):
+        for key in keys:
+            del self._store[key]
@@ -1,10 +1,13 @@
 # PYTHON 2 - py2 - update to ABC direct use rather than __metaclass__ once we drop py2 support
+import concurrent.futures
 import logging
 import os
 import random
 import re
 import shutil
+import sqlite3
 from abc import ABCMeta
+from contextlib import closing
 
 from great_expectations.data_context.store.store_backend import StoreBackend
 from great_expectations.exceptions import InvalidKeyError, StoreBackendError
@@ -129,36 +132,16 @@ class TupleStoreBackend(StoreBackend, metaclass=ABCMeta):
                 filepath = filepath[: -len(self.filepath_suffix)]
 
         if self.filepath_template:
-            # filepath_template is always specified with forward slashes, but it is then
-            # used to (1) dynamically construct and evaluate a regex, and (2) split the provided (observed) filepath
-            if self.platform_specific_separator:
-                filepath_template = os.path.join(*self.filepath_template.split("/"))
-                filepath_template = filepath_template.replace("\\", "\\\\")
-            else:
-                filepath_template = self.filepath_template
-
-            # Convert the template to a regex
-            indexed_string_substitutions = re.findall(r"{\d+}", filepath_template)
-            tuple_index_list = [
-                "(?P<tuple_index_{}>.*)".format(i,)
-                for i in range(len(indexed_string_substitutions))
-            ]
-            intermediate_filepath_regex = re.sub(
-                r"{\d+}", lambda m, r=iter(tuple_index_list): next(r), filepath_template
-            )
-            filepath_regex = intermediate_filepath_regex.format(*tuple_index_list)
+            filepath_regex, tuple_indexes = self._get_filepath_template_regex()
 
             # Apply the regex to the filepath
-            matches = re.compile(filepath_regex).match(filepath)
+            matches = filepath_regex.match(filepath)
             if matches is None:
                 return None
 
             # Map key elements into the appropriate parts of the tuple
             new_key = [None] * self.key_length
-            for i in range(len(tuple_index_list)):
-                tuple_index = int(
-                    re.search(r"\d+", indexed_string_substitutions[i]).group(0)
-                )
+            for i, tuple_index in enumerate(tuple_indexes):
                 key_element = matches.group("tuple_index_" + str(i))
                 new_key[tuple_index] = key_element
 
@@ -168,6 +151,45 @@ class TupleStoreBackend(StoreBackend, metaclass=ABCMeta):
             new_key = tuple(filepath.split(os.sep))
         return new_key
 
+    def _get_filepath_template_regex(self):
+        """Return the compiled regex matching the filepaths of the filepath_template, and the index in the key of
+        each of its groups. The regex is built once per backend, since listing keys applies it to every filepath."""
+        if getattr(self, "_filepath_template_regex", None) is not None:
+            return self._filepath_template_regex
+        # filepath_template is always specified with forward slashes, but it is then
+        # used to (1) dynamically construct and evaluate a regex, and (2) split the provided (observed) filepath
+        if self.platform_specific_separator:
+            filepath_template = os.path.join(*self.filepath_template.split("/"))
+            filepath_template = filepath_template.replace("\\", "\\\\")
+        else:
+            filepath_template = self.filepath_template
+
+        # Convert the template to a regex
+        indexed_string_substitutions = re.findall(r"{\d+}", filepath_template)
+        tuple_index_list = [
+            "(?P<tuple_index_{}>.*)".format(i,)
+            for i in range(len(indexed_string_substitutions))
+        ]
+        intermediate_filepath_regex = re.sub(
+            r"{\d+}", lambda m, r=iter(tuple_index_list): next(r), filepath_template
+        )
+        filepath_regex = intermediate_filepath_regex.format(*tuple_index_list)
+        tuple_indexes = [
+            int(re.search(r"\d+", substitution).group(0))
+            for substitution in indexed_string_substitutions
+        ]
+        self._filepath_template_regex = (re.compile(filepath_regex), tuple_indexes)
+        return self._filepath_template_regex
+
+    def _map_concurrently(self, func, items):
+        """Apply func to each of the items on a pool of max_workers threads, returning the results in order."""
+        items = list(items)
+        max_workers = getattr(self, "max_workers", None)
+        if max_workers is None or max_workers <= 1 or len(items) <= 1:
+            return [func(item) for item in items]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(func, items))
+
     def verify_that_key_to_filepath_operation_is_reversible(self):
         def get_random_hex(size=4):
             return "".join(
@@ -192,8 +214,15 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
     The key to this StoreBackend must be a tuple with fixed length based on the filepath_template,
     or a variable-length tuple may be used and returned with an optional filepath_suffix (to be) added.
     The filepath_template is a string template used to convert the key to a filepath.
+
+    If use_key_index is True, the filepaths of the store are also recorded in a SQLite index kept in the base
+    directory, so that list_keys reads the index instead of walking the directory. The index is built from the
+    directory the first time it is used, and kept up to date by the writes of the backend; files added or removed
+    by other means are only picked up by rebuild_key_index.
     """
 
+    KEY_INDEX_FILENAME = ".ge_store_backend_key_index.sqlite"
+
     def __init__(
         self,
         base_directory,
@@ -205,6 +234,7 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
         root_directory=None,
         fixed_length_key=False,
         base_public_path=None,
+        use_key_index=False,
     ):
         super().__init__(
             filepath_template=filepath_template,
@@ -233,6 +263,86 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
 
         os.makedirs(str(os.path.dirname(self.full_base_directory)), exist_ok=True)
 
+        self.use_key_index = use_key_index
+        self.key_index_path = os.path.join(
+            self.full_base_directory, self.KEY_INDEX_FILENAME
+        )
+
+    def _connect_to_key_index(self):
+        """Open the key index, building it from the store directory if it does not exist yet."""
+        if not os.path.isfile(self.key_index_path):
+            self.rebuild_key_index()
+        return closing(sqlite3.connect(self.key_index_path, timeout=60))
+
+    def _update_key_index(self, added_filepaths=(), removed_filepaths=()):
+        if not self.use_key_index:
+            return
+        with self._connect_to_key_index() as connection, connection:
+            connection.executemany(
+                "DELETE FROM store_keys WHERE filepath = ?",
+                [(filepath,) for filepath in removed_filepaths],
+            )
+            connection.executemany(
+                "INSERT OR IGNORE INTO store_keys (filepath) VALUES (?)",
+                [(filepath,) for filepath in added_filepaths],
+            )
+
+    def rebuild_key_index(self):
+        """Build the key index from the files of the store directory, replacing its current contents.
+
+        This repairs an index that is out of date because files of the store were added or removed without using
+        the backend.
+
+        Returns:
+            the number of files in the index
+        """
+        os.makedirs(self.full_base_directory, exist_ok=True)
+        filepaths = [(filepath,) for filepath in self._walk_filepaths()]
+        # Build the index next to the current one, then replace it, so that readers never see a partial index
+        building_path = self.key_index_path + ".{}.building".format(os.getpid())
+        with closing(sqlite3.connect(building_path)) as connection, connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS store_keys (filepath TEXT PRIMARY KEY)"
+            )
+            connection.execute("DELETE FROM store_keys")
+            connection.executemany(
+                "INSERT OR IGNORE INTO store_keys (filepath) VALUES (?)", filepaths
+            )
+        os.replace(building_path, self.key_index_path)
+        return len(filepaths)
+
+    def _walk_filepaths(self, prefix=()):
+        for root, dirs, files in os.walk(
+            os.path.join(self.full_base_directory, *prefix)
+        ):
+            for file_ in files:
+                if file_.startswith(self.KEY_INDEX_FILENAME):
+                    continue
+                full_path, file_name = os.path.split(os.path.join(root, file_))
+                relative_path = os.path.relpath(full_path, self.full_base_directory,)
+                if relative_path == ".":
+                    yield file_name
+                else:
+                    yield os.path.join(relative_path, file_name)
+
+    def _query_key_index(self, prefix=()):
+        if prefix:
+            filepath_start = os.path.join(*prefix) + os.sep
+        else:
+            filepath_start = self.filepath_prefix or ""
+        with self._connect_to_key_index() as connection:
+            if not filepath_start:
+                cursor = connection.execute("SELECT filepath FROM store_keys")
+            else:
+                # All the strings starting with filepath_start sort between it and the string following its last
+                # character, which lets SQLite answer the query with a range scan of the primary key
+                filepath_end = filepath_start[:-1] + chr(ord(filepath_start[-1]) + 1)
+                cursor = connection.execute(
+                    "SELECT filepath FROM store_keys WHERE filepath >= ? AND filepath < ?",
+                    (filepath_start, filepath_end),
+                )
+            return [row[0] for row in cursor]
+
     def _get(self, key):
         contents = ""
         filepath = os.path.join(
@@ -249,6 +359,20 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
         return contents
 
     def _set(self, key, value, **kwargs):
+        filepath = self._write_file(key, value)
+        self._update_key_index(added_filepaths=[self._convert_key_to_filepath(key)])
+        return filepath
+
+    def _set_many(self, key_value_pairs, **kwargs):
+        filepaths = [self._write_file(key, value) for key, value in key_value_pairs]
+        self._update_key_index(
+            added_filepaths=[
+                self._convert_key_to_filepath(key) for key, value in key_value_pairs
+            ]
+        )
+        return filepaths
+
+    def _write_file(self, key, value):
         if not isinstance(key, tuple):
             key = key.to_tuple()
         filepath = os.path.join(
@@ -277,34 +401,28 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
         if os.path.exists(source_path):
             os.makedirs(dest_dir, exist_ok=True)
             shutil.move(source_path, dest_path)
+            self._update_key_index(
+                added_filepaths=[self._convert_key_to_filepath(dest_key)],
+                removed_filepaths=[self._convert_key_to_filepath(source_key)],
+            )
             return dest_key
 
         return False
 
     def list_keys(self, prefix=()):
+        if self.use_key_index:
+            filepaths = self._query_key_index(prefix)
+        else:
+            filepaths = self._walk_filepaths(prefix)
         key_list = []
-        for root, dirs, files in os.walk(
-            os.path.join(self.full_base_directory, *prefix)
-        ):
-            for file_ in files:
-                full_path, file_name = os.path.split(os.path.join(root, file_))
-                relative_path = os.path.relpath(full_path, self.full_base_directory,)
-                if relative_path == ".":
-                    filepath = file_name
-                else:
-                    filepath = os.path.join(relative_path, file_name)
-
-                if self.filepath_prefix and not filepath.startswith(
-                    self.filepath_prefix
-                ):
-                    continue
-                elif self.filepath_suffix and not filepath.endswith(
-                    self.filepath_suffix
-                ):
-                    continue
-                key = self._convert_filepath_to_key(filepath)
-                if key and not self.is_ignored_key(key):
-                    key_list.append(key)
+        for filepath in filepaths:
+            if self.filepath_prefix and not filepath.startswith(self.filepath_prefix):
+                continue
+            elif self.filepath_suffix and not filepath.endswith(self.filepath_suffix):
+                continue
+            key = self._convert_filepath_to_key(filepath)
+            if key and not self.is_ignored_key(key):
+                key_list.append(key)
 
         return key_list
 
@@ -334,6 +452,9 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
             d_path = os.path.dirname(filepath)
             os.remove(filepath)
             self.rrmdir(self.full_base_directory, d_path)
+            self._update_key_index(
+                removed_filepaths=[self._convert_key_to_filepath(key)]
+            )
             return True
         return False
 
@@ -370,6 +491,10 @@ class TupleS3StoreBackend(TupleStoreBackend):
     The key to this StoreBackend must be a tuple with fixed length based on the filepath_template,
     or a variable-length tuple may be used and returned with an optional filepath_suffix (to be) added.
     The filepath_template is a string template used to convert the key to a filepath.
+
+    All the requests of the backend go through a single S3 client, whose connection pool holds max_workers
+    connections. list_keys pages through the listing of each top-level "directory" of the store concurrently, and
+    get_many and set_many read and write objects concurrently, on up to max_workers threads.
     """
 
     def __init__(
@@ -384,6 +509,7 @@ class TupleS3StoreBackend(TupleStoreBackend):
         fixed_length_key=False,
         base_public_path=None,
         endpoint_url=None,
+        max_workers=10,
     ):
         super().__init__(
             filepath_template=filepath_template,
@@ -405,7 +531,23 @@ class TupleS3StoreBackend(TupleStoreBackend):
             prefix = prefix.strip("/")
         self.prefix = prefix
         self.endpoint_url = endpoint_url
-        
+        self.max_workers = max_workers
+        self._s3_client = None
+
+    @property
+    def s3_client(self):
+        """The boto3 S3 client shared by all the requests of the backend (boto3 clients are thread-safe)."""
+        if self._s3_client is None:
+            import boto3
+            from botocore.config import Config
+
+            self._s3_client = boto3.client(
+                "s3",
+                endpoint_url=self.endpoint_url,
+                config=Config(max_pool_connections=max(self.max_workers, 1)),
+            )
+        return self._s3_client
+
     def _build_s3_object_key(self, key):
         if self.platform_specific_separator:
             if self.prefix:
@@ -424,9 +566,7 @@ class TupleS3StoreBackend(TupleStoreBackend):
         return s3_object_key
 
     def _get(self, key):
-        import boto3
-
-        s3 = boto3.client("s3", endpoint_url=self.endpoint_url)
+        s3 = self.s3_client
 
         s3_object_key = self._build_s3_object_key(key)
 
@@ -437,41 +577,68 @@ class TupleS3StoreBackend(TupleStoreBackend):
                 f"Unable to retrieve object from TupleS3StoreBackend with the following Key: {str(s3_object_key)}"
             )
 
-        return (
-            s3_response_object["Body"]
-            .read()
-            .decode(s3_response_object.get("ContentEncoding", "utf-8"))
-        )
+        # The content encoding may list transfer encodings after the character encoding, e.g. "utf-8,aws-chunked"
+        content_encoding = s3_response_object.get("ContentEncoding") or "utf-8"
+        return s3_response_object["Body"].read().decode(content_encoding.split(",")[0])
 
     def _set(
         self, key, value, content_encoding="utf-8", content_type="application/json"
     ):
-        import boto3
-
-        s3 = boto3.resource("s3", endpoint_url=self.endpoint_url)
+        s3 = self.s3_client
 
         s3_object_key = self._build_s3_object_key(key)
 
         try:
-            result_s3 = s3.Object(self.bucket, s3_object_key)
             if isinstance(value, str):
-                result_s3.put(
+                s3.put_object(
+                    Bucket=self.bucket,
+                    Key=s3_object_key,
                     Body=value.encode(content_encoding),
                     ContentEncoding=content_encoding,
                     ContentType=content_type,
                 )
             else:
-                result_s3.put(Body=value, ContentType=content_type)
-        except s3.meta.client.exceptions.ClientError as e:
+                s3.put_object(
+                    Bucket=self.bucket,
+                    Key=s3_object_key,
+                    Body=value,
+                    ContentType=content_type,
+                )
+        except s3.exceptions.ClientError as e:
             logger.debug(str(e))
             raise StoreBackendError("Unable to set object in s3.")
 
         return s3_object_key
 
-    def _move(self, source_key, dest_key, **kwargs):
-        import boto3
+    def _get_many(self, keys, **kwargs):
+        return self._map_concurrently(self._get, keys)
+
+    def _get_many_missing_ok(self, keys, **kwargs):
+        return self._map_concurrently(self._get_or_none, keys)
 
-        s3 = boto3.resource("s3", endpoint_url=self.endpoint_url)
+    def _set_many(self, key_value_pairs, **kwargs):
+        return self._map_concurrently(
+            lambda key_value_pair: self._set(*key_value_pair, **kwargs),
+            key_value_pairs,
+        )
+
+    def _remove_many(self, keys):
+        s3_object_keys = [self._build_s3_object_key(key) for key in keys]
+        # delete_objects accepts up to 1000 keys per request
+        for start in range(0, len(s3_object_keys), 1000):
+            self.s3_client.delete_objects(
+                Bucket=self.bucket,
+                Delete={
+                    "Objects": [
+                        {"Key": s3_object_key}
+                        for s3_object_key in s3_object_keys[start : start + 1000]
+                    ]
+                },
+            )
+        return [True for _ in s3_object_keys]
+
+    def _move(self, source_key, dest_key, **kwargs):
+        s3 = self.s3_client
 
         source_filepath = self._convert_key_to_filepath(source_key)
         if not source_filepath.startswith(self.prefix):
@@ -480,37 +647,51 @@ class TupleS3StoreBackend(TupleStoreBackend):
         if not dest_filepath.startswith(self.prefix):
             dest_filepath = os.path.join(self.prefix, dest_filepath)
 
-        s3.Bucket(self.bucket).copy(
-            {"Bucket": self.bucket, "Key": source_filepath}, dest_filepath
+        s3.copy(
+            {"Bucket": self.bucket, "Key": source_filepath}, self.bucket, dest_filepath
         )
 
-        s3.Object(self.bucket, source_filepath).delete()
+        s3.delete_object(Bucket=self.bucket, Key=source_filepath)
 
-    def list_keys(self):
-        key_list = []
+    def _list_s3_object_keys(self):
+        """List the keys of all the objects under the prefix of the store.
 
-        import boto3
+        The top-level "directories" below the prefix are listed first; each of them is then listed on its own
+        thread, following continuation tokens, so that large stores are listed completely and quickly.
+        """
+        paginator = self.s3_client.get_paginator("list_objects_v2")
+        list_prefix = self.prefix + "/" if self.prefix else ""
+
+        s3_object_keys = []
+        common_prefixes = []
+        for page in paginator.paginate(
+            Bucket=self.bucket, Prefix=list_prefix, Delimiter="/"
+        ):
+            s3_object_keys.extend(
+                s3_object_info["Key"] for s3_object_info in page.get("Contents", [])
+            )
+            common_prefixes.extend(
+                common_prefix["Prefix"]
+                for common_prefix in page.get("CommonPrefixes", [])
+            )
 
-        s3 = boto3.client("s3", endpoint_url=self.endpoint_url)
+        def list_common_prefix(common_prefix):
+            return [
+                s3_object_info["Key"]
+                for page in paginator.paginate(Bucket=self.bucket, Prefix=common_prefix)
+                for s3_object_info in page.get("Contents", [])
+            ]
 
-        if self.prefix:
-            s3_objects = s3.list_objects_v2(Bucket=self.bucket, Prefix=self.prefix)
-        else:
-            s3_objects = s3.list_objects_v2(Bucket=self.bucket)
+        for common_prefix_keys in self._map_concurrently(
+            list_common_prefix, common_prefixes
+        ):
+            s3_object_keys.extend(common_prefix_keys)
+        return s3_object_keys
 
-        if "Contents" in s3_objects:
-            objects = s3_objects["Contents"]
-        elif "CommonPrefixes" in s3_objects:
-            logger.warning(
-                "TupleS3StoreBackend returned CommonPrefixes, but delimiter should not have been set."
-            )
-            objects = []
-        else:
-            # No objects found in store
-            objects = []
+    def list_keys(self):
+        key_list = []
 
-        for s3_object_info in objects:
-            s3_object_key = s3_object_info["Key"]
+        for s3_object_key in self._list_s3_object_keys():
             if self.platform_specific_separator:
                 s3_object_key = os.path.relpath(s3_object_key, self.prefix)
             else:
@@ -535,18 +716,9 @@ class TupleS3StoreBackend(TupleStoreBackend):
         return key_list
 
     def get_url_for_key(self, key, protocol=None):
-        import boto3
-
-        location = boto3.client("s3", endpoint_url=self.endpoint_url).get_bucket_location(Bucket=self.bucket)[
-            "LocationConstraint"
-        ]
-        if location is None:
-            location = "s3"
-        else:
-            location = "s3-" + location
         s3_key = self._convert_key_to_filepath(key)
 
-        location = boto3.client("s3", endpoint_url=self.endpoint_url).get_bucket_location(Bucket=self.bucket)[
+        location = self.s3_client.get_bucket_location(Bucket=self.bucket)[
             "LocationConstraint"
         ]
         if location is None:
@@ -577,19 +749,18 @@ class TupleS3StoreBackend(TupleStoreBackend):
         return public_url
 
     def remove_key(self, key):
-        import boto3
         from botocore.exceptions import ClientError
 
         if not isinstance(key, tuple):
             key = key.to_tuple()
 
-        s3 = boto3.resource("s3", endpoint_url=self.endpoint_url)
+        s3_client = self.s3_client
         s3_object_key = self._build_s3_object_key(key)
-        s3.Object(self.bucket, s3_object_key).delete()
+        s3_client.delete_object(Bucket=self.bucket, Key=s3_object_key)
         if s3_object_key:
             try:
                 #
-                objects_to_delete = s3.meta.client.list_objects_v2(
+                objects_to_delete = s3_client.list_objects_v2(
                     Bucket=self.bucket, Prefix=self.prefix
                 )
 
@@ -600,7 +771,7 @@ class TupleS3StoreBackend(TupleStoreBackend):
                         obj["Key"] for obj in objects_to_delete.get("Contents", [])
                     ]
                 ]
-                s3.meta.client.delete_objects(Bucket=self.bucket, Delete=delete_keys)
+                s3_client.delete_objects(Bucket=self.bucket, Delete=delete_keys)
                 return True
             except ClientError as e:
                 return False
@@ -608,8 +779,17 @@ class TupleS3StoreBackend(TupleStoreBackend):
             return False
 
     def _has_key(self, key):
-        all_keys = self.list_keys()
-        return key in all_keys
+        from botocore.exceptions import ClientError
+
+        try:
+            self.s3_client.head_object(
+                Bucket=self.bucket, Key=self._build_s3_object_key(key)
+            )
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ["404", "NoSuchKey"]:
+                return False
+            raise
+        return True
 
 
 class TupleGCSStoreBackend(TupleStoreBackend):
@@ -635,6 +815,7 @@ class TupleGCSStoreBackend(TupleStoreBackend):
         fixed_length_key=False,
         public_urls=True,
         base_public_path=None,
+        max_workers=10,
     ):
         super().__init__(
             filepath_template=filepath_template,
@@ -649,6 +830,7 @@ class TupleGCSStoreBackend(TupleStoreBackend):
         self.prefix = prefix
         self.project = project
         self._public_urls = public_urls
+        self.max_workers = max_workers
 
     def _build_gcs_object_key(self, key):
         if self.platform_specific_separator:
@@ -670,13 +852,17 @@ class TupleGCSStoreBackend(TupleStoreBackend):
     def _move(self, source_key, dest_key, **kwargs):
         pass
 
-    def _get(self, key):
-        gcs_object_key = self._build_gcs_object_key(key)
-
+    def _get_bucket(self):
         from google.cloud import storage
 
         gcs = storage.Client(project=self.project)
-        bucket = gcs.get_bucket(self.bucket)
+        return gcs.get_bucket(self.bucket)
+
+    def _get(self, key, bucket=None):
+        gcs_object_key = self._build_gcs_object_key(key)
+
+        if bucket is None:
+            bucket = self._get_bucket()
         gcs_response_object = bucket.get_blob(gcs_object_key)
         if not gcs_response_object:
             raise InvalidKeyError(
@@ -685,15 +871,58 @@ class TupleGCSStoreBackend(TupleStoreBackend):
         else:
             return gcs_response_object.download_as_string().decode("utf-8")
 
+    def _get_many(self, keys, **kwargs):
+        # The bucket, and the client it belongs to, are shared by the threads
+        bucket = self._get_bucket()
+        return self._map_concurrently(lambda key: self._get(key, bucket=bucket), keys)
+
+    def _get_many_missing_ok(self, keys, **kwargs):
+        bucket = self._get_bucket()
+        return self._map_concurrently(
+            lambda key: self._get_or_none(key, bucket=bucket), keys
+        )
+
+    def _set_many(self, key_value_pairs, **kwargs):
+        bucket = self._get_bucket()
+        return self._map_concurrently(
+            lambda key_value_pair: self._set(*key_value_pair, bucket=bucket, **kwargs),
+            key_value_pairs,
+        )
+
+    def _remove_many(self, keys):
+        from google.cloud.exceptions import NotFound
+
+        bucket = self._get_bucket()
+        removed = []
+
+        def on_error(blob):
+            removed.remove(blob.name)
+
+        removed.extend(self._build_gcs_object_key(key) for key in keys)
+        gcs_object_keys = list(removed)
+        try:
+            bucket.delete_blobs(
+                blobs=[
+                    bucket.blob(gcs_object_key) for gcs_object_key in gcs_object_keys
+                ],
+                on_error=on_error,
+            )
+        except NotFound:
+            return [False for _ in gcs_object_keys]
+        return [gcs_object_key in removed for gcs_object_key in gcs_object_keys]
+
     def _set(
-        self, key, value, content_encoding="utf-8", content_type="application/json"
+        self,
+        key,
+        value,
+        content_encoding="utf-8",
+        content_type="application/json",
+        bucket=None,
     ):
         gcs_object_key = self._build_gcs_object_key(key)
 
-        from google.cloud import storage
-
-        gcs = storage.Client(project=self.project)
-        bucket = gcs.get_bucket(self.bucket)
+        if bucket is None:
+            bucket = self._get_bucket()
         blob = bucket.blob(gcs_object_key)
 
         if isinstance(value, str):
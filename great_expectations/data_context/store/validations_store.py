@@ -1,13 +1,27 @@
-from great_expectations.core import ExpectationSuiteValidationResultSchema
+import copy
+import json
+
+from great_expectations.core import (
+    ExpectationSuiteValidationResultSchema,
+    RunIdentifier,
+)
 from great_expectations.data_context.store.database_store_backend import (
     DatabaseStoreBackend,
 )
 from great_expectations.data_context.store.store import Store
+from great_expectations.data_context.store.store_backend import InMemoryStoreBackend
 from great_expectations.data_context.store.tuple_store_backend import TupleStoreBackend
 from great_expectations.data_context.types.resource_identifiers import (
     ValidationResultIdentifier,
 )
-from great_expectations.data_context.util import load_class
+from great_expectations.data_context.util import (
+    instantiate_class_from_config,
+    load_class,
+)
+from great_expectations.exceptions import (
+    ClassInstantiationError,
+    StoreConfigurationError,
+)
 from great_expectations.util import verify_dynamic_loading_support
 
 
@@ -78,11 +92,25 @@ A ValidationsStore manages Validation Results to ensure they are accessible via
         bug_risk: Moderate
 
 --ge-feature-maturity-info--
+
+If use_latest_result_index is True, the store also keeps an index of the latest result of each expectation suite, and
+of each expectation suite and batch, which it updates as results are set. get_latest_key then reads the index instead
+of listing and sorting every key of the store. The index is kept next to the results: in a ".ge_latest_results"
+directory (or prefix) for filesystem and cloud backends, and in a "<table_name>_latest_results" table for database
+backends. Results written by stores that do not use the index are only picked up once the indexed result is removed.
     """
 
     _key_class = ValidationResultIdentifier
 
-    def __init__(self, store_backend=None, runtime_environment=None):
+    # The key of the latest result of an expectation suite among all batches in the latest result index
+    ALL_BATCHES = "__all__"
+
+    def __init__(
+        self,
+        store_backend=None,
+        runtime_environment=None,
+        use_latest_result_index=False,
+    ):
         self._expectationSuiteValidationResultSchema = (
             ExpectationSuiteValidationResultSchema()
         )
@@ -119,12 +147,215 @@ A ValidationsStore manages Validation Results to ensure they are accessible via
                         "batch_identifier",
                     ],
                 )
+
+        # The configuration of the index is built before the store backend is, since building a store backend
+        # can modify its configuration
+        latest_result_index_config = None
+        if use_latest_result_index:
+            latest_result_index_config = self._get_latest_result_index_config(
+                store_backend, store_backend_class
+            )
+
         super().__init__(
             store_backend=store_backend, runtime_environment=runtime_environment
         )
 
+        self._latest_result_index = None
+        if latest_result_index_config is not None:
+            module_name = "great_expectations.data_context.store"
+            self._latest_result_index = instantiate_class_from_config(
+                config=latest_result_index_config,
+                runtime_environment=runtime_environment or {},
+                config_defaults={"module_name": module_name},
+            )
+            if not self._latest_result_index:
+                raise ClassInstantiationError(
+                    module_name=module_name,
+                    package_name=None,
+                    class_name=latest_result_index_config["class_name"],
+                )
+
+    @staticmethod
+    def _get_latest_result_index_config(store_backend, store_backend_class):
+        if store_backend is None:
+            return {"class_name": "InMemoryStoreBackend"}
+        config = copy.deepcopy(store_backend)
+        if issubclass(store_backend_class, TupleStoreBackend):
+            # The suffix differs from the one of the results, so that the index is not listed with them
+            config.pop("filepath_template", None)
+            config.pop("use_key_index", None)
+            config.update(
+                filepath_prefix=".ge_latest_results", filepath_suffix=".latest"
+            )
+            return config
+        if issubclass(store_backend_class, DatabaseStoreBackend):
+            config.update(
+                table_name=config["table_name"] + "_latest_results",
+                key_columns=["expectation_suite_name", "batch_identifier"],
+            )
+            return config
+        if issubclass(store_backend_class, InMemoryStoreBackend):
+            return config
+        raise StoreConfigurationError(
+            "ValidationsStore does not support a latest result index with a {}.".format(
+                store_backend_class.__name__
+            )
+        )
+
     def serialize(self, key, value):
         return self._expectationSuiteValidationResultSchema.dumps(value)
 
     def deserialize(self, key, value):
         return self._expectationSuiteValidationResultSchema.loads(value)
+
+    def set(self, key, value):
+        result = super().set(key, value)
+        self._update_latest_result_index([key])
+        return result
+
+    def set_many(self, key_value_pairs):
+        key_value_pairs = list(key_value_pairs)
+        result = super().set_many(key_value_pairs)
+        self._update_latest_result_index([key for key, _ in key_value_pairs])
+        return result
+
+    def remove_many(self, keys):
+        keys = list(keys)
+        result = super().remove_many(keys)
+        if self._latest_result_index is not None:
+            # Forget the index entries of removed results, so that the next lookup finds the remaining latest one
+            removed_keys = set(keys)
+            index_keys = {
+                index_key
+                for key in keys
+                for index_key in self._get_latest_result_index_keys(key)
+            }
+            removed_index_keys = [
+                index_key
+                for index_key in index_keys
+                if self._get_latest_result_index_entry(index_key) in removed_keys
+            ]
+            if removed_index_keys:
+                self._latest_result_index.remove_many(removed_index_keys)
+        return result
+
+    def get_latest_key(self, expectation_suite_name, batch_identifier=None):
+        """Return the key of the latest result of an expectation suite, of a batch or of any batch, or None if there
+        is none. Results are ordered by the run_time of their run_id, then by its run_name."""
+        if self._latest_result_index is not None:
+            index_key = (
+                expectation_suite_name,
+                batch_identifier if batch_identifier is not None else self.ALL_BATCHES,
+            )
+            key = self._get_latest_result_index_entry(index_key)
+            if key is not None and self.has_key(key):
+                return key
+
+        keys = [
+            key
+            for key in self.list_keys()
+            if key.expectation_suite_identifier.expectation_suite_name
+            == expectation_suite_name
+            and (batch_identifier is None or key.batch_identifier == batch_identifier)
+        ]
+        if len(keys) == 0:
+            return None
+        key = max(keys, key=self._get_run_order)
+        if self._latest_result_index is not None:
+            self._latest_result_index.set(index_key, self._serialize_index_entry(key))
+        return key
+
+    def list_keys_by_run_time(
+        self, start_time=None, end_time=None, expectation_suite_name=None
+    ):
+        """Return the keys of the results of runs whose run_time is at or after start_time and before end_time,
+        optionally only those of one expectation suite.
+
+        Args:
+            start_time (datetime or str): the earliest run_time, or None for no lower bound
+            end_time (datetime or str): the run_time results must precede, or None for no upper bound
+            expectation_suite_name: the name of the expectation suite of the results, or None for all of them
+        """
+        # run_times are compared in the UTC string form they are stored in, whose order is chronological
+        start_time = self._format_run_time(start_time)
+        end_time = self._format_run_time(end_time)
+        if (
+            isinstance(self._store_backend, DatabaseStoreBackend)
+            and "run_time" in self._store_backend.key_columns
+        ):
+            prefix = ()
+            if (
+                expectation_suite_name is not None
+                and self._store_backend.key_columns[0] == "expectation_suite_name"
+            ):
+                prefix = (expectation_suite_name,)
+            keys = [
+                self.tuple_to_key(key)
+                for key in self._store_backend.list_keys_in_range(
+                    "run_time", min_value=start_time, max_value=end_time, prefix=prefix
+                )
+            ]
+        else:
+            keys = self.list_keys()
+
+        return [
+            key
+            for key in keys
+            if (
+                expectation_suite_name is None
+                or key.expectation_suite_identifier.expectation_suite_name
+                == expectation_suite_name
+            )
+            and (start_time is None or key.run_id.to_tuple()[1] >= start_time)
+            and (end_time is None or key.run_id.to_tuple()[1] < end_time)
+        ]
+
+    def _update_latest_result_index(self, keys):
+        if self._latest_result_index is None:
+            return
+        latest_keys = {}
+        for key in keys:
+            for index_key in self._get_latest_result_index_keys(key):
+                if index_key not in latest_keys or self._get_run_order(
+                    key
+                ) > self._get_run_order(latest_keys[index_key]):
+                    latest_keys[index_key] = key
+
+        updated_entries = []
+        for index_key, key in latest_keys.items():
+            indexed_key = self._get_latest_result_index_entry(index_key)
+            if indexed_key is None or self._get_run_order(key) >= self._get_run_order(
+                indexed_key
+            ):
+                updated_entries.append((index_key, self._serialize_index_entry(key)))
+        if updated_entries:
+            self._latest_result_index.set_many(updated_entries)
+
+    def _get_latest_result_index_keys(self, key):
+        expectation_suite_name, _, _, batch_identifier = key.to_fixed_length_tuple()
+        return [
+            (expectation_suite_name, batch_identifier),
+            (expectation_suite_name, self.ALL_BATCHES),
+        ]
+
+    def _get_latest_result_index_entry(self, index_key):
+        if not self._latest_result_index.has_key(index_key):
+            return None
+        return ValidationResultIdentifier.from_fixed_length_tuple(
+            json.loads(self._latest_result_index.get(index_key))
+        )
+
+    @staticmethod
+    def _serialize_index_entry(key):
+        return json.dumps(key.to_fixed_length_tuple())
+
+    @staticmethod
+    def _get_run_order(key):
+        run_name, run_time = key.run_id.to_tuple()
+        return run_time, run_name
+
+    @staticmethod
+    def _format_run_time(run_time):
+        if run_time is None:
+            return None
+        return RunIdentifier(run_time=run_time).to_tuple()[1]
@@ -0,0 +1,654 @@
+import copy
+import logging
+import math
+import traceback
+from collections import Counter
+from typing import List
+
+import numpy as np
+import pandas as pd
+from dateutil.parser import parse
+
+from great_expectations.core import ExpectationValidationResult
+from great_expectations.core.evaluation_parameters import build_evaluation_parameters
+from great_expectations.data_asset.util import (
+    parse_result_format,
+    recursively_convert_to_json_serializable,
+)
+
+from .dataset import Dataset
+from .pandas_dataset import PandasDataset
+from .sketches import HyperLogLog, QuantileSketch, SpaceSavingCounter
+
+logger = logging.getLogger(__name__)
+
+
+class ChunkedPandasDataset(Dataset):
+    """A Dataset validating data that is read as a sequence of pandas DataFrames, for data larger than memory.
+
+    Each validation run reads the chunks once:
+
+    - column map, column pair map and multicolumn map expectations are evaluated on every chunk with
+      dataset_class (PandasDataset by default), and their element, missing and unexpected counts are added up, so
+      their results are the same as validating the whole data at once. Unexpected values are reported in chunk order,
+      and unexpected indices are the indices of the chunks (pandas.read_csv with a chunksize keeps numbering rows
+      across chunks). Unless the result format is COMPLETE, only the most common unexpected values of each chunk
+      are counted, in a SpaceSavingCounter of bounded size, so partial_unexpected_counts are approximate when there
+      are more than 10 times partial_unexpected_count distinct unexpected values.
+    - table and column aggregate expectations are evaluated on metrics merged across chunks: row and column counts,
+      null counts, min, max and sum are exact, and mean and standard deviation are exact up to floating point
+      rounding. Distinct values and most common values are exact but keep the counts of all the distinct values of
+      the column in memory. Unique value counts use a HyperLogLog sketch and medians and quantiles a streaming
+      quantile sketch; both are exact for small columns and approximate past that point (see HyperLogLog and
+      QuantileSketch for their error bounds).
+    - expectations that compare values across rows (uniqueness, monotonicity) or compare whole distributions are
+      not supported and return an exception result.
+
+    Args:
+        chunks: an iterable of pandas DataFrames, or a callable returning one. An iterable (such as the reader
+            returned by pandas.read_csv with a chunksize) can only be validated once; use a callable to validate
+            more than once.
+        dataset_class: the PandasDataset subclass used to evaluate expectations on each chunk.
+
+    Expectations are only evaluated as part of a validation run: build the expectation suite on a sample of the
+    data that fits in memory (for instance with ge.read_csv and nrows), then validate the whole data with it.
+    """
+
+    # Expectations evaluated on the metrics merged across chunks, with the metrics they need for their column
+    merged_metric_expectations = {
+        "expect_column_to_exist": [],
+        "expect_table_columns_to_match_ordered_list": [],
+        "expect_table_columns_to_match_set": [],
+        "expect_table_column_count_to_be_between": [],
+        "expect_table_column_count_to_equal": [],
+        "expect_table_row_count_to_be_between": [],
+        "expect_table_row_count_to_equal": [],
+        "expect_column_min_to_be_between": ["min"],
+        "expect_column_max_to_be_between": ["max"],
+        "expect_column_sum_to_be_between": ["sum"],
+        "expect_column_mean_to_be_between": ["moments"],
+        "expect_column_stdev_to_be_between": ["moments"],
+        "expect_column_unique_value_count_to_be_between": ["distinct"],
+        "expect_column_proportion_of_unique_values_to_be_between": ["distinct"],
+        "expect_column_median_to_be_between": ["quantiles"],
+        "expect_column_quantile_values_to_be_between": ["quantiles"],
+        "expect_column_distinct_values_to_be_in_set": ["value_counts"],
+        "expect_column_distinct_values_to_equal_set": ["value_counts"],
+        "expect_column_distinct_values_to_contain_set": ["value_counts"],
+        "expect_column_most_common_value_to_be_in_set": ["value_counts"],
+    }
+
+    # Expectations whose outcome depends on values in different chunks
+    unsupported_expectations = [
+        "expect_column_values_to_be_unique",
+        "expect_compound_columns_to_be_unique",
+        "expect_column_values_to_be_increasing",
+        "expect_column_values_to_be_decreasing",
+        "expect_column_kl_divergence_to_be_less_than",
+        "expect_column_chisquare_test_p_value_to_be_greater_than",
+        "expect_column_bootstrapped_ks_test_p_value_to_be_greater_than",
+        "expect_column_parameterized_distribution_ks_test_p_value_to_be_greater_than",
+        "expect_column_pair_cramers_phi_value_to_be_less_than",
+    ]
+
+    # Expectations that check the dtype of a chunk when it is not an object column; they succeed if they succeed on
+    # every chunk
+    dtype_expectations = [
+        "expect_column_values_to_be_of_type",
+        "expect_column_values_to_be_in_type_list",
+    ]
+
+    def __init__(self, chunks, *args, **kwargs):
+        self.dataset_class = kwargs.pop("dataset_class", PandasDataset)
+        # metrics change from one validation run to the next, so they cannot be cached
+        kwargs.setdefault("caching", False)
+        super().__init__(*args, **kwargs)
+        self._chunks = chunks
+        self._chunks_consumed = False
+        self._row_count = None
+        self._table_columns = None
+        self._column_metrics = {}
+
+    def _iter_chunks(self):
+        if callable(self._chunks):
+            return iter(self._chunks())
+        if self._chunks_consumed:
+            raise ValueError(
+                "The chunks of this dataset have already been read; pass a callable returning the chunks "
+                "to validate it more than once."
+            )
+        self._chunks_consumed = True
+        return iter(self._chunks)
+
+    def _evaluate_expectations(
+        self,
+        expectations,
+        evaluation_parameters,
+        catch_exceptions=True,
+        result_format=None,
+    ) -> List[ExpectationValidationResult]:
+        chunked_results = self._evaluate_chunks(
+            expectations, evaluation_parameters, catch_exceptions, result_format
+        )
+
+        results = []
+        for index, expectation in enumerate(expectations):
+            if index not in chunked_results:
+                results.extend(
+                    super()._evaluate_expectations(
+                        [expectation],
+                        evaluation_parameters,
+                        catch_exceptions=catch_exceptions,
+                        result_format=result_format,
+                    )
+                )
+                continue
+
+            result = chunked_results[index]
+            expectation = copy.deepcopy(expectation)
+            if result_format is not None:
+                expectation.kwargs.update({"result_format": result_format})
+            result.expectation_config = expectation
+            if catch_exceptions and result.exception_info is None:
+                result.exception_info = {
+                    "raised_exception": False,
+                    "exception_traceback": None,
+                    "exception_message": None,
+                }
+            results.append(result)
+
+        return results
+
+    def _evaluate_chunks(
+        self, expectations, evaluation_parameters, catch_exceptions, result_format
+    ):
+        """Read the chunks once, evaluating the expectations that run chunk by chunk and collecting the metrics
+        needed by the other ones.
+
+        Returns:
+            a dict of the ExpectationValidationResult of the expectations evaluated chunk by chunk, by their index
+            in expectations
+        """
+        chunked_results = {}
+        chunk_evaluations = {}
+        column_metrics = {}
+
+        for index, expectation in enumerate(expectations):
+            expectation_type = expectation.expectation_type
+            try:
+                if expectation_type in self.merged_metric_expectations:
+                    if expectation.kwargs.get("row_condition"):
+                        raise ValueError(
+                            "row_condition is not supported by {} in ChunkedPandasDataset".format(
+                                expectation_type
+                            )
+                        )
+                    column = expectation.kwargs.get("column")
+                    if column is not None:
+                        metrics = column_metrics.setdefault(column, set())
+                        metrics.update(
+                            self.merged_metric_expectations[expectation_type]
+                        )
+                        if expectation.kwargs.get("parse_strings_as_datetimes"):
+                            metrics.update(
+                                "parsed_" + metric
+                                for metric in self.merged_metric_expectations[
+                                    expectation_type
+                                ]
+                            )
+                    continue
+
+                if expectation_type in self.unsupported_expectations:
+                    raise ValueError(
+                        "{} compares values across chunks and is not supported by ChunkedPandasDataset".format(
+                            expectation_type
+                        )
+                    )
+
+                expectation_kwargs = copy.deepcopy(expectation.kwargs)
+                if result_format is not None:
+                    expectation_kwargs.update({"result_format": result_format})
+                evaluation_args, _ = build_evaluation_parameters(
+                    expectation_kwargs,
+                    evaluation_parameters,
+                    self._config.get("interactive_evaluation", True),
+                    self._data_context,
+                    resolved_urns=self._resolved_urns,
+                )
+                chunk_evaluations[index] = _ChunkedExpectationEvaluation(
+                    expectation_type,
+                    evaluation_args,
+                    evaluation_args.get(
+                        "result_format", self.default_expectation_args["result_format"]
+                    ),
+                )
+
+            except Exception as err:
+                if not catch_exceptions:
+                    raise err
+                chunked_results[index] = ExpectationValidationResult(
+                    success=False,
+                    exception_info={
+                        "raised_exception": True,
+                        "exception_traceback": traceback.format_exc(),
+                        "exception_message": str(err),
+                    },
+                )
+
+        self._row_count = 0
+        self._table_columns = None
+        self._column_metrics = {}
+        for chunk in self._iter_chunks():
+            if self._table_columns is None:
+                self._table_columns = list(chunk.columns)
+            self._row_count += chunk.shape[0]
+            for column, metrics in column_metrics.items():
+                if column in chunk.columns:
+                    self._column_metrics.setdefault(
+                        column, _ColumnMetrics(metrics)
+                    ).update(chunk[column])
+
+            chunk_dataset = None
+            for evaluation in chunk_evaluations.values():
+                if evaluation.done:
+                    continue
+                if chunk_dataset is None:
+                    chunk_dataset = self.dataset_class(chunk)
+                evaluation.update(chunk_dataset, catch_exceptions)
+
+        if self._table_columns is None:
+            # there were no chunks: evaluate on an empty frame, which gives the result of validating empty data
+            self._table_columns = []
+            chunk_dataset = self.dataset_class(pd.DataFrame())
+            for evaluation in chunk_evaluations.values():
+                evaluation.update(chunk_dataset, catch_exceptions)
+
+        for index, evaluation in chunk_evaluations.items():
+            result = evaluation.get_result(self)
+            result = recursively_convert_to_json_serializable(result)
+            if self._data_context is not None:
+                result = self._data_context.update_return_obj(self, result)
+            chunked_results[index] = result
+
+        return chunked_results
+
+    def _get_column_metrics(self, column, metric=None):
+        if self._row_count is None:
+            raise ValueError(
+                "ChunkedPandasDataset metrics are computed by validate; expectations relying on them can only be "
+                "evaluated as part of a validation run."
+            )
+        if column not in self._table_columns:
+            raise KeyError(column)
+        column_metrics = self._column_metrics.get(column)
+        if column_metrics is None or (
+            metric is not None and metric not in column_metrics.metrics
+        ):
+            raise ValueError(
+                "Metric {} of column {} was not computed during this validation run".format(
+                    metric or "nonnull_count", column
+                )
+            )
+        if metric in column_metrics.errors:
+            err = column_metrics.errors[metric]
+            raise ValueError(
+                "Metric {} of column {} could not be computed: {}".format(
+                    metric, column, err
+                )
+            ) from err
+        return column_metrics
+
+    def get_row_count(self):
+        if self._row_count is None:
+            raise ValueError(
+                "ChunkedPandasDataset metrics are computed by validate; expectations relying on them can only be "
+                "evaluated as part of a validation run."
+            )
+        return self._row_count
+
+    def get_column_count(self):
+        return len(self.get_table_columns())
+
+    def get_table_columns(self) -> List[str]:
+        self.get_row_count()
+        return list(self._table_columns)
+
+    def get_column_nonnull_count(self, column):
+        return self._get_column_metrics(column).nonnull_count
+
+    def get_column_sum(self, column):
+        return self._get_column_metrics(column, "sum").sum
+
+    def get_column_max(self, column, parse_strings_as_datetimes=False):
+        if parse_strings_as_datetimes:
+            return self._get_column_metrics(column, "parsed_max").parsed_max
+        return self._get_column_metrics(column, "max").max
+
+    def get_column_min(self, column, parse_strings_as_datetimes=False):
+        if parse_strings_as_datetimes:
+            return self._get_column_metrics(column, "parsed_min").parsed_min
+        return self._get_column_metrics(column, "min").min
+
+    def get_column_mean(self, column):
+        count, mean, _ = self._get_column_metrics(column, "moments").moments
+        return mean if count > 0 else np.nan
+
+    def get_column_stdev(self, column):
+        count, _, sum_of_squares = self._get_column_metrics(column, "moments").moments
+        return math.sqrt(sum_of_squares / (count - 1)) if count > 1 else np.nan
+
+    def get_column_value_counts(self, column, sort="value", collate=None):
+        if sort not in ["value", "count", "none"]:
+            raise ValueError("sort must be either 'value', 'count', or 'none'")
+        if collate is not None:
+            raise ValueError(
+                "collate parameter is not supported in ChunkedPandasDataset"
+            )
+        value_counts = self._get_column_metrics(column, "value_counts").value_counts
+        counts = pd.Series(
+            list(value_counts.values()),
+            index=pd.Index(list(value_counts.keys())),
+            dtype="int64",
+        )
+        if sort == "value":
+            try:
+                counts.sort_index(inplace=True)
+            except TypeError:
+                counts.index = counts.index.astype(str)
+                counts.sort_index(inplace=True)
+        elif sort == "count":
+            counts.sort_values(inplace=True)
+        counts.name = "count"
+        counts.index.name = "value"
+        return counts
+
+    def get_column_unique_count(self, column):
+        column_metrics = self._get_column_metrics(column)
+        if "value_counts" in column_metrics.metrics:
+            return len(column_metrics.value_counts)
+        return self._get_column_metrics(column, "distinct").distinct.count()
+
+    def get_column_modes(self, column):
+        value_counts = self._get_column_metrics(column, "value_counts").value_counts
+        if len(value_counts) == 0:
+            return []
+        max_count = max(value_counts.values())
+        modes = [value for value, count in value_counts.items() if count == max_count]
+        try:
+            return sorted(modes)
+        except TypeError:
+            return modes
+
+    def get_column_median(self, column):
+        return self._get_column_metrics(column, "quantiles").quantiles.median()
+
+    def get_column_quantiles(self, column, quantiles, allow_relative_error=False):
+        return self._get_column_metrics(column, "quantiles").quantiles.quantiles(
+            quantiles
+        )
+
+
+class _ColumnMetrics:
+    """Metrics of a column, merged chunk by chunk."""
+
+    def __init__(self, metrics):
+        self.metrics = set(metrics)
+        self.nonnull_count = 0
+        self.min = None
+        self.max = None
+        self.parsed_min = None
+        self.parsed_max = None
+        self.sum = None
+        # count, mean and sum of squared differences from the mean, merged with Chan et al.'s formula
+        self.moments = (0, 0.0, 0.0)
+        self.distinct = HyperLogLog() if "distinct" in self.metrics else None
+        self.quantiles = QuantileSketch() if "quantiles" in self.metrics else None
+        self.value_counts = Counter() if "value_counts" in self.metrics else None
+        # The exception raised by the metrics that could not be computed, by metric
+        self.errors = {}
+
+    def update(self, series):
+        nonnull_values = series[series.notnull()]
+        self.nonnull_count += len(nonnull_values)
+
+        self._update_metric(["sum"], self._update_sum, series)
+        if len(nonnull_values) == 0:
+            return
+        self._update_metric(["min"], self._update_min, nonnull_values)
+        self._update_metric(["max"], self._update_max, nonnull_values)
+        self._update_metric(
+            ["parsed_min", "parsed_max"], self._update_parsed, nonnull_values
+        )
+        self._update_metric(["moments"], self._update_moments, nonnull_values)
+        self._update_metric(["distinct"], self._update_distinct, nonnull_values)
+        self._update_metric(["quantiles"], self._update_quantiles, nonnull_values)
+        self._update_metric(["value_counts"], self._update_value_counts, nonnull_values)
+
+    def _update_metric(self, metrics, update, values):
+        """Update the metrics that are requested and have not failed; a metric that cannot be computed for a chunk
+        is failed, and the expectations that need it get an exception result instead of the whole run failing."""
+        metrics = [
+            metric
+            for metric in metrics
+            if metric in self.metrics and metric not in self.errors
+        ]
+        if not metrics:
+            return
+        try:
+            update(values)
+        except Exception as err:
+            for metric in metrics:
+                self.errors[metric] = err
+
+    def _update_sum(self, series):
+        chunk_sum = series.sum()
+        self.sum = chunk_sum if self.sum is None else self.sum + chunk_sum
+
+    def _update_min(self, nonnull_values):
+        self.min = self._merge(min, self.min, nonnull_values.min())
+
+    def _update_max(self, nonnull_values):
+        self.max = self._merge(max, self.max, nonnull_values.max())
+
+    def _update_parsed(self, nonnull_values):
+        parsed_values = nonnull_values.map(parse)
+        if "parsed_min" in self.metrics:
+            self.parsed_min = self._merge(min, self.parsed_min, parsed_values.min())
+        if "parsed_max" in self.metrics:
+            self.parsed_max = self._merge(max, self.parsed_max, parsed_values.max())
+
+    def _update_moments(self, nonnull_values):
+        values = nonnull_values.to_numpy(dtype=float)
+        count, mean, sum_of_squares = self.moments
+        chunk_count = len(values)
+        chunk_mean = values.mean()
+        chunk_sum_of_squares = ((values - chunk_mean) ** 2).sum()
+        total_count = count + chunk_count
+        delta = chunk_mean - mean
+        self.moments = (
+            total_count,
+            mean + delta * chunk_count / total_count,
+            sum_of_squares
+            + chunk_sum_of_squares
+            + delta ** 2 * count * chunk_count / total_count,
+        )
+
+    def _update_distinct(self, nonnull_values):
+        self.distinct.update(nonnull_values)
+
+    def _update_quantiles(self, nonnull_values):
+        self.quantiles.update(nonnull_values)
+
+    def _update_value_counts(self, nonnull_values):
+        self.value_counts.update(nonnull_values.value_counts().to_dict())
+
+    @staticmethod
+    def _merge(func, value, chunk_value):
+        return chunk_value if value is None else func(value, chunk_value)
+
+
+class _ChunkedExpectationEvaluation:
+    """Results of an expectation evaluated chunk by chunk, merged into the result of the whole data."""
+
+    def __init__(self, expectation_type, evaluation_args, result_format):
+        self.expectation_type = expectation_type
+        self.evaluation_args = evaluation_args
+        self.result_format = parse_result_format(result_format)
+        self.done = False
+        self.chunk_result = None
+        self.result_keys = None
+        self.element_count = 0
+        self.nonnull_count = 0
+        self.unexpected_count = 0
+        self.unexpected_list = []
+        self.unexpected_index_list = []
+        self.unexpected_values_are_hashable = True
+        if self.result_format["result_format"] == "COMPLETE":
+            # All the unexpected values are kept anyway, so they are counted exactly
+            self.chunk_result_format = "COMPLETE"
+            self.unexpected_value_counts = Counter()
+        else:
+            # Only the counts of the most common unexpected values of each chunk are requested, and merged into a
+            # counter of bounded size
+            capacity = max(
+                self.result_format["partial_unexpected_count"]
+                * self.unexpected_counts_capacity_factor,
+                1,
+            )
+            self.chunk_result_format = {
+                "result_format": "SUMMARY",
+                "partial_unexpected_count": capacity,
+            }
+            self.unexpected_value_counts = SpaceSavingCounter(capacity)
+
+    # The number of unexpected values counted across chunks, as a multiple of partial_unexpected_count
+    unexpected_counts_capacity_factor = 10
+
+    def update(self, chunk_dataset, catch_exceptions):
+        chunk_result = getattr(chunk_dataset, self.expectation_type)(
+            catch_exceptions=catch_exceptions,
+            include_config=False,
+            **dict(self.evaluation_args, result_format=self.chunk_result_format)
+        )
+
+        if chunk_result.exception_info and chunk_result.exception_info.get(
+            "raised_exception"
+        ):
+            self.chunk_result = chunk_result
+            self.done = True
+            return
+
+        if "unexpected_count" not in (chunk_result.result or {}):
+            if self.expectation_type not in ChunkedPandasDataset.dtype_expectations:
+                self.chunk_result = ExpectationValidationResult(
+                    success=False,
+                    exception_info={
+                        "raised_exception": True,
+                        "exception_traceback": None,
+                        "exception_message": "{} is not a map expectation and is not supported by "
+                        "ChunkedPandasDataset".format(self.expectation_type),
+                    },
+                )
+                self.done = True
+            elif self.chunk_result is None or (
+                self.chunk_result.success and not chunk_result.success
+            ):
+                # Keep the result of the first chunk, or of the first failing one, in the requested format
+                self.chunk_result = getattr(chunk_dataset, self.expectation_type)(
+                    catch_exceptions=catch_exceptions,
+                    include_config=False,
+                    **dict(self.evaluation_args, result_format=self.result_format)
+                )
+            return
+
+        result = chunk_result.result
+        self.result_keys = set(result.keys())
+        if "missing_count" not in result:
+            # null expectations do not ignore missing values, and do not report partial unexpected values
+            self.result_format["partial_unexpected_count"] = 0
+
+        element_count = result["element_count"]
+        self.element_count += element_count
+        self.nonnull_count += element_count - result.get("missing_count", 0)
+        self.unexpected_count += result["unexpected_count"]
+
+        if self.result_format["result_format"] == "COMPLETE":
+            self.unexpected_list.extend(result["unexpected_list"])
+            self.unexpected_index_list.extend(result["unexpected_index_list"])
+        else:
+            remaining = self.result_format["partial_unexpected_count"] - len(
+                self.unexpected_list
+            )
+            if remaining > 0:
+                self.unexpected_list.extend(
+                    result.get("partial_unexpected_list", [])[:remaining]
+                )
+                self.unexpected_index_list.extend(
+                    (result.get("partial_unexpected_index_list") or [])[:remaining]
+                )
+
+        if (
+            self.result_format["result_format"] in ["SUMMARY", "COMPLETE"]
+            and self.result_format["partial_unexpected_count"] > 0
+            and self.unexpected_values_are_hashable
+        ):
+            if self.result_format["result_format"] == "COMPLETE":
+                try:
+                    self.unexpected_value_counts.update(result["unexpected_list"])
+                except TypeError:
+                    self.unexpected_values_are_hashable = False
+            elif "partial_unexpected_counts_error" in result.get("details", {}):
+                self.unexpected_values_are_hashable = False
+            else:
+                self.unexpected_value_counts.update(
+                    (counts["value"], counts["count"])
+                    for counts in result.get("partial_unexpected_counts", [])
+                )
+
+    def get_result(self, dataset):
+        if self.result_keys is None or (
+            self.chunk_result is not None and not self.chunk_result.success
+        ):
+            # No chunk returned a map result, or a chunk raised an exception or did not have the expected dtype
+            return self.chunk_result
+
+        success, _ = dataset._calc_map_expectation_success(
+            self.nonnull_count - self.unexpected_count,
+            self.nonnull_count,
+            self.evaluation_args.get("mostly"),
+        )
+        return_obj = dataset._format_map_output(
+            self.result_format,
+            success,
+            self.element_count,
+            self.nonnull_count,
+            self.unexpected_count,
+            self.unexpected_list,
+            self.unexpected_index_list,
+        )
+
+        result = return_obj.get("result")
+        if result is not None:
+            if (
+                "partial_unexpected_counts" in result
+                and self.unexpected_values_are_hashable
+            ):
+                # the partial unexpected values only hold the first ones; count them over all the chunks, approximately
+                # past unexpected_counts_capacity_factor * partial_unexpected_count distinct values
+                try:
+                    result["partial_unexpected_counts"] = [
+                        {"value": key, "count": value}
+                        for key, value in sorted(
+                            self.unexpected_value_counts.most_common(
+                                self.result_format["partial_unexpected_count"]
+                            ),
+                            key=lambda x: (-x[1], x[0]),
+                        )
+                    ]
+                except TypeError:
+                    pass
+            for key in list(result.keys()):
+                if key not in self.result_keys and key != "details":
+                    del result[key]
+
+        return ExpectationValidationResult(**return_obj)
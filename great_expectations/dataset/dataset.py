@@ -1,4 +1,5 @@
 import inspect
+import logging
 from datetime import datetime
 from functools import lru_cache, wraps
 from itertools import zip_longest
@@ -10,6 +11,8 @@ import pandas as pd
 from dateutil.parser import parse
 from scipy import stats
 
+from great_expectations.core.id_dict import IDDict, MetricKwargs
+from great_expectations.core.metric import BatchMetricIdentifier
 from great_expectations.data_asset.data_asset import DataAsset
 from great_expectations.data_asset.util import DocInherit, parse_result_format
 from great_expectations.dataset.util import (
@@ -19,6 +22,8 @@ from great_expectations.dataset.util import (
     is_valid_partition_object,
 )
 
+logger = logging.getLogger(__name__)
+
 
 class MetaDataset(DataAsset):
     """
@@ -208,26 +213,202 @@ class Dataset(MetaDataset):
         "get_column_count",
         "get_table_columns",
         "get_column_count_in_range",
+        "get_column_partition_counts",
+    ]
+
+    # getters that backends estimate with sketches when approximate metrics are enabled
+    approximable_getters = [
+        "get_column_unique_count",
+        "get_column_median",
+        "get_column_quantiles",
     ]
+    # The relative error allowed for the approximable getters, or None for exact metrics; set by the backends
+    # that support the approximate_metrics option
+    approximate_relative_error = None
 
     def __init__(self, *args, **kwargs):
         # NOTE: using caching makes the strong assumption that the user will not modify the core data store
         # (e.g. self.spark_df) over the lifetime of the dataset instance
         self.caching = kwargs.pop("caching", True)
+        # A MetricCacheStore keeping the metrics between runs; by default the one of the data context, if any
+        metric_cache = kwargs.pop("metric_cache", None)
 
         super().__init__(*args, **kwargs)
 
+        # The approximations used for metrics, by (getter name, column); see _get_metric_approximation
+        self._metric_approximations = {}
+        # Metric values read from the metric cache ahead of their getters, by metric cache key
+        self._prefetched_metrics = {}
+
+        if metric_cache is None:
+            metric_cache = getattr(self._data_context, "metric_cache_store", None)
+        self._metric_cache = None
+        self._batch_fingerprint = None
+        if self.caching and metric_cache is not None:
+            self._batch_fingerprint = self._get_batch_fingerprint()
+            if self._batch_fingerprint is not None:
+                self._metric_cache = metric_cache
+
         if self.caching:
             for func in self.hashable_getters:
-                caching_func = lru_cache(maxsize=None)(getattr(self, func))
+                getter = getattr(self, func)
+                if self._metric_cache is not None:
+                    getter = self._get_metric_cache_getter(func, getter)
+                caching_func = lru_cache(maxsize=None)(getter)
                 setattr(self, func, caching_func)
 
+    def _get_batch_fingerprint(self):
+        """Identify the data of this dataset by its batch_kwargs and batch_markers, for the metric cache.
+
+        The load time of the batch is left out, so that loading the same data again gives the same fingerprint.
+        Returns None when the batch has no stable identity, for example a dataset built from an in-memory
+        dataframe without a data fingerprint, whose batch id is random.
+        """
+        batch_kwargs = dict(self.batch_kwargs)
+        batch_markers = {
+            key: value
+            for key, value in (self.batch_markers or {}).items()
+            if key != "ge_load_time"
+        }
+        if "pandas_data_fingerprint" in batch_markers:
+            batch_kwargs.pop("ge_batch_id", None)
+            batch_kwargs.pop("dataset", None)
+        elif "ge_batch_id" in batch_kwargs:
+            return None
+        try:
+            return IDDict(
+                {"batch_kwargs": batch_kwargs, "batch_markers": batch_markers}
+            ).to_id()
+        except TypeError:
+            return None
+
+    def _get_metric_cache_key(self, getter_name, args, kwargs):
+        if (
+            self.approximate_relative_error is not None
+            and getter_name in self.approximable_getters
+        ):
+            # Approximate metrics are not cached: their error bound is recorded when they are computed
+            return None
+        try:
+            # Bind the arguments to the parameters of the getter, with their defaults, so that the same metric has
+            # the same key however its getter is called
+            bound_arguments = inspect.signature(getattr(type(self), getter_name)).bind(
+                self, *args, **kwargs
+            )
+            bound_arguments.apply_defaults()
+            arguments = dict(bound_arguments.arguments)
+            arguments.pop("self", None)
+        except (AttributeError, TypeError, ValueError):
+            arguments = {"args": list(args), "kwargs": kwargs}
+        try:
+            metric_kwargs_id = MetricKwargs(arguments).to_id()
+        except TypeError:
+            return None
+        return BatchMetricIdentifier(
+            self._batch_fingerprint, getter_name, metric_kwargs_id
+        )
+
+    def _get_metric_cache_getter(self, getter_name, getter):
+        """Wrap a getter so that it reads and writes its metrics in the metric cache.
+
+        Errors of the cache are logged and otherwise ignored: the metric is then computed as if it were not cached.
+        """
+
+        @wraps(getter)
+        def metric_cache_getter(*args, **kwargs):
+            key = self._get_metric_cache_key(getter_name, args, kwargs)
+            if key is None:
+                return getter(*args, **kwargs)
+            if key in self._prefetched_metrics:
+                return self._prefetched_metrics[key]
+            try:
+                found, value = self._metric_cache.get_cached_value(key)
+                if found:
+                    return value
+            except Exception as e:
+                logger.warning("Unable to read the metric cache: {}".format(e))
+            value = getter(*args, **kwargs)
+            try:
+                self._metric_cache.set_cached_value(key, value)
+            except Exception as e:
+                logger.warning("Unable to write to the metric cache: {}".format(e))
+            return value
+
+        return metric_cache_getter
+
+    def _get_metric_approximation(self, getter_name, column):
+        """Return how the metric of a getter was approximated for a column, or None if it was computed exactly.
+
+        The approximation is a dict with the "method" used (a sketch or a native function of the backend) and its
+        "relative_error": the relative standard error of unique value counts, or the bound on the rank error of
+        medians and quantiles as a fraction of the number of values. The relative_error is None when it is set by
+        the backend and not known here.
+        """
+        return self._metric_approximations.get((getter_name, column))
+
+    def _add_metric_approximation_details(self, result, getter_name, column):
+        """Record the approximation of a metric, if any, in the details of an expectation result."""
+        approximation = self._get_metric_approximation(getter_name, column)
+        if approximation is not None:
+            result.setdefault("details", {})["approximation"] = approximation
+        return result
+
+    def _prefetch_cached_metrics(self, metrics):
+        """Read the values of several metrics from the metric cache with a single lookup.
+
+        The values found are returned by the getters without reading the cache again, until
+        _clear_prefetched_metrics is called.
+
+        Args:
+            metrics: a list of (getter name, args) pairs
+
+        Returns:
+            the set of the (getter name, args) pairs found in the cache
+        """
+        # A profiler passed to the constructor validates the dataset before the metric cache is set up
+        if getattr(self, "_metric_cache", None) is None:
+            return set()
+        keys = {}
+        for getter_name, args in metrics:
+            key = self._get_metric_cache_key(getter_name, args, {})
+            if key is not None:
+                keys[(getter_name, tuple(args))] = key
+        if not keys:
+            return set()
+        try:
+            cached_values = self._metric_cache.get_cached_values(keys.values())
+        except Exception as e:
+            logger.warning("Unable to read the metric cache: {}".format(e))
+            return set()
+        found_metrics = set()
+        for metric, key, (found, value) in zip(
+            keys.keys(), keys.values(), cached_values
+        ):
+            if found:
+                self._prefetched_metrics[key] = value
+                found_metrics.add(metric)
+        return found_metrics
+
+    def _clear_prefetched_metrics(self):
+        self._prefetched_metrics = {}
+
     @classmethod
     def from_dataset(cls, dataset=None):
         """This base implementation naively passes arguments on to the real constructor, which
         is suitable really when a constructor knows to take its own type. In general, this should be overridden"""
         return cls(dataset)
 
+    def _prepare_profiling(self, columns):
+        """Called by profilers before they compute the metrics of the given columns.
+
+        Subclasses can override this to compute the metrics profilers rely on for all the columns at once.
+        """
+        pass
+
+    def _finish_profiling(self):
+        """Called by profilers once they are done computing column metrics."""
+        pass
+
     def get_row_count(self):
         """Returns: int, table row count"""
         raise NotImplementedError
@@ -325,14 +506,7 @@ class Dataset(MetaDataset):
             A list of bins
         """
         if bins == "uniform":
-            # TODO: in the event that we shift the compute model for
-            #  min and max to have a single pass, use that instead of
-            #  quantiles for clarity
-            # min_ = self.get_column_min(column)
-            # max_ = self.get_column_max(column)
-            min_, max_ = self.get_column_quantiles(
-                column, (0.0, 1.0), allow_relative_error=allow_relative_error
-            )
+            _, min_, max_ = self._get_column_nonnull_count_and_extrema(column)
             # PRECISION NOTE: some implementations of quantiles could produce
             # varying levels of precision (e.g. a NUMERIC column producing
             # Decimal from a SQLAlchemy source, so we cast to float for numpy)
@@ -365,6 +539,73 @@ class Dataset(MetaDataset):
             raise ValueError("Invalid parameter for bins argument")
         return bins
 
+    def get_column_histogram(
+        self, column, bins="uniform", n_bins=10, allow_relative_error=False
+    ):
+        """Get a partition of the range of values in the specified column along with the histogram of the values.
+
+        The number of values, extrema, bin edges and counts are computed together: uniform bins take one pass over
+        the data for the number of values and the extrema and one for the histogram; bins spaced according to
+        quantiles take the passes computing the quantiles and one for the histogram and the number of values.
+
+        Args:
+            column: the name of the column
+            bins: 'uniform' for evenly spaced bins, 'quantile' for bins spaced according to quantiles or 'auto' for
+                automatically spaced bins
+            n_bins: the number of bins to produce; ignored if bins is 'auto'
+            allow_relative_error: passed to get_column_quantiles, see get_column_partition
+
+        Returns:
+            A dictionary::
+
+            {
+                "nonnull_count": (int) The number of non-null values,
+                "min": The smallest value (the lowest quantile for bins spaced according to quantiles),
+                "max": The largest value (the highest quantile for bins spaced according to quantiles),
+                "bins": (list) The edges of the bins,
+                "hist": (list) The number of values in each bin
+            }
+        """
+        if bins == "uniform":
+            nonnull_count, min_, max_ = self._get_column_nonnull_count_and_extrema(
+                column
+            )
+            bins = np.linspace(
+                start=float(min_), stop=float(max_), num=n_bins + 1
+            ).tolist()
+            hist = self.get_column_hist(column, tuple(bins))
+        else:
+            bins = self.get_column_partition(column, bins, n_bins, allow_relative_error)
+            if isinstance(bins, np.ndarray):
+                bins = bins.tolist()
+            else:
+                bins = list(bins)
+            min_, max_ = bins[0], bins[-1]
+            hist, nonnull_count = self._get_column_hist_and_nonnull_count(
+                column, tuple(bins)
+            )
+        return {
+            "nonnull_count": nonnull_count,
+            "min": min_,
+            "max": max_,
+            "bins": bins,
+            "hist": list(hist),
+        }
+
+    def _get_column_nonnull_count_and_extrema(self, column):
+        """Returns: (int, Any, Any), the number of non-null values, minimum and maximum of the column; backends
+        compute them with a single pass over the data"""
+        return (
+            self.get_column_nonnull_count(column),
+            self.get_column_min(column),
+            self.get_column_max(column),
+        )
+
+    def _get_column_hist_and_nonnull_count(self, column, bins):
+        """Returns: (List[int], int), the histogram of the column over bins and the number of non-null values;
+        backends compute them with a single pass over the data"""
+        return self.get_column_hist(column, bins), self.get_column_nonnull_count(column)
+
     def get_column_hist(self, column, bins):
         """Get a histogram of column values
         Args:
@@ -380,6 +621,24 @@ class Dataset(MetaDataset):
         """Returns: int"""
         raise NotImplementedError
 
+    def get_column_partition_counts(self, column, bins):
+        """Get the number of column values below, within each bin of, and above a partition
+        Args:
+            column: the column for which to count values
+            bins (tuple): the edges of the partition. bins *must* be a tuple to ensure caching is possible
+
+        Returns: List[int], the count of values below bins[0], the histogram of the values in bins, and the count of
+            values above bins[-1]"""
+        below_partition = self.get_column_count_in_range(column, max_val=bins[0])
+        above_partition = self.get_column_count_in_range(
+            column, min_val=bins[-1], strict_min=True
+        )
+        return (
+            [below_partition]
+            + list(self.get_column_hist(column, bins))
+            + [above_partition]
+        )
+
     def get_crosstab(
         self,
         column_A,
@@ -2743,6 +3002,7 @@ class Dataset(MetaDataset):
             * min_value and max_value are both inclusive unless strict_min or strict_max are set to True.
             * If min_value is None, then max_value is treated as an upper bound
             * If max_value is None, then min_value is treated as a lower bound
+            * If the median was approximated, details.approximation gives the method and its error
 
         See Also:
             :func:`expect_column_mean_to_be_between \
@@ -2781,7 +3041,12 @@ class Dataset(MetaDataset):
 
         success = above_min and below_max
 
-        return {"success": success, "result": {"observed_value": column_median}}
+        return {
+            "success": success,
+            "result": self._add_metric_approximation_details(
+                {"observed_value": column_median}, "get_column_median", column
+            ),
+        }
 
     # noinspection PyUnusedLocal
     @DocInherit
@@ -2880,6 +3145,7 @@ class Dataset(MetaDataset):
             These fields in the result object are customized for this expectation:
             ::
             details.success_details
+            details.approximation, if the quantiles were approximated
 
         See Also:
             :func:`expect_column_min_to_be_between \
@@ -2917,10 +3183,14 @@ class Dataset(MetaDataset):
 
         return {
             "success": np.all(success_details),
-            "result": {
-                "observed_value": {"quantiles": quantiles, "values": quantile_vals},
-                "details": {"success_details": success_details},
-            },
+            "result": self._add_metric_approximation_details(
+                {
+                    "observed_value": {"quantiles": quantiles, "values": quantile_vals},
+                    "details": {"success_details": success_details},
+                },
+                "get_column_quantiles",
+                column,
+            ),
         }
 
     # noinspection PyUnusedLocal
@@ -3081,6 +3351,7 @@ class Dataset(MetaDataset):
             * min_value and max_value are both inclusive.
             * If min_value is None, then max_value is treated as an upper bound
             * If max_value is None, then min_value is treated as a lower bound
+            * If the unique value count was approximated, details.approximation gives the method and its error
 
         See Also:
             :func:`expect_column_proportion_of_unique_values_to_be_between \
@@ -3104,7 +3375,14 @@ class Dataset(MetaDataset):
 
         success = above_min and below_max
 
-        return {"success": success, "result": {"observed_value": unique_value_count}}
+        return {
+            "success": success,
+            "result": self._add_metric_approximation_details(
+                {"observed_value": unique_value_count},
+                "get_column_unique_count",
+                column,
+            ),
+        }
 
     # noinspection PyUnusedLocal
     @DocInherit
@@ -3173,6 +3451,7 @@ class Dataset(MetaDataset):
             * min_value and max_value are both inclusive unless strict_min or strict_max are set to True.
             * If min_value is None, then max_value is treated as an upper bound
             * If max_value is None, then min_value is treated as a lower bound
+            * If the unique value count was approximated, details.approximation gives the method and its error
 
         See Also:
             :func:`expect_column_unique_value_count_to_be_between \
@@ -3217,7 +3496,14 @@ class Dataset(MetaDataset):
 
         success = above_min and below_max
 
-        return {"success": success, "result": {"observed_value": proportion_unique}}
+        return {
+            "success": success,
+            "result": self._add_metric_approximation_details(
+                {"observed_value": proportion_unique},
+                "get_column_unique_count",
+                column,
+            ),
+        }
 
     # noinspection PyUnusedLocal
     @DocInherit
@@ -4119,21 +4405,14 @@ class Dataset(MetaDataset):
                     "KL Divergence cannot be computed with a continuous partition object and the bucketize_data "
                     "parameter set to false."
                 )
-            # Build the histogram first using expected bins so that the largest bin is >=
-            hist = np.array(
-                self.get_column_hist(column, tuple(partition_object["bins"]))
-            )
-            # np.histogram(column, partition_object['bins'], density=False)
-            bin_edges = partition_object["bins"]
-            # Add in the frequencies observed above or below the provided partition
-            # below_partition = len(np.where(column < partition_object['bins'][0])[0])
-            # above_partition = len(np.where(column > partition_object['bins'][-1])[0])
-            below_partition = self.get_column_count_in_range(
-                column, max_val=partition_object["bins"][0]
-            )
-            above_partition = self.get_column_count_in_range(
-                column, min_val=partition_object["bins"][-1], strict_min=True
+            # Build the histogram first using expected bins so that the largest bin is >=, along with the
+            # frequencies observed above or below the provided partition
+            partition_counts = self.get_column_partition_counts(
+                column, tuple(partition_object["bins"])
             )
+            hist = np.array(partition_counts[1:-1])
+            below_partition = partition_counts[0]
+            above_partition = partition_counts[-1]
 
             # Observed Weights is just the histogram values divided by the total number of observations
             observed_weights = np.array(hist) / self.get_column_nonnull_count(column)
@@ -1,3 +1,4 @@
+import decimal
 import inspect
 import json
 import logging
@@ -17,6 +18,8 @@ from great_expectations.data_asset import DataAsset
 from great_expectations.data_asset.util import DocInherit, parse_result_format
 from great_expectations.dataset.util import (
     _scipy_distribution_positional_args_from_dict,
+    get_bootstrapped_ks_test_pass_count,
+    get_partition_counts,
     is_valid_continuous_partition_object,
     validate_distribution_parameters,
 )
@@ -135,6 +138,7 @@ class MetaPandasDataset(Dataset):
                 len(unexpected_list),
                 unexpected_list,
                 unexpected_index_list,
+                mostly=mostly,
             )
 
             # FIXME Temp fix for result format
@@ -255,6 +259,7 @@ class MetaPandasDataset(Dataset):
                 len(unexpected_list),
                 unexpected_list,
                 unexpected_index_list,
+                mostly=mostly,
             )
 
             return return_obj
@@ -327,6 +332,7 @@ class MetaPandasDataset(Dataset):
                 len(unexpected_list),
                 unexpected_list.to_dict(orient="records"),
                 unexpected_index_list,
+                mostly=mostly,
             )
 
             return return_obj
@@ -386,6 +392,9 @@ Notes:
         "caching",
         "default_expectation_args",
         "discard_subset_failing_expectations",
+        "_metric_approximations",
+        "_prefetched_metrics",
+        "_profiling_metrics",
     ]
     _internal_names_set = set(_internal_names)
     _supports_row_condition = True
@@ -417,6 +426,36 @@ Notes:
         self.discard_subset_failing_expectations = kwargs.get(
             "discard_subset_failing_expectations", False
         )
+        self._profiling_metrics = {}
+
+    def _get_validation_sample(self, sample_fraction, sample_seed):
+        # The sample keeps the index of its rows, so unexpected indices refer to rows of the whole batch
+        sample = self.__class__(
+            pd.DataFrame(self).sample(frac=sample_fraction, random_state=sample_seed),
+            batch_kwargs=self.batch_kwargs,
+            batch_markers=self.batch_markers,
+            batch_parameters=self.batch_parameters,
+        )
+        return sample, {"method": "DataFrame.sample", "seed": sample_seed}
+
+    def _prepare_profiling(self, columns):
+        super()._prepare_profiling(columns)
+        # Count the nonnull and distinct values of every column with a single pass over it
+        self._profiling_metrics = {}
+        for column in columns:
+            try:
+                counts = self[column].value_counts(sort=False)
+            except TypeError:
+                # Unhashable values (e.g., lists) cannot be counted; the getters will raise as before
+                continue
+            self._profiling_metrics[("get_column_nonnull_count", column)] = int(
+                counts.sum()
+            )
+            self._profiling_metrics[("get_column_unique_count", column)] = len(counts)
+
+    def _finish_profiling(self):
+        super()._finish_profiling()
+        self._profiling_metrics = {}
 
     def _apply_row_condition(self, row_condition, condition_parser):
         if condition_parser not in ["python", "pandas"]:
@@ -457,6 +496,8 @@ Notes:
         return self[column].mean()
 
     def get_column_nonnull_count(self, column):
+        if ("get_column_nonnull_count", column) in self._profiling_metrics:
+            return self._profiling_metrics[("get_column_nonnull_count", column)]
         series = self[column]
         null_indexes = series.isnull()
         nonnull_values = series[null_indexes == False]
@@ -484,6 +525,8 @@ Notes:
         return counts
 
     def get_column_unique_count(self, column):
+        if ("get_column_unique_count", column) in self._profiling_metrics:
+            return self._profiling_metrics[("get_column_unique_count", column)]
         return self.get_column_value_counts(column).shape[0]
 
     def get_column_modes(self, column):
@@ -506,6 +549,17 @@ Notes:
         hist, bin_edges = np.histogram(self[column], bins, density=False)
         return list(hist)
 
+    def get_column_partition_counts(self, column, bins):
+        return get_partition_counts(self[column], bins).tolist()
+
+    def _get_column_nonnull_count_and_extrema(self, column):
+        values = self[column].dropna()
+        return len(values), values.min(), values.max()
+
+    def _get_column_hist_and_nonnull_count(self, column, bins):
+        partition_counts = get_partition_counts(self[column], bins)
+        return partition_counts[1:-1].tolist(), int(partition_counts.sum())
+
     def get_column_count_in_range(
         self, column, min_val=None, max_val=None, strict_min=False, strict_max=True
     ):
@@ -843,6 +897,56 @@ Notes:
         elif type_.lower() == "unicode":
             return None
 
+    # The base class of the values of object columns of which pandas.api.types.infer_dtype infers these types
+    _inferred_value_base_types = {
+        "string": str,
+        "bytes": bytes,
+        "decimal": decimal.Decimal,
+    }
+
+    @classmethod
+    def _values_are_instances(cls, column, comp_types):
+        """Equivalent of column.map(lambda x: isinstance(x, comp_types)).
+
+        Columns of a numpy dtype, and object columns whose values share a base class, are checked once for the
+        whole column; other columns are checked once per distinct type of the values instead of once per value.
+        """
+        if len(column) == 0:
+            return pd.Series([], index=column.index, dtype=bool)
+
+        if column.dtype.kind in "biufcmM":
+            # All the values of a numpy dtype are boxed into the same type
+            value_type = column.iloc[:1].map(type).iloc[0]
+            return pd.Series(
+                issubclass(value_type, comp_types), index=column.index, dtype=bool
+            )
+
+        if column.dtype == object:
+            base_type = cls._inferred_value_base_types.get(
+                pd.api.types.infer_dtype(column, skipna=True)
+            )
+            if base_type is not None:
+                if issubclass(base_type, comp_types):
+                    return pd.Series(True, index=column.index, dtype=bool)
+                if not any(
+                    issubclass(comp_type, base_type) for comp_type in comp_types
+                ):
+                    return pd.Series(False, index=column.index, dtype=bool)
+                # the values may be instances of a subclass of their base class that is one of the types
+
+        value_types = column.map(type)
+        return value_types.map(
+            {
+                value_type: issubclass(value_type, comp_types)
+                for value_type in value_types.unique()
+            }
+        ).astype(bool)
+
+    @staticmethod
+    def _parse_datetime_values(column):
+        """Equivalent of column.map(parse) that parses each distinct value only once."""
+        return column.map({value: parse(value) for value in column.unique()})
+
     @MetaPandasDataset.column_map_expectation
     def _expect_column_values_to_be_of_type__map(
         self,
@@ -882,7 +986,7 @@ Notes:
         if len(comp_types) < 1:
             raise ValueError("Unrecognized numpy/python type: %s" % type_)
 
-        return column.map(lambda x: isinstance(x, tuple(comp_types)))
+        return self._values_are_instances(column, tuple(comp_types))
 
     @DocInherit
     def expect_column_values_to_be_in_type_list(
@@ -1086,7 +1190,7 @@ Notes:
         if len(comp_types) < 1:
             raise ValueError("No recognized numpy/python type in list: %s" % type_list)
 
-        return column.map(lambda x: isinstance(x, tuple(comp_types)))
+        return self._values_are_instances(column, tuple(comp_types))
 
     @DocInherit
     @MetaPandasDataset.column_map_expectation
@@ -1174,7 +1278,7 @@ Notes:
                 max_value = parse(max_value)
 
             try:
-                temp_column = column.map(parse)
+                temp_column = self._parse_datetime_values(column)
             except TypeError:
                 temp_column = column
 
@@ -1184,6 +1288,40 @@ Notes:
         if min_value is not None and max_value is not None and min_value > max_value:
             raise ValueError("min_value cannot be greater than max_value")
 
+        # Compare whole numeric and datetime columns at once when the bounds are of a matching type; this gives the
+        # same result as comparing each value below
+        bounds = [bound for bound in [min_value, max_value] if bound is not None]
+        if (
+            pd.api.types.is_numeric_dtype(temp_column.dtype)
+            and all(
+                isinstance(bound, (int, float, np.number))
+                and not isinstance(bound, bool)
+                for bound in bounds
+            )
+        ) or (
+            pd.api.types.is_datetime64_any_dtype(temp_column.dtype)
+            and all(isinstance(bound, datetime) for bound in bounds)
+            and not allow_cross_type_comparisons
+        ):
+            try:
+                in_range = pd.Series(True, index=temp_column.index)
+                if min_value is not None:
+                    in_range &= (
+                        temp_column > min_value
+                        if strict_min
+                        else temp_column >= min_value
+                    )
+                if max_value is not None:
+                    in_range &= (
+                        temp_column < max_value
+                        if strict_max
+                        else temp_column <= max_value
+                    )
+                return in_range
+            except (TypeError, OverflowError):
+                # Fall back to comparing each value
+                pass
+
         def is_between(val):
             # TODO Might be worth explicitly defining comparisons between types (for example, between strings and ints).
             # Ensure types can be compared since some types in Python 3 cannot be logically compared.
@@ -1704,18 +1842,16 @@ Notes:
             # for nonoverlapping ranges.
             bootstrap_sample_size = len(partition_object["weights"]) * 2
 
-        results = [
-            stats.kstest(
-                np.random.choice(column, size=bootstrap_sample_size), estimated_cdf
-            )[1]
-            for _ in range(bootstrap_samples)
-        ]
+        pass_count = get_bootstrapped_ks_test_pass_count(
+            column, estimated_cdf, p, bootstrap_samples, bootstrap_sample_size
+        )
 
-        test_result = (1 + sum(x >= p for x in results)) / (bootstrap_samples + 1)
+        test_result = (1 + pass_count) / (bootstrap_samples + 1)
 
-        hist, bin_edges = np.histogram(column, partition_object["bins"])
-        below_partition = len(np.where(column < partition_object["bins"][0])[0])
-        above_partition = len(np.where(column > partition_object["bins"][-1])[0])
+        partition_counts = get_partition_counts(column, partition_object["bins"])
+        below_partition = partition_counts[0]
+        hist = partition_counts[1:-1]
+        above_partition = partition_counts[-1]
 
         # Expand observed partition to report, if necessary
         if below_partition > 0 and above_partition > 0:
@@ -1804,8 +1940,8 @@ Notes:
             raise NotImplementedError
 
         if parse_strings_as_datetimes:
-            temp_column_A = column_A.map(parse)
-            temp_column_B = column_B.map(parse)
+            temp_column_A = self._parse_datetime_values(column_A)
+            temp_column_B = self._parse_datetime_values(column_B)
 
         else:
             temp_column_A = column_A
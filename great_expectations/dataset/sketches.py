@@ -0,0 +1,277 @@
+# Mergeable summaries of column values, used to compute aggregate metrics over data that is processed in pieces
+
+import logging
+import math
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+class HyperLogLog:
+    """A HyperLogLog sketch of the number of distinct values of a column.
+
+    Values are hashed with pandas' stable 64-bit hash; numeric values are hashed as floats so that the same number
+    read as an integer in one piece of data and as a float in another is only counted once.
+
+    The sketch counts distinct hashes exactly until more than exact_limit of them have been seen, so small
+    cardinalities are exact. Past that point the relative standard error of the estimate is about
+    1.04 / sqrt(2 ** precision), i.e. 0.8% with the default precision of 14, using 2 ** precision bytes of memory.
+    """
+
+    def __init__(self, precision=14, exact_limit=None):
+        if not 4 <= precision <= 18:
+            raise ValueError("precision must be between 4 and 18")
+        self.precision = precision
+        self.exact_limit = exact_limit if exact_limit is not None else 1 << precision
+        self._registers = np.zeros(1 << precision, dtype=np.uint8)
+        self._exact_hashes = np.empty(0, dtype=np.uint64)
+
+    @classmethod
+    def for_relative_error(cls, relative_error):
+        """Return a sketch with the smallest precision whose relative standard error is at most relative_error.
+
+        The precision is kept between 4 and 18, so the error of very small or very large relative errors is bounded
+        by those precisions instead.
+        """
+        precision = int(math.ceil(math.log2((1.04 / relative_error) ** 2)))
+        return cls(precision=min(max(precision, 4), 18))
+
+    @property
+    def is_exact(self):
+        return self._exact_hashes is not None
+
+    @property
+    def relative_error(self):
+        """The relative standard error of count(); 0 while the sketch is exact."""
+        if self.is_exact:
+            return 0.0
+        return 1.04 / math.sqrt(len(self._registers))
+
+    def update(self, values):
+        """Add the non-null values of a series (or array-like) to the sketch."""
+        series = pd.Series(values)
+        series = series[series.notnull()]
+        if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(
+            series
+        ):
+            series = series.astype(np.float64)
+        hashes = pd.util.hash_pandas_object(series, index=False).to_numpy(
+            dtype=np.uint64
+        )
+        self._update_hashes(hashes)
+
+    def _update_hashes(self, hashes):
+        if len(hashes) == 0:
+            return
+        if self._exact_hashes is not None:
+            self._exact_hashes = np.union1d(self._exact_hashes, hashes)
+            if len(self._exact_hashes) > self.exact_limit:
+                self._exact_hashes = None
+
+        remainder_bits = 64 - self.precision
+        index = (hashes >> np.uint64(remainder_bits)).astype(np.intp)
+        remainder = hashes & np.uint64((1 << remainder_bits) - 1)
+        # rank is the position of the leftmost 1 bit of the remainder, counting from 1
+        rank = np.full(len(hashes), remainder_bits + 1, dtype=np.uint8)
+        nonzero = remainder != 0
+        rank[nonzero] = remainder_bits - np.floor(
+            np.log2(remainder[nonzero].astype(np.float64))
+        ).astype(np.uint8)
+        maxima = pd.Series(rank).groupby(index).max()
+        register_index = maxima.index.to_numpy()
+        self._registers[register_index] = np.maximum(
+            self._registers[register_index], maxima.to_numpy()
+        )
+
+    def merge(self, other):
+        """Merge another sketch of the same precision into this one."""
+        if other.precision != self.precision:
+            raise ValueError("Only sketches with the same precision can be merged.")
+        np.maximum(self._registers, other._registers, out=self._registers)
+        if self._exact_hashes is not None and other._exact_hashes is not None:
+            self._exact_hashes = np.union1d(self._exact_hashes, other._exact_hashes)
+            if len(self._exact_hashes) > self.exact_limit:
+                self._exact_hashes = None
+        else:
+            self._exact_hashes = None
+        return self
+
+    def count(self):
+        """Return the (estimated) number of distinct values added to the sketch."""
+        if self._exact_hashes is not None:
+            return len(self._exact_hashes)
+        m = len(self._registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.power(2.0, -self._registers.astype(float)))
+        empty_registers = int(np.count_nonzero(self._registers == 0))
+        if estimate <= 2.5 * m and empty_registers > 0:
+            # small range correction: linear counting
+            estimate = m * math.log(m / empty_registers)
+        return int(round(estimate))
+
+
+class QuantileSketch:
+    """A mergeable sketch of the distribution of a numeric column, answering quantile queries.
+
+    The sketch is a hierarchy of compactors: level h holds values that each stand for 2 ** h of the original ones.
+    Whenever a level holds more than k values it is sorted and every other value is promoted to the next level.
+
+    While no compaction has happened (at most k values were added) quantiles and medians are exact and computed
+    the way pandas does. Past that point the rank of a returned quantile differs from the requested one by at most
+    log2(n / k) / k of the number of values n; with the default k of 4096 that is below 0.5% of n for a billion
+    values, and usually much less since the alternating choice of promoted values cancels most of the error.
+    """
+
+    def __init__(self, k=4096):
+        if k < 2:
+            raise ValueError("k must be at least 2")
+        self.k = k
+        self.count = 0
+        self._levels = [np.empty(0)]
+        self._offsets = [0]
+
+    @classmethod
+    def for_relative_error(cls, relative_error, count=None):
+        """Return a sketch with the smallest k (a power of two) whose rank error over count values is at most
+        relative_error.
+
+        If count is not known, the sketch is sized for up to 2 ** 40 values.
+        """
+        if count is None:
+            count = 2 ** 40
+        k = 16
+        while k < count and max(math.log2(count / k), 1) / k > relative_error:
+            k *= 2
+        return cls(k=k)
+
+    @property
+    def is_exact(self):
+        return len(self._levels) == 1
+
+    @property
+    def relative_error(self):
+        """The bound on the rank error of quantiles(), as a fraction of count; 0 while the sketch is exact."""
+        if self.is_exact:
+            return 0.0
+        return max(math.log2(self.count / self.k), 1) / self.k
+
+    def update(self, values):
+        """Add the non-null values of a series (or array-like) to the sketch."""
+        series = pd.Series(values).dropna()
+        if len(series) == 0:
+            return
+        self.count += len(series)
+        self._levels[0] = self._concatenate(self._levels[0], series.to_numpy())
+        self._compress()
+
+    def merge(self, other):
+        """Merge another sketch into this one."""
+        for level, values in enumerate(other._levels):
+            if level == len(self._levels):
+                self._levels.append(np.empty(0))
+                self._offsets.append(0)
+            self._levels[level] = self._concatenate(self._levels[level], values)
+        self.count += other.count
+        self._compress()
+        return self
+
+    @staticmethod
+    def _concatenate(values, other_values):
+        if len(values) == 0:
+            return other_values
+        if len(other_values) == 0:
+            return values
+        return np.concatenate([values, other_values])
+
+    def _compress(self):
+        level = 0
+        while level < len(self._levels):
+            values = self._levels[level]
+            if len(values) > self.k:
+                values = np.sort(values, kind="mergesort")
+                if len(values) % 2:
+                    kept, values = values[-1:], values[:-1]
+                else:
+                    kept = values[:0]
+                # Alternate which half of the pairs is promoted so that the rank errors of successive
+                # compactions of a level cancel out instead of piling up.
+                promoted = values[self._offsets[level] :: 2]
+                self._offsets[level] ^= 1
+                self._levels[level] = kept
+                if level + 1 == len(self._levels):
+                    self._levels.append(np.empty(0))
+                    self._offsets.append(0)
+                self._levels[level + 1] = self._concatenate(
+                    self._levels[level + 1], promoted
+                )
+            level += 1
+
+    def quantiles(self, quantiles):
+        """Return the values at the given quantiles, using nearest-rank interpolation."""
+        if self.count == 0:
+            return [np.nan for _ in quantiles]
+        if self.is_exact:
+            return (
+                pd.Series(self._levels[0])
+                .quantile(list(quantiles), interpolation="nearest")
+                .tolist()
+            )
+        values = np.concatenate(self._levels)
+        weights = np.concatenate(
+            [
+                np.full(len(level_values), 2 ** level, dtype=np.int64)
+                for level, level_values in enumerate(self._levels)
+            ]
+        )
+        order = np.argsort(values, kind="mergesort")
+        values = values[order]
+        cumulative_weights = np.cumsum(weights[order])
+        positions = np.searchsorted(
+            cumulative_weights,
+            [quantile * (cumulative_weights[-1] - 1) for quantile in quantiles],
+            side="right",
+        )
+        return values[np.minimum(positions, len(values) - 1)].tolist()
+
+    def median(self):
+        if self.is_exact:
+            return pd.Series(self._levels[0]).median()
+        return self.quantiles([0.5])[0]
+
+
+class SpaceSavingCounter:
+    """Approximate counts of the most common values, keeping the counts of at most capacity values (the
+    Space-Saving algorithm of Metwally et al.).
+
+    While at most capacity distinct values have been counted the counts are exact. Past that point a new value
+    takes the place of the value with the lowest count, and starts from that count: counts may be overestimated by
+    at most the lowest count kept, and every value counted more than total / capacity times is kept.
+    """
+
+    def __init__(self, capacity):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self._counts = {}
+        self.is_exact = True
+
+    def update(self, counts):
+        """Add the counts of a mapping (or iterable of pairs) of values to counts."""
+        if isinstance(counts, dict):
+            counts = counts.items()
+        for value, count in counts:
+            if value in self._counts:
+                self._counts[value] += count
+            elif len(self._counts) < self.capacity:
+                self._counts[value] = count
+            else:
+                self.is_exact = False
+                min_value = min(self._counts, key=self._counts.get)
+                self._counts[value] = self._counts.pop(min_value) + count
+
+    def most_common(self, n=None):
+        """Return the n most common values and their counts, like collections.Counter.most_common."""
+        items = sorted(self._counts.items(), key=lambda item: -item[1])
+        return items if n is None else items[:n]
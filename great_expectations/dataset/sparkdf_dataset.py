@@ -13,11 +13,13 @@ import numpy as np
 import pandas as pd
 from dateutil.parser import parse
 
+from great_expectations.core.evaluation_parameters import build_evaluation_parameters
 from great_expectations.data_asset import DataAsset
 from great_expectations.data_asset.util import DocInherit, parse_result_format
 
 from .dataset import Dataset
 from .pandas_dataset import PandasDataset
+from .util import get_approximate_metrics_relative_error
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +28,7 @@ try:
     from pyspark.ml.feature import Bucketizer
     from pyspark.sql import SQLContext, Window
     from pyspark.sql.functions import (
+        approx_count_distinct,
         array,
         col,
         count,
@@ -42,10 +45,11 @@ try:
         monotonically_increasing_id,
         stddev_samp,
         struct,
-        udf,
-        when,
-        year,
     )
+    from pyspark.sql.functions import max as max_
+    from pyspark.sql.functions import min as min_
+    from pyspark.sql.functions import sum as sum_
+    from pyspark.sql.functions import udf, when, year
 except ImportError as e:
     logger.debug(str(e))
     logger.debug(
@@ -61,6 +65,13 @@ class MetaSparkDFDataset(Dataset):
     and SparkDFDataset implements the expectation methods themselves.
     """
 
+    # Column map expectations that filter or order the values they are given, and so cannot be evaluated on a
+    # DataFrame shared with other expectations
+    _unfused_column_map_expectations = [
+        "expect_column_values_to_be_increasing",
+        "expect_column_values_to_be_decreasing",
+    ]
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -92,7 +103,6 @@ class MetaSparkDFDataset(Dataset):
 
             # Rename column so we only have to handle dot notation here
             eval_col = "__eval_col_" + column.replace(".", "__").replace("`", "_")
-            self.spark_df = self.spark_df.withColumn(eval_col, col(column))
 
             if result_format is None:
                 result_format = self.default_expectation_args["result_format"]
@@ -107,34 +117,60 @@ class MetaSparkDFDataset(Dataset):
             else:
                 unexpected_count_limit = result_format["partial_unexpected_count"]
 
-            col_df = self.spark_df.select(col(eval_col))  # pyspark.sql.DataFrame
-
-            # a couple of tests indicate that caching here helps performance
-            col_df.persist()
-            element_count = self.get_row_count()
+            # the renamed column is only selected here, so that self.spark_df does not grow with every expectation
+            col_df = self.spark_df.select(
+                col(column).alias(eval_col)
+            )  # pyspark.sql.DataFrame
 
             # FIXME temporary fix for missing/ignored value
-            if func.__name__ not in [
+            ignore_nulls = func.__name__ not in [
                 "expect_column_values_to_not_be_null",
                 "expect_column_values_to_be_null",
-            ]:
+            ]
+            if ignore_nulls:
                 col_df = col_df.filter(col_df[0].isNotNull())
-                # these nonnull_counts are cached by SparkDFDataset
-                nonnull_count = self.get_column_nonnull_count(eval_col)
+
+            fused_counts = None
+            if self._fused_column_map_results and not args:
+                fused_counts = self._fused_column_map_results.get(
+                    self._get_column_map_key(func.__name__, column, kwargs)
+                )
+
+            if fused_counts is not None:
+                element_count = fused_counts["element_count"]
+                nonnull_count = fused_counts["nonnull_count"]
+                success_count = fused_counts["success_count"]
+                success_df = None
             else:
-                nonnull_count = element_count
+                # a couple of tests indicate that caching here helps performance
+                col_df.persist()
+                element_count = self.get_row_count()
 
-            # success_df will have columns [column, '__success']
-            # this feels a little hacky, so might want to change
-            success_df = func(self, col_df, *args, **kwargs)
-            success_count = success_df.filter("__success = True").count()
+                if ignore_nulls:
+                    # these nonnull_counts are cached by SparkDFDataset
+                    nonnull_count = self.get_column_nonnull_count(column)
+                else:
+                    nonnull_count = element_count
+
+                # success_df will have columns [column, '__success']
+                # this feels a little hacky, so might want to change
+                success_df = func(self, col_df, *args, **kwargs)
+                success_count = success_df.filter("__success = True").count()
 
             unexpected_count = nonnull_count - success_count
 
-            if unexpected_count == 0:
-                # save some computation time if no unexpected items
+            if (
+                unexpected_count == 0
+                or result_format["result_format"] == "BOOLEAN_ONLY"
+            ):
+                # save some computation time if no unexpected items are reported
                 maybe_limited_unexpected_list = []
             else:
+                if success_df is None:
+                    # the counts came from the fused job of the validation run: only expectations with
+                    # unexpected values run a job of their own, to fetch them
+                    success_df = func(self, col_df, *args, **kwargs)
+
                 # here's an example of a place where we could do optimizations if we knew result format: see
                 # comment block below
                 unexpected_df = success_df.filter("__success = False")
@@ -181,6 +217,7 @@ class MetaSparkDFDataset(Dataset):
                 unexpected_count,
                 maybe_limited_unexpected_list,
                 unexpected_index_list=None,
+                mostly=mostly,
             )
 
             # FIXME Temp fix for result format
@@ -202,9 +239,175 @@ class MetaSparkDFDataset(Dataset):
 
         inner_wrapper.__name__ = func.__name__
         inner_wrapper.__doc__ = func.__doc__
+        inner_wrapper._success_column_func = func
 
         return inner_wrapper
 
+    @staticmethod
+    def _get_column_map_key(expectation_type, column, kwargs):
+        """Identify a column map expectation by its type and arguments, so that the same expectation can be
+        recognized when planning and when evaluating a validation run."""
+        return expectation_type, column, repr(sorted(kwargs.items()))
+
+    def _prepare_validation(self, expectations, evaluation_parameters):
+        super()._prepare_validation(expectations, evaluation_parameters)
+        if self.fuse_column_map_jobs:
+            self._fused_column_map_results = self._get_fused_column_map_results(
+                expectations=expectations, evaluation_parameters=evaluation_parameters,
+            )
+
+    def _finish_validation(self):
+        super()._finish_validation()
+        self._fused_column_map_results = {}
+
+    def _get_fused_column_map_results(self, expectations, evaluation_parameters):
+        """Compute the counts of all the column map expectations of a validation run with a single Spark job.
+
+        The "__success" column of every column map expectation is added to a single DataFrame holding the columns
+        they evaluate, and all the element, nonnull and success counts are computed by one select of
+        sum(when(...)) aggregates, instead of two jobs per expectation. Expectations whose implementation does not
+        just add a "__success" column are evaluated with their own jobs. If the fused job fails (for instance
+        because a UDF does not accept null values), every expectation is evaluated with its own jobs.
+
+        Returns:
+            dict mapping the column map key of each fused expectation to its element, nonnull and success counts
+        """
+        fused_expectations = []
+        for expectation in expectations:
+            if expectation.expectation_type in self._unfused_column_map_expectations:
+                continue
+            expectation_method = getattr(self, expectation.expectation_type, None)
+            success_column_func = getattr(
+                expectation_method, "_success_column_func", None
+            )
+            if success_column_func is None:
+                continue
+
+            try:
+                evaluation_args, _ = build_evaluation_parameters(
+                    expectation.kwargs,
+                    evaluation_parameters,
+                    self._config.get("interactive_evaluation", True),
+                    self._data_context,
+                    resolved_urns=self._resolved_urns,
+                )
+                func_kwargs = {
+                    key: value
+                    for key, value in evaluation_args.items()
+                    if key
+                    not in [
+                        "column",
+                        "mostly",
+                        "result_format",
+                        "include_config",
+                        "catch_exceptions",
+                        "meta",
+                    ]
+                }
+                fused_expectations.append(
+                    (
+                        self._get_column_map_key(
+                            expectation.expectation_type,
+                            evaluation_args["column"],
+                            func_kwargs,
+                        ),
+                        success_column_func,
+                        func_kwargs,
+                    )
+                )
+            except Exception as e:
+                # The expectation will report its own error (if any) when it is evaluated
+                logger.debug(
+                    "Unable to fuse %s into the column map job: %s"
+                    % (expectation.expectation_type, str(e))
+                )
+
+        if len(fused_expectations) == 0:
+            return {}
+
+        eval_cols = {}
+        for (_, column, _), _, _ in fused_expectations:
+            if column not in eval_cols:
+                eval_cols[column] = "__eval_col_%d" % len(eval_cols)
+        try:
+            fused_df = self.spark_df.select(
+                *[col(column).alias(eval_col) for column, eval_col in eval_cols.items()]
+            )
+        except Exception as e:
+            logger.debug("Unable to fuse column map expectations: %s" % str(e))
+            return {}
+
+        aggregates = [count(lit(1)).alias("element_count")]
+        for column, eval_col in eval_cols.items():
+            aggregates.append(count(col(eval_col)).alias(eval_col + "_nonnull"))
+
+        success_cols = {}
+        for key, success_column_func, func_kwargs in fused_expectations:
+            if key in success_cols:
+                continue
+            expectation_type, column, _ = key
+            eval_col = eval_cols[column]
+            # the expectation implementation works on the first column of the DataFrame it is given
+            column_df = fused_df.select(
+                eval_col, *[name for name in fused_df.columns if name != eval_col]
+            )
+            try:
+                success_df = success_column_func(self, column_df, **func_kwargs)
+            except Exception as e:
+                logger.debug(
+                    "Unable to fuse %s into the column map job: %s"
+                    % (expectation_type, str(e))
+                )
+                continue
+            if sorted(success_df.columns) != sorted(column_df.columns + ["__success"]):
+                continue
+
+            success_col = "__success_%d" % len(success_cols)
+            fused_df = success_df.withColumnRenamed("__success", success_col)
+            success_cols[key] = success_col
+
+            success_condition = col(success_col) == lit(True)
+            if expectation_type not in [
+                "expect_column_values_to_not_be_null",
+                "expect_column_values_to_be_null",
+            ]:
+                success_condition = col(eval_col).isNotNull() & success_condition
+            aggregates.append(
+                sum_(when(success_condition, 1).otherwise(0)).alias(
+                    success_col + "_count"
+                )
+            )
+
+        if len(success_cols) == 0:
+            return {}
+
+        try:
+            row = fused_df.agg(*aggregates).collect()[0]
+        except Exception as e:
+            logger.debug(
+                "Unable to evaluate the fused column map job, evaluating each expectation separately: %s"
+                % str(e)
+            )
+            return {}
+
+        element_count = row["element_count"]
+        fused_results = {}
+        for key, success_col in success_cols.items():
+            expectation_type, column, _ = key
+            if expectation_type in [
+                "expect_column_values_to_not_be_null",
+                "expect_column_values_to_be_null",
+            ]:
+                nonnull_count = element_count
+            else:
+                nonnull_count = row[eval_cols[column] + "_nonnull"]
+            fused_results[key] = {
+                "element_count": element_count,
+                "nonnull_count": nonnull_count,
+                "success_count": row[success_col + "_count"] or 0,
+            }
+        return fused_results
+
     @classmethod
     def column_pair_map_expectation(cls, func):
         """
@@ -229,10 +432,6 @@ class MetaSparkDFDataset(Dataset):
             eval_col_A = "__eval_col_A_" + column_A.replace(".", "__").replace("`", "_")
             eval_col_B = "__eval_col_B_" + column_B.replace(".", "__").replace("`", "_")
 
-            self.spark_df = self.spark_df.withColumn(
-                eval_col_A, col(column_A)
-            ).withColumn(eval_col_B, col(column_B))
-
             if result_format is None:
                 result_format = self.default_expectation_args["result_format"]
 
@@ -246,7 +445,9 @@ class MetaSparkDFDataset(Dataset):
             else:
                 unexpected_count_limit = result_format["partial_unexpected_count"]
 
-            cols_df = self.spark_df.select(eval_col_A, eval_col_B).withColumn(
+            cols_df = self.spark_df.select(
+                col(column_A).alias(eval_col_A), col(column_B).alias(eval_col_B)
+            ).withColumn(
                 "__row", monotonically_increasing_id()
             )  # pyspark.sql.DataFrame
 
@@ -350,6 +551,7 @@ class MetaSparkDFDataset(Dataset):
                 unexpected_count,
                 maybe_limited_unexpected_list,
                 unexpected_index_list=None,
+                mostly=mostly,
             )
 
             # # FIXME Temp fix for result format
@@ -392,10 +594,11 @@ class MetaSparkDFDataset(Dataset):
         ):
             # Rename column so we only have to handle dot notation here
             eval_cols = []
+            eval_col_exprs = []
             for col_name in column_list:
                 eval_col = "__eval_col_" + col_name.replace(".", "__").replace("`", "_")
                 eval_cols.append(eval_col)
-                self.spark_df = self.spark_df.withColumn(eval_col, col(col_name))
+                eval_col_exprs.append(col(col_name).alias(eval_col))
             if result_format is None:
                 result_format = self.default_expectation_args["result_format"]
 
@@ -409,7 +612,7 @@ class MetaSparkDFDataset(Dataset):
             else:
                 unexpected_count_limit = result_format["partial_unexpected_count"]
 
-            temp_df = self.spark_df.select(*eval_cols)  # pyspark.sql.DataFrame
+            temp_df = self.spark_df.select(*eval_col_exprs)  # pyspark.sql.DataFrame
 
             # a couple of tests indicate that caching here helps performance
             temp_df.cache()
@@ -505,6 +708,7 @@ class MetaSparkDFDataset(Dataset):
                 unexpected_count,
                 maybe_limited_unexpected_list,
                 unexpected_index_list=None,
+                mostly=mostly,
             )
 
             temp_df.unpersist()
@@ -603,8 +807,30 @@ This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
         self._persist = kwargs.pop("persist", True)
         if self._persist:
             self.spark_df.persist()
+        self._profiling_metrics = {}
+        self.fuse_column_map_jobs = kwargs.pop("fuse_column_map_jobs", True)
+        self._fused_column_map_results = {}
+        # When set, unique value counts, medians and quantiles are approximated within this relative error, with
+        # approx_count_distinct and approxQuantile
+        self.approximate_relative_error = get_approximate_metrics_relative_error(
+            kwargs.pop("approximate_metrics", False)
+        )
         super().__init__(*args, **kwargs)
 
+    def _get_validation_sample(self, sample_fraction, sample_seed):
+        sample = self.__class__(
+            self.spark_df.sample(
+                withReplacement=False, fraction=sample_fraction, seed=sample_seed
+            ),
+            persist=self._persist,
+            fuse_column_map_jobs=self.fuse_column_map_jobs,
+            approximate_metrics=self.approximate_relative_error or False,
+            batch_kwargs=self.batch_kwargs,
+            batch_markers=self.batch_markers,
+            batch_parameters=self.batch_parameters,
+        )
+        return sample, {"method": "DataFrame.sample", "seed": sample_seed}
+
     def head(self, n=5):
         """Returns a *PandasDataset* with the first *n* rows of the given Dataset"""
         return PandasDataset(
@@ -617,7 +843,30 @@ This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
             ),
         )
 
+    def _prepare_profiling(self, columns):
+        super()._prepare_profiling(columns)
+        # Count the rows, and the nonnull and distinct values of every column, with a single job
+        aggregates = [count(lit(1))]
+        for column in columns:
+            aggregates.append(count(col(column)))
+            aggregates.append(self._get_count_distinct_expression(column))
+        row = self.spark_df.agg(*aggregates).collect()[0]
+        self._profiling_metrics = {("get_row_count", None): row[0]}
+        for idx, column in enumerate(columns):
+            self._profiling_metrics[("get_column_nonnull_count", column)] = row[
+                2 * idx + 1
+            ]
+            self._profiling_metrics[("get_column_unique_count", column)] = row[
+                2 * idx + 2
+            ]
+
+    def _finish_profiling(self):
+        super()._finish_profiling()
+        self._profiling_metrics = {}
+
     def get_row_count(self):
+        if ("get_row_count", None) in self._profiling_metrics:
+            return self._profiling_metrics[("get_row_count", None)]
         return self.spark_df.count()
 
     def get_column_count(self):
@@ -627,6 +876,8 @@ This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
         return self.spark_df.columns
 
     def get_column_nonnull_count(self, column):
+        if ("get_column_nonnull_count", column) in self._profiling_metrics:
+            return self._profiling_metrics[("get_column_nonnull_count", column)]
         return self.spark_df.filter(col(column).isNotNull()).count()
 
     def get_column_mean(self, column):
@@ -695,8 +946,23 @@ This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
         )
         return series
 
+    def _get_count_distinct_expression(self, column):
+        if self.approximate_relative_error is None:
+            return countDistinct(col(column))
+        # Spark requires the relative standard deviation to be at most 0.39
+        relative_error = min(self.approximate_relative_error, 0.39)
+        self._metric_approximations[("get_column_unique_count", column)] = {
+            "method": "approx_count_distinct",
+            "relative_error": relative_error,
+        }
+        return approx_count_distinct(col(column), rsd=relative_error)
+
     def get_column_unique_count(self, column):
-        return self.spark_df.agg(countDistinct(column)).collect()[0][0]
+        if ("get_column_unique_count", column) in self._profiling_metrics:
+            return self._profiling_metrics[("get_column_unique_count", column)]
+        return self.spark_df.agg(self._get_count_distinct_expression(column)).collect()[
+            0
+        ][0]
 
     def get_column_modes(self, column):
         """leverages computation done in _get_column_value_counts"""
@@ -704,6 +970,16 @@ This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
         return list(s[s == s.max()].index)
 
     def get_column_median(self, column):
+        if self.approximate_relative_error is not None:
+            self._metric_approximations[("get_column_median", column)] = {
+                "method": "approxQuantile",
+                "relative_error": self.approximate_relative_error,
+            }
+            result = self.spark_df.approxQuantile(
+                column, [0.5], self.approximate_relative_error
+            )
+            return result[0] if len(result) > 0 else None
+
         # We will get the two middle values by choosing an epsilon to add
         # to the 50th percentile such that we always get exactly the middle two values
         # (i.e. 0 < epsilon < 1 / (2 * values))
@@ -719,7 +995,11 @@ This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
 
     def get_column_quantiles(self, column, quantiles, allow_relative_error=False):
         if allow_relative_error is False:
-            allow_relative_error = 0.0
+            allow_relative_error = (
+                self.approximate_relative_error
+                if self.approximate_relative_error is not None
+                else 0.0
+            )
         if (
             not isinstance(allow_relative_error, float)
             or allow_relative_error < 0
@@ -728,6 +1008,11 @@ This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
             raise ValueError(
                 "SparkDFDataset requires relative error to be False or to be a float between 0 and 1."
             )
+        if allow_relative_error > 0:
+            self._metric_approximations[("get_column_quantiles", column)] = {
+                "method": "approxQuantile",
+                "relative_error": allow_relative_error,
+            }
         return self.spark_df.approxQuantile(
             column, list(quantiles), allow_relative_error
         )
@@ -797,6 +1082,25 @@ This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
 
         return hist
 
+    def _get_column_nonnull_count_and_extrema(self, column):
+        row = self.spark_df.select(
+            count(col(column)), min_(col(column)), max_(col(column))
+        ).collect()[0]
+        return row[0], row[1], row[2]
+
+    def _get_column_hist_and_nonnull_count(self, column, bins):
+        # Unlike get_column_hist, count every bin (and the non-null values) with a single aggregation
+        bins = list(bins)
+        selects = [count(col(column))]
+        for idx in range(len(bins) - 1):
+            if idx == len(bins) - 2:
+                condition = (col(column) >= bins[idx]) & (col(column) <= bins[idx + 1])
+            else:
+                condition = (col(column) >= bins[idx]) & (col(column) < bins[idx + 1])
+            selects.append(sum_(when(condition, 1).otherwise(0)))
+        row = self.spark_df.select(*selects).collect()[0]
+        return [row[idx] or 0 for idx in range(1, len(bins))], row[0]
+
     def get_column_count_in_range(
         self, column, min_val=None, max_val=None, strict_min=False, strict_max=True
     ):
@@ -11,10 +11,12 @@ import numpy as np
 import pandas as pd
 from dateutil.parser import parse
 
+from great_expectations.core.evaluation_parameters import build_evaluation_parameters
 from great_expectations.data_asset import DataAsset
 from great_expectations.data_asset.util import DocInherit, parse_result_format
 from great_expectations.dataset.util import (
     check_sql_engine_dialect,
+    get_approximate_metrics_relative_error,
     get_approximate_percentile_disc_sql,
     get_sql_dialect_floating_point_infinity_value,
 )
@@ -23,6 +25,7 @@ from great_expectations.util import import_library_module
 from ..core import convert_to_json_serializable
 from .dataset import Dataset
 from .pandas_dataset import PandasDataset
+from .sketches import HyperLogLog, QuantileSketch
 
 logger = logging.getLogger(__name__)
 
@@ -32,7 +35,7 @@ try:
     from sqlalchemy.engine import reflection
     from sqlalchemy.engine.default import DefaultDialect
     from sqlalchemy.engine.result import RowProxy
-    from sqlalchemy.exc import ProgrammingError
+    from sqlalchemy.exc import ProgrammingError, SQLAlchemyError
     from sqlalchemy.sql.elements import Label, TextClause, WithinGroup
     from sqlalchemy.sql.expression import BinaryExpression, literal
     from sqlalchemy.sql.operators import custom_op
@@ -55,6 +58,7 @@ except ImportError:
     RowProxy = None
     DefaultDialect = None
     ProgrammingError = None
+    SQLAlchemyError = None
 
 try:
     import psycopg2
@@ -182,13 +186,10 @@ class MetaSqlAlchemyDataset(Dataset):
 
             expected_condition: BinaryExpression = func(self, column, *args, **kwargs)
 
-            # Added to prepare for when an ignore_values argument is added to the expectation
-            ignore_values: list = [None]
             if func.__name__ in [
                 "expect_column_values_to_not_be_null",
                 "expect_column_values_to_be_null",
             ]:
-                ignore_values = []
                 # Counting the number of unexpected values can be expensive when there is a large
                 # number of np.nan values.
                 # This only happens on expect_column_values_to_not_be_null expectations.
@@ -196,44 +197,14 @@ class MetaSqlAlchemyDataset(Dataset):
                 # we will instruct the result formatting method to skip this step.
                 result_format["partial_unexpected_count"] = 0
 
-            ignore_values_conditions: List[BinaryExpression] = []
-            if (
-                len(ignore_values) > 0
-                and None not in ignore_values
-                or len(ignore_values) > 1
-                and None in ignore_values
-            ):
-                ignore_values_conditions += [
-                    sa.column(column).in_(
-                        [val for val in ignore_values if val is not None]
-                    )
-                ]
-            if None in ignore_values:
-                ignore_values_conditions += [sa.column(column).is_(None)]
-
-            ignore_values_condition: BinaryExpression
-            if len(ignore_values_conditions) > 1:
-                ignore_values_condition = sa.or_(*ignore_values_conditions)
-            elif len(ignore_values_conditions) == 1:
-                ignore_values_condition = ignore_values_conditions[0]
-            else:
-                ignore_values_condition = BinaryExpression(
-                    sa.literal(False), sa.literal(True), custom_op("=")
-                )
-
-            count_query: Select
-            if self.sql_engine_dialect.name.lower() == "mssql":
-                count_query = self._get_count_query_mssql(
-                    expected_condition=expected_condition,
-                    ignore_values_condition=ignore_values_condition,
-                )
-            else:
-                count_query = self._get_count_query_generic_sqlalchemy(
-                    expected_condition=expected_condition,
-                    ignore_values_condition=ignore_values_condition,
-                )
+            ignore_values_condition: BinaryExpression = self._get_column_map_ignore_values_condition(
+                column=column, expectation_type=func.__name__
+            )
 
-            count_results: dict = dict(self.engine.execute(count_query).fetchone())
+            count_results: dict = self._get_column_map_count_results(
+                expected_condition=expected_condition,
+                ignore_values_condition=ignore_values_condition,
+            )
 
             # Handle case of empty table gracefully:
             if (
@@ -255,17 +226,24 @@ class MetaSqlAlchemyDataset(Dataset):
             count_results["null_count"] = int(count_results["null_count"])
             count_results["unexpected_count"] = int(count_results["unexpected_count"])
 
-            # Retrieve unexpected values
-            unexpected_query_results = self.engine.execute(
-                sa.select([sa.column(column)])
-                .select_from(self._table)
-                .where(
-                    sa.and_(
-                        sa.not_(expected_condition), sa.not_(ignore_values_condition)
+            # Retrieve unexpected values, unless we already know there are none or they will not be reported
+            if (
+                count_results["unexpected_count"] == 0
+                or result_format["result_format"] == "BOOLEAN_ONLY"
+            ):
+                unexpected_query_results = []
+            else:
+                unexpected_query_results = self.engine.execute(
+                    sa.select([sa.column(column)])
+                    .select_from(self._table)
+                    .where(
+                        sa.and_(
+                            sa.not_(expected_condition),
+                            sa.not_(ignore_values_condition),
+                        )
                     )
-                )
-                .limit(unexpected_count_limit)
-            )
+                    .limit(unexpected_count_limit)
+                ).fetchall()
 
             nonnull_count: int = count_results["element_count"] - count_results[
                 "null_count"
@@ -274,7 +252,7 @@ class MetaSqlAlchemyDataset(Dataset):
             if "output_strftime_format" in kwargs:
                 output_strftime_format = kwargs["output_strftime_format"]
                 maybe_limited_unexpected_list = []
-                for x in unexpected_query_results.fetchall():
+                for x in unexpected_query_results:
                     if isinstance(x[column], str):
                         col = parse(x[column])
                     else:
@@ -284,7 +262,7 @@ class MetaSqlAlchemyDataset(Dataset):
                     )
             else:
                 maybe_limited_unexpected_list = [
-                    x[column] for x in unexpected_query_results.fetchall()
+                    x[column] for x in unexpected_query_results
                 ]
 
             success_count = nonnull_count - count_results["unexpected_count"]
@@ -300,6 +278,7 @@ class MetaSqlAlchemyDataset(Dataset):
                 count_results["unexpected_count"],
                 maybe_limited_unexpected_list,
                 None,
+                mostly=mostly,
             )
 
             if func.__name__ in [
@@ -318,11 +297,422 @@ class MetaSqlAlchemyDataset(Dataset):
 
             return return_obj
 
+        def get_map_conditions(self, column, *args, **kwargs):
+            return (
+                func(self, column, *args, **kwargs),
+                self._get_column_map_ignore_values_condition(
+                    column=column, expectation_type=func.__name__
+                ),
+            )
+
         inner_wrapper.__name__ = func.__name__
         inner_wrapper.__doc__ = func.__doc__
+        # Exposed so that the conditions of a whole suite can be collected before validation
+        inner_wrapper._map_conditions_func = get_map_conditions
 
         return inner_wrapper
 
+    @classmethod
+    def column_pair_map_expectation(cls, func):
+        """For SqlAlchemy, this decorator allows individual column_pair_map_expectations to simply return the filter
+        that describes the expected condition on a pair of columns.
+
+        Rows are ignored following the ignore_row_if argument, as they are for a PandasDataset. The decorator counts
+        and retrieves the unexpected pairs of values in the database and returns the formatted object.
+        """
+        argspec = inspect.getfullargspec(func)[0][1:]
+
+        @cls.expectation(argspec)
+        @wraps(func)
+        def inner_wrapper(
+            self,
+            column_A,
+            column_B,
+            mostly=None,
+            ignore_row_if="both_values_are_missing",
+            result_format=None,
+            *args,
+            **kwargs,
+        ):
+            expected_condition, ignore_row_condition = get_map_conditions(
+                self, column_A, column_B, ignore_row_if, *args, **kwargs
+            )
+            return self._get_multicolumn_map_expectation_result(
+                column_list=[column_A, column_B],
+                expected_condition=expected_condition,
+                ignore_row_condition=ignore_row_condition,
+                mostly=mostly,
+                result_format=result_format,
+                format_unexpected_row=lambda row: (row[0], row[1]),
+            )
+
+        def get_map_conditions(
+            self,
+            column_A,
+            column_B,
+            ignore_row_if="both_values_are_missing",
+            *args,
+            **kwargs,
+        ):
+            if ignore_row_if == "both_values_are_missing":
+                ignore_row_condition = sa.and_(
+                    sa.column(column_A).is_(None), sa.column(column_B).is_(None)
+                )
+            elif ignore_row_if == "either_value_is_missing":
+                ignore_row_condition = sa.or_(
+                    sa.column(column_A).is_(None), sa.column(column_B).is_(None)
+                )
+            elif ignore_row_if == "never":
+                ignore_row_condition = BinaryExpression(
+                    sa.literal(False), sa.literal(True), custom_op("=")
+                )
+            else:
+                raise ValueError("Unknown value of ignore_row_if: %s" % ignore_row_if)
+            return (
+                func(self, column_A, column_B, *args, **kwargs),
+                ignore_row_condition,
+            )
+
+        inner_wrapper.__name__ = func.__name__
+        inner_wrapper.__doc__ = func.__doc__
+        inner_wrapper._map_conditions_func = get_map_conditions
+
+        return inner_wrapper
+
+    @classmethod
+    def multicolumn_map_expectation(cls, func):
+        """For SqlAlchemy, this decorator allows individual multicolumn_map_expectations to simply return the filter
+        that describes the expected condition on a set of columns.
+
+        Rows are ignored following the ignore_row_if argument, as they are for a PandasDataset. The decorator counts
+        and retrieves the unexpected rows in the database and returns the formatted object.
+        """
+        argspec = inspect.getfullargspec(func)[0][1:]
+
+        @cls.expectation(argspec)
+        @wraps(func)
+        def inner_wrapper(
+            self,
+            column_list,
+            mostly=None,
+            ignore_row_if="all_values_are_missing",
+            result_format=None,
+            *args,
+            **kwargs,
+        ):
+            expected_condition, ignore_row_condition = get_map_conditions(
+                self, column_list, ignore_row_if, *args, **kwargs
+            )
+            return self._get_multicolumn_map_expectation_result(
+                column_list=column_list,
+                expected_condition=expected_condition,
+                ignore_row_condition=ignore_row_condition,
+                mostly=mostly,
+                result_format=result_format,
+                format_unexpected_row=lambda row: dict(zip(column_list, row)),
+            )
+
+        def get_map_conditions(
+            self, column_list, ignore_row_if="all_values_are_missing", *args, **kwargs
+        ):
+            return (
+                func(self, column_list, *args, **kwargs),
+                self._get_multicolumn_ignore_row_condition(
+                    column_list=column_list, ignore_row_if=ignore_row_if
+                ),
+            )
+
+        inner_wrapper.__name__ = func.__name__
+        inner_wrapper.__doc__ = func.__doc__
+        inner_wrapper._map_conditions_func = get_map_conditions
+
+        return inner_wrapper
+
+    def _get_multicolumn_ignore_row_condition(
+        self, column_list: List[str], ignore_row_if: str
+    ) -> BinaryExpression:
+        if ignore_row_if == "all_values_are_missing":
+            return sa.and_(*[sa.column(column).is_(None) for column in column_list])
+        elif ignore_row_if == "any_value_is_missing":
+            return sa.or_(*[sa.column(column).is_(None) for column in column_list])
+        elif ignore_row_if == "never":
+            return BinaryExpression(sa.literal(False), sa.literal(True), custom_op("="))
+        else:
+            raise ValueError("Unknown value of ignore_row_if: %s" % ignore_row_if)
+
+    def _get_multicolumn_map_expectation_result(
+        self,
+        column_list: List[str],
+        expected_condition: BinaryExpression,
+        ignore_row_condition: BinaryExpression,
+        mostly,
+        result_format,
+        format_unexpected_row,
+    ) -> dict:
+        """Count the rows that do not meet the expected condition of a column pair or multicolumn map expectation in
+        the database and retrieve (up to the partial_unexpected_count of) the unexpected ones."""
+        if result_format is None:
+            result_format = self.default_expectation_args["result_format"]
+
+        result_format = parse_result_format(result_format)
+
+        if result_format["result_format"] == "COMPLETE":
+            warnings.warn(
+                "Setting result format to COMPLETE for a SqlAlchemyDataset can be dangerous because it will not limit the number of returned results."
+            )
+            unexpected_count_limit = None
+        else:
+            unexpected_count_limit = result_format["partial_unexpected_count"]
+
+        count_results: dict = self._get_column_map_count_results(
+            expected_condition=expected_condition,
+            ignore_values_condition=ignore_row_condition,
+        )
+        # Empty tables return NULL sums, and some engines return Decimal from count queries
+        element_count = int(count_results.get("element_count") or 0)
+        null_count = int(count_results.get("null_count") or 0)
+        unexpected_count = int(count_results.get("unexpected_count") or 0)
+
+        if unexpected_count == 0 or result_format["result_format"] == "BOOLEAN_ONLY":
+            unexpected_query_results = []
+        else:
+            unexpected_query_results = self.engine.execute(
+                sa.select([sa.column(column) for column in column_list])
+                .select_from(self._table)
+                .where(
+                    sa.and_(sa.not_(expected_condition), sa.not_(ignore_row_condition),)
+                )
+                .limit(unexpected_count_limit)
+            ).fetchall()
+
+        nonnull_count = element_count - null_count
+        success, percent_success = self._calc_map_expectation_success(
+            nonnull_count - unexpected_count, nonnull_count, mostly
+        )
+
+        return self._format_map_output(
+            result_format,
+            success,
+            element_count,
+            nonnull_count,
+            unexpected_count,
+            [format_unexpected_row(row) for row in unexpected_query_results],
+            None,
+            mostly=mostly,
+        )
+
+    def _get_column_map_ignore_values_condition(
+        self, column: str, expectation_type: str
+    ) -> BinaryExpression:
+        # Added to prepare for when an ignore_values argument is added to the expectation
+        ignore_values: list = [None]
+        if expectation_type in [
+            "expect_column_values_to_not_be_null",
+            "expect_column_values_to_be_null",
+        ]:
+            ignore_values = []
+
+        ignore_values_conditions: List[BinaryExpression] = []
+        if (
+            len(ignore_values) > 0
+            and None not in ignore_values
+            or len(ignore_values) > 1
+            and None in ignore_values
+        ):
+            ignore_values_conditions += [
+                sa.column(column).in_([val for val in ignore_values if val is not None])
+            ]
+        if None in ignore_values:
+            ignore_values_conditions += [sa.column(column).is_(None)]
+
+        ignore_values_condition: BinaryExpression
+        if len(ignore_values_conditions) > 1:
+            ignore_values_condition = sa.or_(*ignore_values_conditions)
+        elif len(ignore_values_conditions) == 1:
+            ignore_values_condition = ignore_values_conditions[0]
+        else:
+            ignore_values_condition = BinaryExpression(
+                sa.literal(False), sa.literal(True), custom_op("=")
+            )
+
+        return ignore_values_condition
+
+    def _get_column_map_count_results(
+        self,
+        expected_condition: BinaryExpression,
+        ignore_values_condition: BinaryExpression,
+    ) -> dict:
+        """Return the element, null and unexpected counts of a column, column pair or multicolumn map expectation,
+        using the results of the fused count query of the current validation run when they are available."""
+        if self._fused_column_map_count_results:
+            try:
+                condition_key: tuple = self._get_column_map_condition_key(
+                    expected_condition=expected_condition,
+                    ignore_values_condition=ignore_values_condition,
+                )
+            except Exception:
+                condition_key = None
+            if condition_key in self._fused_column_map_count_results:
+                return dict(self._fused_column_map_count_results[condition_key])
+
+        count_query: Select
+        if self.sql_engine_dialect.name.lower() == "mssql":
+            count_query = self._get_count_query_mssql(
+                expected_condition=expected_condition,
+                ignore_values_condition=ignore_values_condition,
+            )
+        else:
+            count_query = self._get_count_query_generic_sqlalchemy(
+                expected_condition=expected_condition,
+                ignore_values_condition=ignore_values_condition,
+            )
+
+        return dict(self.engine.execute(count_query).fetchone())
+
+    def _get_column_map_condition_key(
+        self,
+        expected_condition: BinaryExpression,
+        ignore_values_condition: BinaryExpression,
+    ) -> tuple:
+        """Identify a column map expectation by the SQL of its conditions, rendered with literal values, so that the
+        same expectation can be recognized when planning and when evaluating a validation run."""
+        return tuple(
+            str(
+                condition.compile(
+                    dialect=self.sql_engine_dialect,
+                    compile_kwargs={"literal_binds": True},
+                )
+            )
+            for condition in (
+                sa.and_(sa.not_(expected_condition), sa.not_(ignore_values_condition)),
+                ignore_values_condition,
+            )
+        )
+
+    def _prepare_validation(self, expectations, evaluation_parameters):
+        super()._prepare_validation(expectations, evaluation_parameters)
+        if self.fuse_column_map_queries:
+            self._fused_column_map_count_results = self._get_fused_column_map_count_results(
+                expectations=expectations, evaluation_parameters=evaluation_parameters,
+            )
+
+    def _finish_validation(self):
+        super()._finish_validation()
+        self._fused_column_map_count_results = {}
+
+    def _get_fused_column_map_count_results(
+        self, expectations, evaluation_parameters
+    ) -> Dict[tuple, dict]:
+        """Compute the counts of all the map expectations of a validation run with a single query.
+
+        The expected condition of every column, column pair and multicolumn map expectation is collected and turned
+        into one SUM(CASE WHEN ...) column of a single SELECT, so the table is scanned once instead of once per
+        expectation.
+        Expectations whose condition cannot be collected are skipped here and evaluated with their own query.
+
+        Returns:
+            dict mapping the condition key of each fused expectation to its element, null and unexpected counts
+        """
+        # mssql does not allow subqueries inside aggregate functions, which is why it counts through a temporary
+        # table; keep evaluating each expectation separately there.
+        if self.sql_engine_dialect.name.lower() == "mssql":
+            return {}
+
+        ignore_values_conditions: Dict[str, BinaryExpression] = {}
+        unexpected_conditions: Dict[tuple, BinaryExpression] = {}
+        for expectation in expectations:
+            expectation_method = getattr(self, expectation.expectation_type, None)
+            conditions_func = getattr(expectation_method, "_map_conditions_func", None)
+            if conditions_func is None:
+                continue
+
+            try:
+                evaluation_args, _ = build_evaluation_parameters(
+                    expectation.kwargs,
+                    evaluation_parameters,
+                    self._config.get("interactive_evaluation", True),
+                    self._data_context,
+                    resolved_urns=self._resolved_urns,
+                )
+                condition_kwargs = {
+                    key: value
+                    for key, value in evaluation_args.items()
+                    if key
+                    not in [
+                        "mostly",
+                        "result_format",
+                        "include_config",
+                        "catch_exceptions",
+                        "meta",
+                    ]
+                }
+                expected_condition, ignore_values_condition = conditions_func(
+                    self, **condition_kwargs
+                )
+                condition_key = self._get_column_map_condition_key(
+                    expected_condition=expected_condition,
+                    ignore_values_condition=ignore_values_condition,
+                )
+            except Exception as e:
+                # The expectation will report its own error (if any) when it is evaluated
+                logger.debug(
+                    "Unable to fuse %s into the column map count query: %s"
+                    % (expectation.expectation_type, str(e))
+                )
+                continue
+
+            ignore_values_conditions[condition_key[1]] = ignore_values_condition
+            unexpected_conditions[condition_key] = sa.and_(
+                sa.not_(expected_condition), sa.not_(ignore_values_condition)
+            )
+
+        if len(unexpected_conditions) == 0:
+            return {}
+
+        null_count_labels: Dict[str, str] = {}
+        selects: List[Label] = [sa.func.count().label("element_count")]
+        for idx, (ignore_key, ignore_values_condition) in enumerate(
+            ignore_values_conditions.items()
+        ):
+            null_count_labels[ignore_key] = f"null_count_{idx}"
+            selects.append(
+                sa.func.sum(sa.case([(ignore_values_condition, 1)], else_=0)).label(
+                    null_count_labels[ignore_key]
+                )
+            )
+        unexpected_count_labels: Dict[tuple, str] = {}
+        for idx, (condition_key, unexpected_condition) in enumerate(
+            unexpected_conditions.items()
+        ):
+            unexpected_count_labels[condition_key] = f"unexpected_count_{idx}"
+            selects.append(
+                sa.func.sum(sa.case([(unexpected_condition, 1)], else_=0)).label(
+                    unexpected_count_labels[condition_key]
+                )
+            )
+
+        try:
+            count_results: dict = dict(
+                self.engine.execute(
+                    sa.select(selects).select_from(self._table)
+                ).fetchone()
+            )
+        except Exception as e:
+            logger.warning(
+                "Unable to evaluate column map expectations with a single query; falling back to one query per "
+                "expectation: %s" % str(e)
+            )
+            return {}
+
+        return {
+            condition_key: {
+                "element_count": count_results["element_count"],
+                "null_count": count_results[null_count_labels[condition_key[1]]],
+                "unexpected_count": count_results[unexpected_count_label],
+            }
+            for condition_key, unexpected_count_label in unexpected_count_labels.items()
+        }
+
     def _get_count_query_mssql(
         self,
         expected_condition: BinaryExpression,
@@ -468,6 +858,18 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
         if table_name is None:
             raise ValueError("No table_name provided.")
 
+        # When set, the column map expectations of a validation run are counted with a single query
+        self.fuse_column_map_queries = kwargs.pop("fuse_column_map_queries", True)
+        self._fused_column_map_count_results = {}
+        # When set, the aggregate metrics needed by a validation run are computed up front with a single query
+        self.plan_aggregate_metrics = kwargs.pop("plan_aggregate_metrics", True)
+        self._planned_aggregate_metrics = {}
+        # When set, unique value counts, medians and quantiles are approximated within this relative error, with
+        # the native sketch functions of the database or with sketches computed from a streamed scan
+        self.approximate_relative_error = get_approximate_metrics_relative_error(
+            kwargs.pop("approximate_metrics", False)
+        )
+
         if engine is None and connection_string is None:
             raise ValueError("Engine or connection_string must be provided.")
 
@@ -646,8 +1048,325 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
             ),
         )
 
+    # Dialects that support TABLESAMPLE BERNOULLI, and whether they accept a REPEATABLE seed
+    _tablesample_dialects = {
+        "postgresql": True,
+        "snowflake": True,
+        "presto": False,
+        "awsathena": False,
+    }
+
+    def _get_validation_sample(self, sample_fraction, sample_seed):
+        """Draw a random sample of the table into a temporary table.
+
+        Dialects that support it sample with TABLESAMPLE BERNOULLI. Others keep the rows whose key (see
+        _get_sample_row_key), mixed with the seed, falls below the sample fraction: this spreads the sample over the
+        whole table, unlike the head-of-table batches given by the limit and offset batch_kwargs.
+        """
+        dialect_name = self.sql_engine_dialect.name.lower()
+        columns = [sa.column(column["name"]) for column in self.columns]
+        if dialect_name in self._tablesample_dialects:
+            if not self._tablesample_dialects[dialect_name]:
+                sample_seed = None
+            query = sa.select(columns).select_from(
+                sa.tablesample(
+                    self._table,
+                    sa.func.bernoulli(sample_fraction * 100),
+                    seed=sa.literal(sample_seed) if sample_seed is not None else None,
+                )
+            )
+            method = "TABLESAMPLE BERNOULLI"
+            reproducible = sample_seed is not None
+        else:
+            row_key, reproducible = self._get_sample_row_key()
+            keyed_rows = (
+                sa.select(columns + [row_key.label("ge_row_key")])
+                .select_from(self._table)
+                .alias("ge_keyed_rows")
+            )
+            row_hash = self._get_row_hash(keyed_rows.c.ge_row_key, sample_seed)
+            query = sa.select(
+                [keyed_rows.c[column["name"]] for column in self.columns]
+            ).where(row_hash < int(sample_fraction * 2 ** 31))
+            method = "hash filter"
+        custom_sql = str(
+            query.compile(
+                dialect=self.sql_engine_dialect, compile_kwargs={"literal_binds": True}
+            )
+        )
+
+        table_name = None
+        if dialect_name == "snowflake":
+            # Snowflake keeps the sample in a transient table, which must be named
+            table_name = f"ge_tmp_sample_{str(uuid.uuid4())[:8]}"
+        sample = self.__class__(
+            table_name=table_name,
+            engine=self.engine,
+            custom_sql=custom_sql,
+            fuse_column_map_queries=self.fuse_column_map_queries,
+            plan_aggregate_metrics=self.plan_aggregate_metrics,
+            approximate_metrics=self.approximate_relative_error or False,
+            batch_kwargs=self.batch_kwargs,
+            batch_markers=self.batch_markers,
+            batch_parameters=self.batch_parameters,
+        )
+        return (
+            sample,
+            {"method": method, "seed": sample_seed, "reproducible": reproducible},
+        )
+
+    def _get_sample_row_key(self):
+        """Return an integer expression identifying the rows of the table, for the hash filter sample, and whether
+        it identifies the same rows each time the table is read.
+
+        Rows are identified by their integer primary key, by their number in the order of a composite or
+        non-integer primary key, or by the rowid of SQLite tables. Without any of these, rows are numbered in the
+        order they are read, so the same seed may not draw the same sample again: ordering by all the columns
+        instead would sort the whole table.
+        """
+        dialect_name = self.sql_engine_dialect.name.lower()
+        try:
+            insp = reflection.Inspector.from_engine(self.engine)
+            primary_key = insp.get_pk_constraint(
+                self._table.name, schema=self._table.schema
+            ).get("constrained_columns")
+            is_view = self._table.name in insp.get_view_names(schema=self._table.schema)
+        except Exception as e:
+            logger.debug("Unable to reflect the primary key of the table: %s" % str(e))
+            primary_key = None
+            is_view = True
+
+        if primary_key:
+            column_types = {column["name"]: column["type"] for column in self.columns}
+            if len(primary_key) == 1 and isinstance(
+                column_types.get(primary_key[0]), sa.Integer
+            ):
+                return sa.column(primary_key[0]), True
+            return (
+                sa.func.row_number().over(
+                    order_by=[sa.column(column) for column in primary_key]
+                ),
+                True,
+            )
+        if dialect_name == "sqlite" and not is_view:
+            return sa.column("rowid"), True
+        if dialect_name == "mssql":
+            # mssql requires an order for row numbers
+            return sa.func.row_number().over(order_by=sa.text("(SELECT NULL)")), False
+        return sa.func.row_number().over(), False
+
+    @staticmethod
+    def _get_row_hash(row_key, seed):
+        """Return an expression mixing an integer row key with a seed into a hash in [0, 2 ** 31).
+
+        Every step is a bijection modulo 2 ** 31 that only needs integer multiplication, addition and modulo, so the
+        hash is portable across dialects; x * (2x + 1) is the nonlinear step, and no intermediate value exceeds
+        2 ** 63.
+        """
+        modulus = 2 ** 31
+        seed = seed % modulus
+        # The key is brought into [0, 2 ** 31) first; the modulo of a negative key is negative in most dialects
+        row_hash = (
+            ((row_key % modulus) + modulus) % modulus * 2654435761 + seed
+        ) % modulus
+        for _ in range(3):
+            row_hash = (row_hash * (row_hash * 2 + 1)) % modulus
+            row_hash = (row_hash * 2246822519 + seed) % modulus
+        return row_hash
+
+    # Aggregate metrics that can be resolved ahead of a validation run, by the expectations that need them. Every
+    # column aggregate expectation also needs the row count and the nonnull count of its column.
+    _planned_aggregate_metrics_by_expectation = {
+        "expect_table_row_count_to_be_between": [],
+        "expect_table_row_count_to_equal": [],
+        "expect_column_distinct_values_to_be_in_set": [],
+        "expect_column_distinct_values_to_equal_set": [],
+        "expect_column_distinct_values_to_contain_set": [],
+        "expect_column_mean_to_be_between": ["get_column_mean"],
+        "expect_column_median_to_be_between": [],
+        "expect_column_quantile_values_to_be_between": [],
+        "expect_column_stdev_to_be_between": ["get_column_stdev"],
+        "expect_column_unique_value_count_to_be_between": ["get_column_unique_count"],
+        "expect_column_proportion_of_unique_values_to_be_between": [
+            "get_column_unique_count"
+        ],
+        "expect_column_most_common_value_to_be_in_set": [],
+        "expect_column_sum_to_be_between": ["get_column_sum"],
+        "expect_column_min_to_be_between": ["get_column_min"],
+        "expect_column_max_to_be_between": ["get_column_max"],
+        "expect_column_chisquare_test_p_value_to_be_greater_than": [],
+        "expect_column_kl_divergence_to_be_less_than": [],
+    }
+
+    def _prepare_validation(self, expectations, evaluation_parameters):
+        super()._prepare_validation(expectations, evaluation_parameters)
+        if self.plan_aggregate_metrics:
+            self._planned_aggregate_metrics = self._get_planned_aggregate_metrics(
+                expectations
+            )
+
+    def _finish_validation(self):
+        super()._finish_validation()
+        self._planned_aggregate_metrics = {}
+        self._clear_prefetched_metrics()
+
+    def _prepare_profiling(self, columns):
+        super()._prepare_profiling(columns)
+        if self.plan_aggregate_metrics:
+            metric_keys = [("get_row_count", None)]
+            for column in columns:
+                metric_keys.append(("get_column_nonnull_count", column))
+                metric_keys.append(("get_column_unique_count", column))
+            self._planned_aggregate_metrics = self._resolve_aggregate_metrics(
+                metric_keys
+            )
+
+    def _finish_profiling(self):
+        super()._finish_profiling()
+        self._planned_aggregate_metrics = {}
+        self._clear_prefetched_metrics()
+
+    def _get_aggregate_metric_expression(self, metric, column=None):
+        if metric == "get_row_count":
+            return sa.func.count()
+        elif metric == "get_column_nonnull_count":
+            return sa.func.count(sa.column(column))
+        elif metric == "get_column_sum":
+            return sa.func.sum(sa.column(column))
+        elif metric == "get_column_max":
+            return sa.func.max(sa.column(column))
+        elif metric == "get_column_min":
+            return sa.func.min(sa.column(column))
+        elif metric == "get_column_mean":
+            return sa.func.avg(sa.column(column))
+        elif metric == "get_column_unique_count":
+            if self.approximate_relative_error is not None:
+                return self._get_approximate_count_distinct_expression(column)[0]
+            return sa.func.count(sa.func.distinct(sa.column(column)))
+        elif metric == "get_column_stdev":
+            if self.sql_engine_dialect.name.lower() == "mssql":
+                return sa.func.stdev(sa.column(column))
+            return sa.func.stddev_samp(sa.column(column))
+        raise ValueError(f"Unrecognized aggregate metric: {metric}")
+
+    def _get_planned_aggregate_metrics(self, expectations) -> Dict[tuple, object]:
+        """Compute the aggregate metrics needed by the expectations of a validation run with a single query.
+
+        The metrics are returned by the getters (get_row_count, get_column_min, ...) for the duration of the run,
+        so each aggregate expectation reads them instead of issuing its own query.
+
+        Returns:
+            dict mapping (getter name, column) to the value of the metric
+        """
+        metric_keys = []
+        for expectation in expectations:
+            if (
+                expectation.expectation_type
+                not in self._planned_aggregate_metrics_by_expectation
+            ):
+                continue
+            metric_keys.append(("get_row_count", None))
+            column = expectation.kwargs.get("column")
+            if column is None:
+                continue
+            if not isinstance(column, str):
+                # An evaluation parameter; leave the metrics to the getters
+                continue
+            metric_keys.append(("get_column_nonnull_count", column))
+            for metric in self._planned_aggregate_metrics_by_expectation[
+                expectation.expectation_type
+            ]:
+                if metric in [
+                    "get_column_min",
+                    "get_column_max",
+                ] and expectation.kwargs.get("parse_strings_as_datetimes"):
+                    continue
+                metric_keys.append((metric, column))
+        # Keep the order of first appearance so that the query is deterministic
+        return self._resolve_aggregate_metrics(list(dict.fromkeys(metric_keys)))
+
+    def _resolve_aggregate_metrics(self, metric_keys) -> Dict[tuple, object]:
+        """Compute the given (getter name, column) metrics with a single query.
+
+        If the single query fails, for example because one of the columns does not support an aggregate, the
+        metrics are computed with one query per column and the columns that still fail are left to the getters.
+        """
+        # Metrics kept in the metric cache are read from it with a single lookup, and only the others are computed
+        cached_metrics = self._prefetch_cached_metrics(
+            [
+                (metric, (column,) if column is not None else ())
+                for metric, column in metric_keys
+            ]
+        )
+        metric_keys = [
+            (metric, column)
+            for metric, column in metric_keys
+            if (metric, (column,) if column is not None else ()) not in cached_metrics
+        ]
+        if self.approximate_relative_error is not None:
+            # Unique value counts approximated with a sketch need a scan of their own
+            metric_keys = [
+                (metric, column)
+                for metric, column in metric_keys
+                if metric != "get_column_unique_count"
+                or self._get_approximate_count_distinct_expression(column)[0]
+                is not None
+            ]
+        if len(metric_keys) == 0:
+            return {}
+
+        try:
+            return self._get_aggregate_metric_values(metric_keys)
+        except Exception as e:
+            logger.debug(
+                "Unable to compute aggregate metrics with a single query; falling back to one query per column: %s"
+                % str(e)
+            )
+
+        metric_keys_by_column: Dict[str, List[tuple]] = {}
+        for metric_key in metric_keys:
+            metric_keys_by_column.setdefault(metric_key[1], []).append(metric_key)
+        planned_aggregate_metrics = {}
+        for column, column_metric_keys in metric_keys_by_column.items():
+            try:
+                planned_aggregate_metrics.update(
+                    self._get_aggregate_metric_values(column_metric_keys)
+                )
+            except Exception as e:
+                logger.debug(
+                    "Unable to compute aggregate metrics for column %s: %s"
+                    % (column, str(e))
+                )
+        return planned_aggregate_metrics
+
+    def _get_aggregate_metric_values(self, metric_keys) -> Dict[tuple, object]:
+        query = sa.select(
+            [
+                self._get_aggregate_metric_expression(metric, column).label(
+                    f"metric_{idx}"
+                )
+                for idx, (metric, column) in enumerate(metric_keys)
+            ]
+        ).select_from(self._table)
+        row = self.engine.execute(query).fetchone()
+
+        metric_values = {}
+        for idx, metric_key in enumerate(metric_keys):
+            value = row[idx]
+            # Match the types returned by the individual getters
+            if metric_key[0] in ["get_row_count", "get_column_nonnull_count"]:
+                value = int(value or 0)
+            elif metric_key[0] == "get_column_stdev":
+                if value is None:
+                    continue
+                value = float(value)
+            metric_values[metric_key] = value
+        return metric_values
+
     def get_row_count(self, table_name=None):
         if table_name is None:
+            if ("get_row_count", None) in self._planned_aggregate_metrics:
+                return self._planned_aggregate_metrics[("get_row_count", None)]
             table_name = self._table
         else:
             table_name = sa.table(table_name)
@@ -661,6 +1380,8 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
         return [col["name"] for col in self.columns]
 
     def get_column_nonnull_count(self, column):
+        if ("get_column_nonnull_count", column) in self._planned_aggregate_metrics:
+            return self._planned_aggregate_metrics[("get_column_nonnull_count", column)]
         ignore_values = [None]
         count_query = sa.select(
             [
@@ -691,6 +1412,8 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
         return element_count - null_count
 
     def get_column_sum(self, column):
+        if ("get_column_sum", column) in self._planned_aggregate_metrics:
+            return self._planned_aggregate_metrics[("get_column_sum", column)]
         return self.engine.execute(
             sa.select([sa.func.sum(sa.column(column))]).select_from(self._table)
         ).scalar()
@@ -698,6 +1421,8 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
     def get_column_max(self, column, parse_strings_as_datetimes=False):
         if parse_strings_as_datetimes:
             raise NotImplementedError
+        if ("get_column_max", column) in self._planned_aggregate_metrics:
+            return self._planned_aggregate_metrics[("get_column_max", column)]
         return self.engine.execute(
             sa.select([sa.func.max(sa.column(column))]).select_from(self._table)
         ).scalar()
@@ -705,6 +1430,8 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
     def get_column_min(self, column, parse_strings_as_datetimes=False):
         if parse_strings_as_datetimes:
             raise NotImplementedError
+        if ("get_column_min", column) in self._planned_aggregate_metrics:
+            return self._planned_aggregate_metrics[("get_column_min", column)]
         return self.engine.execute(
             sa.select([sa.func.min(sa.column(column))]).select_from(self._table)
         ).scalar()
@@ -743,18 +1470,179 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
         return series
 
     def get_column_mean(self, column):
+        if ("get_column_mean", column) in self._planned_aggregate_metrics:
+            return self._planned_aggregate_metrics[("get_column_mean", column)]
         return self.engine.execute(
             sa.select([sa.func.avg(sa.column(column))]).select_from(self._table)
         ).scalar()
 
     def get_column_unique_count(self, column):
+        if self.approximate_relative_error is not None:
+            return self._get_approximate_column_unique_count(column)
+        if ("get_column_unique_count", column) in self._planned_aggregate_metrics:
+            return self._planned_aggregate_metrics[("get_column_unique_count", column)]
         return self.engine.execute(
             sa.select([sa.func.count(sa.func.distinct(sa.column(column)))]).select_from(
                 self._table
             )
         ).scalar()
 
+    # Native sketch-based aggregate functions, by dialect, used for approximate metrics
+    _approximate_count_distinct_functions = {
+        "presto": "approx_distinct",
+        "awsathena": "approx_distinct",
+        "snowflake": "approx_count_distinct",
+        "bigquery": "approx_count_distinct",
+        "mssql": "approx_count_distinct",
+    }
+    _approximate_percentile_functions = {
+        "presto": "approx_percentile",
+        "awsathena": "approx_percentile",
+        "snowflake": "approx_percentile",
+    }
+    # The number of rows fetched at a time when a sketch is computed from a scan of a column
+    sketch_scan_batch_size = 10000
+
+    def _get_approximate_count_distinct_expression(self, column):
+        """Return the native approximate count of distinct values of a column and its relative standard error.
+
+        The relative error is None when it is set by the database. Returns (None, None) if the dialect has no
+        approximate count distinct function.
+        """
+        function_name = self._approximate_count_distinct_functions.get(
+            self.sql_engine_dialect.name.lower()
+        )
+        if function_name is None:
+            return None, None
+        if function_name == "approx_distinct":
+            # Presto accepts a maximum standard error between 0.0040625 and 0.26
+            relative_error = min(max(self.approximate_relative_error, 0.0040625), 0.26)
+            return (
+                sa.func.approx_distinct(sa.column(column), relative_error),
+                relative_error,
+            )
+        return getattr(sa.func, function_name)(sa.column(column)), None
+
+    def _get_approximate_column_unique_count(self, column):
+        expression, relative_error = self._get_approximate_count_distinct_expression(
+            column
+        )
+        if expression is not None:
+            approximation = {
+                "method": expression.name,
+                "relative_error": relative_error,
+            }
+            if ("get_column_unique_count", column) in self._planned_aggregate_metrics:
+                self._metric_approximations[
+                    ("get_column_unique_count", column)
+                ] = approximation
+                return self._planned_aggregate_metrics[
+                    ("get_column_unique_count", column)
+                ]
+            try:
+                unique_count = self.engine.execute(
+                    sa.select([expression]).select_from(self._table)
+                ).scalar()
+                self._metric_approximations[
+                    ("get_column_unique_count", column)
+                ] = approximation
+                return unique_count
+            except SQLAlchemyError as e:
+                logger.debug(
+                    "Unable to approximate the unique count of column %s natively; falling back to a sketch: %s"
+                    % (column, str(e))
+                )
+
+        sketch = self._get_column_sketch(
+            column, HyperLogLog.for_relative_error(self.approximate_relative_error)
+        )
+        self._metric_approximations[("get_column_unique_count", column)] = {
+            "method": "HyperLogLog",
+            "relative_error": sketch.relative_error,
+        }
+        return sketch.count()
+
+    def _get_native_approximate_column_quantiles(self, column, quantiles):
+        """Return the quantiles of a column computed with the native approximate percentile function of the
+        database, or None if the dialect has no such function or it fails."""
+        function_name = self._approximate_percentile_functions.get(
+            self.sql_engine_dialect.name.lower()
+        )
+        if function_name is None:
+            return None
+        query = sa.select(
+            [
+                getattr(sa.func, function_name)(sa.column(column), float(quantile))
+                for quantile in quantiles
+            ]
+        ).select_from(self._table)
+        try:
+            return list(self.engine.execute(query).fetchone())
+        except SQLAlchemyError as e:
+            logger.debug(
+                "Unable to approximate the quantiles of column %s natively; falling back to a sketch: %s"
+                % (column, str(e))
+            )
+            return None
+
+    def _get_column_quantile_sketch(self, column):
+        # Counting the values first would take a scan of its own, so the sketch is sized from the nonnull count
+        # only when a validation run has already planned it
+        return self._get_column_sketch(
+            column,
+            QuantileSketch.for_relative_error(
+                self.approximate_relative_error,
+                self._planned_aggregate_metrics.get(
+                    ("get_column_nonnull_count", column)
+                ),
+            ),
+        )
+
+    def _get_approximate_column_quantiles(self, column, quantiles, getter_name):
+        quantile_values = self._get_native_approximate_column_quantiles(
+            column, quantiles
+        )
+        if quantile_values is not None:
+            self._metric_approximations[(getter_name, column)] = {
+                "method": self._approximate_percentile_functions[
+                    self.sql_engine_dialect.name.lower()
+                ],
+                "relative_error": None,
+            }
+            return quantile_values
+
+        sketch = self._get_column_quantile_sketch(column)
+        self._metric_approximations[(getter_name, column)] = {
+            "method": "QuantileSketch",
+            "relative_error": sketch.relative_error,
+        }
+        if sketch.count == 0:
+            return [None for _ in quantiles]
+        if getter_name == "get_column_median":
+            return [sketch.median()]
+        return sketch.quantiles(quantiles)
+
+    def _get_column_sketch(self, column, sketch):
+        """Add the nonnull values of a column to a sketch, reading them with a single streamed scan."""
+        query = (
+            sa.select([sa.column(column)])
+            .where(sa.column(column) != None)
+            .select_from(self._table)
+        )
+        with self.engine.connect() as connection:
+            result = connection.execution_options(stream_results=True).execute(query)
+            while True:
+                rows = result.fetchmany(self.sketch_scan_batch_size)
+                if not rows:
+                    break
+                sketch.update(pd.Series([row[0] for row in rows]))
+        return sketch
+
     def get_column_median(self, column):
+        if self.approximate_relative_error is not None:
+            return self._get_approximate_column_quantiles(
+                column, [0.5], "get_column_median"
+            )[0]
         # AWS Athena does not support offset
         if self.sql_engine_dialect.name.lower() == "awsathena":
             raise NotImplementedError("AWS Athena does not support OFFSET.")
@@ -789,6 +1677,10 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
     def get_column_quantiles(
         self, column: str, quantiles: Iterable, allow_relative_error: bool = False
     ) -> list:
+        if self.approximate_relative_error is not None:
+            return self._get_approximate_column_quantiles(
+                column, quantiles, "get_column_quantiles"
+            )
         if self.sql_engine_dialect.name.lower() == "mssql":
             return self._get_column_quantiles_mssql(column=column, quantiles=quantiles)
         elif self.sql_engine_dialect.name.lower() == "bigquery":
@@ -947,6 +1839,8 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
                 )
 
     def get_column_stdev(self, column):
+        if ("get_column_stdev", column) in self._planned_aggregate_metrics:
+            return self._planned_aggregate_metrics[("get_column_stdev", column)]
         if self.sql_engine_dialect.name.lower() == "mssql":
             # Note: "stdev_samp" is not a recognized built-in function name (but "stdev" does exist for "mssql").
             # This function is used to compute statistical standard deviation from sample data (per the reference in
@@ -964,6 +1858,27 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
             ).fetchone()
         return float(res[0])
 
+    def _get_column_nonnull_count_and_extrema(self, column):
+        planned_metric_keys = [
+            ("get_column_nonnull_count", column),
+            ("get_column_min", column),
+            ("get_column_max", column),
+        ]
+        if all(key in self._planned_aggregate_metrics for key in planned_metric_keys):
+            return tuple(
+                self._planned_aggregate_metrics[key] for key in planned_metric_keys
+            )
+        nonnull_count, min_, max_ = self.engine.execute(
+            sa.select(
+                [
+                    sa.func.count(sa.column(column)),
+                    sa.func.min(sa.column(column)),
+                    sa.func.max(sa.column(column)),
+                ]
+            ).select_from(self._table)
+        ).fetchone()
+        return int(nonnull_count), min_, max_
+
     def get_column_hist(self, column, bins):
         """return a list of counts corresponding to bins
 
@@ -971,6 +1886,10 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
             column: the name of the column for which to get the histogram
             bins: tuple of bin edges for which to get histogram values; *must* be tuple to support caching
         """
+        hist, _ = self._get_column_hist_and_nonnull_count(column, bins)
+        return hist
+
+    def _get_column_hist_and_nonnull_count(self, column, bins):
         case_conditions = []
         idx = 0
         bins = list(bins)
@@ -1046,15 +1965,16 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
                 ).label("bin_" + str(len(bins) - 1))
             )
 
+        # The non-null values are counted along with the histogram at no extra cost
         query = (
-            sa.select(case_conditions)
+            sa.select(case_conditions + [sa.func.count().label("nonnull_count")])
             .where(sa.column(column) != None,)
             .select_from(self._table)
         )
 
         # Run the data through convert_to_json_serializable to ensure we do not have Decimal types
         hist = convert_to_json_serializable(list(self.engine.execute(query).fetchone()))
-        return hist
+        return hist[:-1], hist[-1]
 
     def get_column_count_in_range(
         self, column, min_val=None, max_val=None, strict_min=False, strict_max=True
@@ -1335,6 +2255,7 @@ WHERE
     def expect_compound_columns_to_be_unique(
         self,
         column_list,
+        mostly=None,
         ignore_row_if="all_values_are_missing",
         result_format=None,
         row_condition=None,
@@ -1343,42 +2264,270 @@ WHERE
         catch_exceptions=None,
         meta=None,
     ):
-        columns = [
-            sa.column(col["name"]) for col in self.columns if col["name"] in column_list
-        ]
-        query = (
-            sa.select([sa.func.count()])
-            .group_by(*columns)
-            .having(sa.func.count() > 1)
+        if row_condition:
+            raise NotImplementedError(
+                "row_condition is not supported by expect_compound_columns_to_be_unique on a SqlAlchemyDataset"
+            )
+
+        if result_format is None:
+            result_format = self.default_expectation_args["result_format"]
+        result_format = parse_result_format(result_format)
+
+        if result_format["result_format"] == "COMPLETE":
+            warnings.warn(
+                "Setting result format to COMPLETE for a SqlAlchemyDataset can be dangerous because it will not limit the number of returned results."
+            )
+            unexpected_count_limit = None
+        else:
+            unexpected_count_limit = result_format["partial_unexpected_count"]
+
+        ignore_row_condition = self._get_multicolumn_ignore_row_condition(
+            column_list=column_list, ignore_row_if=ignore_row_if
+        )
+        # As in pandas, missing values are equal to each other when looking for duplicates, which is also how
+        # GROUP BY treats NULLs.
+        duplicates = (
+            sa.select(
+                [sa.column(column) for column in column_list]
+                + [sa.func.count().label("ge_duplicate_count")]
+            )
             .select_from(self._table)
+            .where(sa.not_(ignore_row_condition))
+            .group_by(*[sa.column(column) for column in column_list])
+            .having(sa.func.count() > 1)
+            .alias("ge_duplicates")
         )
 
-        if ignore_row_if == "all_values_are_missing":
-            query = query.where(sa.and_(*[col != None for col in columns]))
-        elif ignore_row_if == "any_value_is_missing":
-            query = query.where(sa.or_(*[col != None for col in columns]))
-        elif ignore_row_if == "never":
-            pass
+        count_results = dict(
+            self.engine.execute(
+                sa.select(
+                    [
+                        sa.func.count().label("element_count"),
+                        sa.func.sum(
+                            sa.case([(ignore_row_condition, 1)], else_=0)
+                        ).label("null_count"),
+                    ]
+                ).select_from(self._table)
+            ).fetchone()
+        )
+        element_count = int(count_results["element_count"] or 0)
+        nonnull_count = element_count - int(count_results["null_count"] or 0)
+        unexpected_count = int(
+            self.engine.execute(
+                sa.select([sa.func.sum(duplicates.c.ge_duplicate_count)])
+            ).scalar()
+            or 0
+        )
+
+        if unexpected_count == 0 or result_format["result_format"] == "BOOLEAN_ONLY":
+            unexpected_query_results = []
         else:
-            raise ValueError(
-                "ignore_row_if was set to an unexpected value: %s" % ignore_row_if
+            # All the rows of each duplicated group are unexpected; they are matched to the groups with a correlated
+            # subquery so that they are listed in the order of the table, as they are by a PandasDataset.
+            table = sa.Table(
+                self._table.name,
+                sa.MetaData(),
+                *[sa.Column(column) for column in column_list],
+                schema=self._table.schema,
             )
+            unexpected_query_results = self.engine.execute(
+                sa.select([table.c[column] for column in column_list])
+                .where(
+                    sa.exists().where(
+                        sa.and_(
+                            *[
+                                sa.or_(
+                                    duplicates.c[column] == table.c[column],
+                                    sa.and_(
+                                        duplicates.c[column].is_(None),
+                                        table.c[column].is_(None),
+                                    ),
+                                )
+                                for column in column_list
+                            ]
+                        )
+                    )
+                )
+                .limit(unexpected_count_limit)
+            ).fetchall()
+
+        success, percent_success = self._calc_map_expectation_success(
+            nonnull_count - unexpected_count, nonnull_count, mostly
+        )
+
+        return self._format_map_output(
+            result_format,
+            success,
+            element_count,
+            nonnull_count,
+            unexpected_count,
+            [dict(zip(column_list, row)) for row in unexpected_query_results],
+            None,
+            mostly=mostly,
+        )
+
+    @DocInherit
+    @MetaSqlAlchemyDataset.multicolumn_map_expectation
+    def expect_select_column_values_to_be_unique_within_record(
+        self,
+        column_list,
+        mostly=None,
+        ignore_row_if="all_values_are_missing",
+        result_format=None,
+        include_config=True,
+        catch_exceptions=None,
+        meta=None,
+    ):
+        # Missing values are equal to each other, as they are for pandas' nunique(dropna=False)
+        conditions = []
+        for idx, column_name in enumerate(column_list):
+            for other_column_name in column_list[idx + 1 :]:
+                column_A = sa.column(column_name)
+                column_B = sa.column(other_column_name)
+                conditions.append(
+                    sa.or_(
+                        sa.and_(
+                            column_A.isnot(None),
+                            column_B.isnot(None),
+                            column_A != column_B,
+                        ),
+                        sa.and_(column_A.is_(None), column_B.isnot(None)),
+                        sa.and_(column_A.isnot(None), column_B.is_(None)),
+                    )
+                )
+        return sa.and_(*conditions)
+
+    def expect_multicolumn_values_to_be_unique(
+        self,
+        column_list,
+        mostly=None,
+        ignore_row_if="all_values_are_missing",
+        result_format=None,
+        include_config=True,
+        catch_exceptions=None,
+        meta=None,
+    ):
+        deprecation_warning = (
+            "expect_multicolumn_values_to_be_unique is being deprecated. Please use "
+            "expect_select_column_values_to_be_unique_within_record instead."
+        )
+        warnings.warn(
+            deprecation_warning, DeprecationWarning,
+        )
+
+        return self.expect_select_column_values_to_be_unique_within_record(
+            column_list=column_list,
+            mostly=mostly,
+            ignore_row_if=ignore_row_if,
+            result_format=result_format,
+            include_config=include_config,
+            catch_exceptions=catch_exceptions,
+            meta=meta,
+        )
+
+    @DocInherit
+    @MetaSqlAlchemyDataset.multicolumn_map_expectation
+    def expect_multicolumn_sum_to_equal(
+        self,
+        column_list,
+        sum_total,
+        result_format=None,
+        include_config=True,
+        catch_exceptions=None,
+        meta=None,
+    ):
+        # Missing values are skipped by the sum, as they are by pandas
+        return (
+            sum(sa.func.coalesce(sa.column(column), 0) for column in column_list)
+            == sum_total
+        )
+
+    ###
+    ###
+    ###
+    #
+    # Column Pair Map Expectation Implementations
+    #
+    ###
+    ###
+    ###
+
+    @DocInherit
+    @MetaSqlAlchemyDataset.column_pair_map_expectation
+    def expect_column_pair_values_to_be_equal(
+        self,
+        column_A,
+        column_B,
+        ignore_row_if="both_values_are_missing",
+        result_format=None,
+        include_config=True,
+        catch_exceptions=None,
+        meta=None,
+    ):
+        # Rows with a missing value that are not ignored are unexpected, as they are for pandas
+        column_A, column_B = sa.column(column_A), sa.column(column_B)
+        return sa.and_(column_A.isnot(None), column_B.isnot(None), column_A == column_B)
+
+    @DocInherit
+    @MetaSqlAlchemyDataset.column_pair_map_expectation
+    def expect_column_pair_values_A_to_be_greater_than_B(
+        self,
+        column_A,
+        column_B,
+        or_equal=None,
+        parse_strings_as_datetimes=None,
+        allow_cross_type_comparisons=None,
+        ignore_row_if="both_values_are_missing",
+        result_format=None,
+        include_config=True,
+        catch_exceptions=None,
+        meta=None,
+    ):
+        if allow_cross_type_comparisons:
+            raise NotImplementedError
 
-        unexpected_count = self.engine.execute(query).fetchone()
+        if parse_strings_as_datetimes:
+            raise NotImplementedError(
+                "parse_strings_as_datetimes is not supported by expect_column_pair_values_A_to_be_greater_than_B "
+                "on a SqlAlchemyDataset"
+            )
 
-        if unexpected_count is None:
-            # This can happen when the condition filters out all rows
-            unexpected_count = 0
+        column_A, column_B = sa.column(column_A), sa.column(column_B)
+        if or_equal:
+            comparison = column_A >= column_B
         else:
-            unexpected_count = unexpected_count[0]
+            comparison = column_A > column_B
+        return sa.and_(column_A.isnot(None), column_B.isnot(None), comparison)
+
+    @DocInherit
+    @MetaSqlAlchemyDataset.column_pair_map_expectation
+    def expect_column_pair_values_to_be_in_set(
+        self,
+        column_A,
+        column_B,
+        value_pairs_set,
+        ignore_row_if="both_values_are_missing",
+        result_format=None,
+        include_config=True,
+        catch_exceptions=None,
+        meta=None,
+    ):
+        if value_pairs_set is None:
+            # vacuously true
+            return BinaryExpression(sa.literal(True), sa.literal(True), custom_op("="))
 
-        total_count_query = sa.select([sa.func.count()]).select_from(self._table)
-        total_count = self.engine.execute(total_count_query).fetchone()[0]
+        def matches(column, value):
+            if value is None:
+                return column.is_(None)
+            return sa.and_(column.isnot(None), column == value)
 
-        return {
-            "success": unexpected_count == 0,
-            "result": {"unexpected_percent": 100.0 * unexpected_count / total_count}
-        }
+        column_A, column_B = sa.column(column_A), sa.column(column_B)
+        return sa.or_(
+            *[
+                sa.and_(matches(column_A, value_A), matches(column_B, value_B))
+                for value_A, value_B in {(x, y) for x, y in value_pairs_set}
+            ]
+        )
 
     ###
     ###
@@ -226,6 +226,98 @@ def continuous_partition_data(data, bins="auto", n_bins=10, **kwargs):
     return {"bins": bin_edges, "weights": hist / len(data)}
 
 
+def get_partition_counts(data, bins):
+    """Count the values of data below, within each bin of, and above a partition with a single pass over the data
+
+    As for numpy histogram, every bin is half-open except the last one, which also holds its right edge. Missing
+    values are not counted.
+
+    Args:
+        data (list-like): The values to count.
+        bins (list-like): The monotonically increasing edges of the partition.
+
+    Returns:
+        A numpy array holding the number of values below bins[0], the number of values in each bin, and the number
+        of values above bins[-1]
+    """
+    data = np.asarray(data)
+    data = data[~pd.isnull(data)]
+    bins = np.asarray(bins)
+    codes = np.searchsorted(bins, data, side="right")
+    codes[data == bins[-1]] = len(bins) - 1
+    return np.bincount(codes, minlength=len(bins) + 1)
+
+
+def get_bootstrapped_ks_test_pass_count(
+    data, cdf, p, bootstrap_samples, bootstrap_sample_size
+):
+    """Count the bootstrap samples of data whose one-sample Kolmogorov-Smirnov test against a cdf has a p-value of
+    at least p
+
+    All the bootstrap samples are drawn as the rows of a 2-D array, which is sorted along its rows so that the test
+    statistics of every sample are computed at once. The samples are drawn in batches of about a million values to
+    bound memory use; np.random.choice draws the same samples as it would one at a time. Since p-values decrease as
+    the statistic grows, only the p-values of the O(log(bootstrap_samples)) sorted statistics visited by a binary
+    search are computed, and the count is that of calling stats.kstest on each sample.
+
+    Args:
+        data (list-like): The values to sample from.
+        cdf (callable): The vectorized cdf to test the samples against.
+        p (float): The p-value threshold.
+        bootstrap_samples (int): The number of bootstrap samples.
+        bootstrap_sample_size (int): The number of values in each bootstrap sample.
+
+    Returns:
+        The number of bootstrap samples whose two-sided test has a p-value of at least p
+    """
+    if not hasattr(stats, "kstwo"):
+        # scipy before 1.4 has no distribution of the exact two-sided statistic to evaluate the tests with
+        return sum(
+            stats.kstest(np.random.choice(data, size=bootstrap_sample_size), cdf)[1]
+            >= p
+            for _ in range(bootstrap_samples)
+        )
+
+    data = np.asarray(data)
+    ecdf_after_values = (
+        np.arange(1.0, bootstrap_sample_size + 1) / bootstrap_sample_size
+    )
+    ecdf_before_values = np.arange(0.0, bootstrap_sample_size) / bootstrap_sample_size
+    batch_size = max(1, 1000000 // bootstrap_sample_size)
+    statistics = []
+    for start in range(0, bootstrap_samples, batch_size):
+        samples = np.sort(
+            np.random.choice(
+                data,
+                size=(
+                    min(batch_size, bootstrap_samples - start),
+                    bootstrap_sample_size,
+                ),
+            ),
+            axis=1,
+        )
+        cdf_values = cdf(samples)
+        statistics.append(
+            np.maximum(
+                (ecdf_after_values - cdf_values).max(axis=1),
+                (cdf_values - ecdf_before_values).max(axis=1),
+            )
+        )
+    statistics = np.sort(np.concatenate(statistics))
+
+    low, high = 0, len(statistics)
+    while low < high:
+        middle = (low + high) // 2
+        p_value = np.clip(
+            stats.kstwo.sf(statistics[middle], bootstrap_sample_size), 0, 1
+        )
+        if p_value >= p:
+            low = middle + 1
+        else:
+            high = middle
+    return low
+
+
 def build_continuous_partition_object(
     dataset, column, bins="auto", n_bins=10, allow_relative_error=False
 ):
@@ -253,15 +345,9 @@ def build_continuous_partition_object(
 
             See :ref:`partition_object`.
     """
-    bins = dataset.get_column_partition(column, bins, n_bins, allow_relative_error)
-    if isinstance(bins, np.ndarray):
-        bins = bins.tolist()
-    else:
-        bins = list(bins)
-    weights = list(
-        np.array(dataset.get_column_hist(column, tuple(bins)))
-        / dataset.get_column_nonnull_count(column)
-    )
+    histogram = dataset.get_column_histogram(column, bins, n_bins, allow_relative_error)
+    bins = histogram["bins"]
+    weights = list(np.array(histogram["hist"]) / histogram["nonnull_count"])
     tail_weights = (1 - sum(weights)) / 2
     partition_object = {
         "bins": bins,
@@ -600,6 +686,34 @@ def create_multiple_expectations(df, columns, expectation_type, *args, **kwargs)
     return results
 
 
+# The relative error of approximate metrics when a dataset is created with approximate_metrics=True
+DEFAULT_APPROXIMATE_METRICS_RELATIVE_ERROR = 0.01
+
+
+def get_approximate_metrics_relative_error(approximate_metrics) -> Union[float, None]:
+    """Return the relative error allowed by the approximate_metrics setting of a dataset.
+
+    Args:
+        approximate_metrics: False (or None) for exact metrics, True for the default relative error, or a \
+            relative error between 0 and 1
+
+    Returns:
+        The relative error, or None if the metrics are to be computed exactly
+    """
+    if approximate_metrics is None or approximate_metrics is False:
+        return None
+    if approximate_metrics is True:
+        return DEFAULT_APPROXIMATE_METRICS_RELATIVE_ERROR
+    if (
+        not isinstance(approximate_metrics, (int, float))
+        or not 0 < approximate_metrics < 1
+    ):
+        raise ValueError(
+            "approximate_metrics must be True, False or a relative error between 0 and 1."
+        )
+    return float(approximate_metrics)
+
+
 def get_approximate_percentile_disc_sql(selects: List, sql_engine_dialect: Any) -> str:
     return ", ".join(
         [
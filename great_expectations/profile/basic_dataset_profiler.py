@@ -141,188 +141,195 @@ class BasicDatasetProfiler(BasicDatasetProfilerBase):
         for column in columns:
             meta_columns[column] = {"description": ""}
 
-        number_of_columns = len(columns)
-        for i, column in enumerate(columns):
-            logger.info(
-                "            Preparing column {} of {}: {}".format(
-                    i + 1, number_of_columns, column
+        # Let the dataset compute the metrics used to infer column cardinality for all columns at once
+        df._prepare_profiling(columns)
+        try:
+            number_of_columns = len(columns)
+            for i, column in enumerate(columns):
+                logger.info(
+                    "            Preparing column {} of {}: {}".format(
+                        i + 1, number_of_columns, column
+                    )
                 )
-            )
 
-            # df.expect_column_to_exist(column)
-
-            type_ = cls._get_column_type(df, column)
-            cardinality = cls._get_column_cardinality(df, column)
-            df.expect_column_values_to_not_be_null(
-                column, mostly=0.5
-            )  # The renderer will show a warning for columns that do not meet this expectation
-            df.expect_column_values_to_be_in_set(column, [], result_format="SUMMARY")
-
-            if type_ == ProfilerDataType.INT:
-                if cardinality == ProfilerCardinality.UNIQUE:
-                    df.expect_column_values_to_be_unique(column)
-                elif cardinality in [
-                    ProfilerCardinality.ONE,
-                    ProfilerCardinality.TWO,
-                    ProfilerCardinality.VERY_FEW,
-                    ProfilerCardinality.FEW,
-                ]:
-                    df.expect_column_distinct_values_to_be_in_set(
-                        column, value_set=None, result_format="SUMMARY"
-                    )
-                elif cardinality in [
-                    ProfilerCardinality.MANY,
-                    ProfilerCardinality.VERY_MANY,
-                    ProfilerCardinality.UNIQUE,
-                ]:
-                    df.expect_column_min_to_be_between(
-                        column, min_value=None, max_value=None
-                    )
-                    df.expect_column_max_to_be_between(
-                        column, min_value=None, max_value=None
-                    )
-                    df.expect_column_mean_to_be_between(
-                        column, min_value=None, max_value=None
-                    )
-                    df.expect_column_median_to_be_between(
-                        column, min_value=None, max_value=None
-                    )
-                    df.expect_column_stdev_to_be_between(
-                        column, min_value=None, max_value=None
-                    )
-                    df.expect_column_quantile_values_to_be_between(
-                        column,
-                        quantile_ranges={
-                            "quantiles": [0.05, 0.25, 0.5, 0.75, 0.95],
-                            "value_ranges": [
-                                [None, None],
-                                [None, None],
-                                [None, None],
-                                [None, None],
-                                [None, None],
-                            ],
-                        },
-                    )
-                    df.expect_column_kl_divergence_to_be_less_than(
-                        column,
-                        partition_object=None,
-                        threshold=None,
-                        result_format="COMPLETE",
-                    )
-                else:  # unknown cardinality - skip
-                    pass
-            elif type_ == ProfilerDataType.FLOAT:
-                if cardinality == ProfilerCardinality.UNIQUE:
-                    df.expect_column_values_to_be_unique(column)
-
-                elif cardinality in [
-                    ProfilerCardinality.ONE,
-                    ProfilerCardinality.TWO,
-                    ProfilerCardinality.VERY_FEW,
-                    ProfilerCardinality.FEW,
-                ]:
-                    df.expect_column_distinct_values_to_be_in_set(
-                        column, value_set=None, result_format="SUMMARY"
-                    )
+                # df.expect_column_to_exist(column)
+
+                type_ = cls._get_column_type(df, column)
+                cardinality = cls._get_column_cardinality(df, column)
+                df.expect_column_values_to_not_be_null(
+                    column, mostly=0.5
+                )  # The renderer will show a warning for columns that do not meet this expectation
+                df.expect_column_values_to_be_in_set(
+                    column, [], result_format="SUMMARY"
+                )
 
-                elif cardinality in [
-                    ProfilerCardinality.MANY,
-                    ProfilerCardinality.VERY_MANY,
-                    ProfilerCardinality.UNIQUE,
-                ]:
+                if type_ == ProfilerDataType.INT:
+                    if cardinality == ProfilerCardinality.UNIQUE:
+                        df.expect_column_values_to_be_unique(column)
+                    elif cardinality in [
+                        ProfilerCardinality.ONE,
+                        ProfilerCardinality.TWO,
+                        ProfilerCardinality.VERY_FEW,
+                        ProfilerCardinality.FEW,
+                    ]:
+                        df.expect_column_distinct_values_to_be_in_set(
+                            column, value_set=None, result_format="SUMMARY"
+                        )
+                    elif cardinality in [
+                        ProfilerCardinality.MANY,
+                        ProfilerCardinality.VERY_MANY,
+                        ProfilerCardinality.UNIQUE,
+                    ]:
+                        df.expect_column_min_to_be_between(
+                            column, min_value=None, max_value=None
+                        )
+                        df.expect_column_max_to_be_between(
+                            column, min_value=None, max_value=None
+                        )
+                        df.expect_column_mean_to_be_between(
+                            column, min_value=None, max_value=None
+                        )
+                        df.expect_column_median_to_be_between(
+                            column, min_value=None, max_value=None
+                        )
+                        df.expect_column_stdev_to_be_between(
+                            column, min_value=None, max_value=None
+                        )
+                        df.expect_column_quantile_values_to_be_between(
+                            column,
+                            quantile_ranges={
+                                "quantiles": [0.05, 0.25, 0.5, 0.75, 0.95],
+                                "value_ranges": [
+                                    [None, None],
+                                    [None, None],
+                                    [None, None],
+                                    [None, None],
+                                    [None, None],
+                                ],
+                            },
+                        )
+                        df.expect_column_kl_divergence_to_be_less_than(
+                            column,
+                            partition_object=None,
+                            threshold=None,
+                            result_format="COMPLETE",
+                        )
+                    else:  # unknown cardinality - skip
+                        pass
+                elif type_ == ProfilerDataType.FLOAT:
+                    if cardinality == ProfilerCardinality.UNIQUE:
+                        df.expect_column_values_to_be_unique(column)
+
+                    elif cardinality in [
+                        ProfilerCardinality.ONE,
+                        ProfilerCardinality.TWO,
+                        ProfilerCardinality.VERY_FEW,
+                        ProfilerCardinality.FEW,
+                    ]:
+                        df.expect_column_distinct_values_to_be_in_set(
+                            column, value_set=None, result_format="SUMMARY"
+                        )
+
+                    elif cardinality in [
+                        ProfilerCardinality.MANY,
+                        ProfilerCardinality.VERY_MANY,
+                        ProfilerCardinality.UNIQUE,
+                    ]:
+                        df.expect_column_min_to_be_between(
+                            column, min_value=None, max_value=None
+                        )
+                        df.expect_column_max_to_be_between(
+                            column, min_value=None, max_value=None
+                        )
+                        df.expect_column_mean_to_be_between(
+                            column, min_value=None, max_value=None
+                        )
+                        df.expect_column_median_to_be_between(
+                            column, min_value=None, max_value=None
+                        )
+                        df.expect_column_quantile_values_to_be_between(
+                            column,
+                            quantile_ranges={
+                                "quantiles": [0.05, 0.25, 0.5, 0.75, 0.95],
+                                "value_ranges": [
+                                    [None, None],
+                                    [None, None],
+                                    [None, None],
+                                    [None, None],
+                                    [None, None],
+                                ],
+                            },
+                        )
+                        df.expect_column_kl_divergence_to_be_less_than(
+                            column,
+                            partition_object=None,
+                            threshold=None,
+                            result_format="COMPLETE",
+                        )
+                    else:  # unknown cardinality - skip
+                        pass
+
+                elif type_ == ProfilerDataType.STRING:
+                    # Check for leading and trailing whitespace.
+                    #!!! It would be nice to build additional Expectations here, but
+                    #!!! the default logic for remove_expectations prevents us.
+                    df.expect_column_values_to_not_match_regex(column, r"^\s+|\s+$")
+
+                    if cardinality == ProfilerCardinality.UNIQUE:
+                        df.expect_column_values_to_be_unique(column)
+
+                    elif cardinality in [
+                        ProfilerCardinality.ONE,
+                        ProfilerCardinality.TWO,
+                        ProfilerCardinality.VERY_FEW,
+                        ProfilerCardinality.FEW,
+                    ]:
+                        df.expect_column_distinct_values_to_be_in_set(
+                            column, value_set=None, result_format="SUMMARY"
+                        )
+                    else:
+                        pass
+
+                elif type_ == ProfilerDataType.DATETIME:
                     df.expect_column_min_to_be_between(
                         column, min_value=None, max_value=None
                     )
+
                     df.expect_column_max_to_be_between(
                         column, min_value=None, max_value=None
                     )
-                    df.expect_column_mean_to_be_between(
-                        column, min_value=None, max_value=None
-                    )
-                    df.expect_column_median_to_be_between(
-                        column, min_value=None, max_value=None
-                    )
-                    df.expect_column_quantile_values_to_be_between(
-                        column,
-                        quantile_ranges={
-                            "quantiles": [0.05, 0.25, 0.5, 0.75, 0.95],
-                            "value_ranges": [
-                                [None, None],
-                                [None, None],
-                                [None, None],
-                                [None, None],
-                                [None, None],
-                            ],
-                        },
-                    )
-                    df.expect_column_kl_divergence_to_be_less_than(
-                        column,
-                        partition_object=None,
-                        threshold=None,
-                        result_format="COMPLETE",
-                    )
-                else:  # unknown cardinality - skip
-                    pass
-
-            elif type_ == ProfilerDataType.STRING:
-                # Check for leading and trailing whitespace.
-                #!!! It would be nice to build additional Expectations here, but
-                #!!! the default logic for remove_expectations prevents us.
-                df.expect_column_values_to_not_match_regex(column, r"^\s+|\s+$")
-
-                if cardinality == ProfilerCardinality.UNIQUE:
-                    df.expect_column_values_to_be_unique(column)
-
-                elif cardinality in [
-                    ProfilerCardinality.ONE,
-                    ProfilerCardinality.TWO,
-                    ProfilerCardinality.VERY_FEW,
-                    ProfilerCardinality.FEW,
-                ]:
-                    df.expect_column_distinct_values_to_be_in_set(
-                        column, value_set=None, result_format="SUMMARY"
-                    )
-                else:
-                    pass
 
-            elif type_ == ProfilerDataType.DATETIME:
-                df.expect_column_min_to_be_between(
-                    column, min_value=None, max_value=None
-                )
+                    # Re-add once kl_divergence has been modified to support datetimes
+                    # df.expect_column_kl_divergence_to_be_less_than(column, partition_object=None,
+                    #                                            threshold=None, result_format='COMPLETE')
 
-                df.expect_column_max_to_be_between(
-                    column, min_value=None, max_value=None
-                )
+                    if cardinality in [
+                        ProfilerCardinality.ONE,
+                        ProfilerCardinality.TWO,
+                        ProfilerCardinality.VERY_FEW,
+                        ProfilerCardinality.FEW,
+                    ]:
+                        df.expect_column_distinct_values_to_be_in_set(
+                            column, value_set=None, result_format="SUMMARY"
+                        )
 
-                # Re-add once kl_divergence has been modified to support datetimes
-                # df.expect_column_kl_divergence_to_be_less_than(column, partition_object=None,
-                #                                            threshold=None, result_format='COMPLETE')
-
-                if cardinality in [
-                    ProfilerCardinality.ONE,
-                    ProfilerCardinality.TWO,
-                    ProfilerCardinality.VERY_FEW,
-                    ProfilerCardinality.FEW,
-                ]:
-                    df.expect_column_distinct_values_to_be_in_set(
-                        column, value_set=None, result_format="SUMMARY"
-                    )
-
-            else:
-                if cardinality == ProfilerCardinality.UNIQUE:
-                    df.expect_column_values_to_be_unique(column)
-
-                elif cardinality in [
-                    ProfilerCardinality.ONE,
-                    ProfilerCardinality.TWO,
-                    ProfilerCardinality.VERY_FEW,
-                    ProfilerCardinality.FEW,
-                ]:
-                    df.expect_column_distinct_values_to_be_in_set(
-                        column, value_set=None, result_format="SUMMARY"
-                    )
                 else:
-                    pass
+                    if cardinality == ProfilerCardinality.UNIQUE:
+                        df.expect_column_values_to_be_unique(column)
+
+                    elif cardinality in [
+                        ProfilerCardinality.ONE,
+                        ProfilerCardinality.TWO,
+                        ProfilerCardinality.VERY_FEW,
+                        ProfilerCardinality.FEW,
+                    ]:
+                        df.expect_column_distinct_values_to_be_in_set(
+                            column, value_set=None, result_format="SUMMARY"
+                        )
+                    else:
+                        pass
+        finally:
+            df._finish_profiling()
 
         df.set_config_value("interactive_evaluation", True)
         expectation_suite = df.get_expectation_suite(
@@ -1,3 +1,7 @@
+import collections
+import concurrent.futures
+import hashlib
+import json
 import logging
 import os
 import traceback
@@ -15,9 +19,16 @@ from great_expectations.data_context.types.resource_identifiers import (
 )
 from great_expectations.data_context.util import instantiate_class_from_config
 from great_expectations.render.util import resource_key_passes_run_name_filter
+from great_expectations.render.view.view import (
+    DefaultJinjaLazyPageView,
+    DefaultJinjaView,
+)
 
 logger = logging.getLogger(__name__)
 
+# The renderer and view of the site section a page rendering process renders pages for
+_page_rendering_process_args = None
+
 FALSEY_YAML_STRINGS = [
     "0",
     "None",
@@ -29,6 +40,69 @@ FALSEY_YAML_STRINGS = [
 ]
 
 
+def _render_page(
+    renderer_class,
+    view_class,
+    resource,
+    data_context_id,
+    show_how_to_buttons,
+    sections_data_url=None,
+):
+    """Render the page of a resource, and the data of its lazily loaded sections if it has a sections_data_url."""
+    rendered_content = renderer_class.render(resource)
+    if sections_data_url is None:
+        return (
+            view_class.render(
+                rendered_content,
+                data_context_id=data_context_id,
+                show_how_to_buttons=show_how_to_buttons,
+            ),
+            None,
+        )
+    return (
+        view_class.render(
+            rendered_content,
+            sections_data_url=sections_data_url,
+            data_context_id=data_context_id,
+            show_how_to_buttons=show_how_to_buttons,
+        ),
+        view_class.render_sections_data(
+            rendered_content,
+            data_context_id=data_context_id,
+            show_how_to_buttons=show_how_to_buttons,
+        ),
+    )
+
+
+def _initialize_page_rendering_process(
+    renderer_class, view_class, data_context_id, show_how_to_buttons
+):
+    global _page_rendering_process_args
+    _page_rendering_process_args = (
+        renderer_class,
+        view_class,
+        data_context_id,
+        show_how_to_buttons,
+    )
+
+
+def _render_page_in_process(resource, sections_data_url):
+    (
+        renderer_class,
+        view_class,
+        data_context_id,
+        show_how_to_buttons,
+    ) = _page_rendering_process_args
+    return _render_page(
+        renderer_class,
+        view_class,
+        resource,
+        data_context_id,
+        show_how_to_buttons,
+        sections_data_url,
+    )
+
+
 class SiteBuilder:
     """SiteBuilder builds data documentation for the project defined by a
     DataContext.
@@ -49,6 +123,7 @@ class SiteBuilder:
         (filesystem or S3)
         * where the HTML files should be written (filesystem or S3)
         * which renderer and view class should be used to render each section
+        * how many processes render pages in parallel (max_workers; by default pages are rendered sequentially)
 
     Here is an example of a minimal configuration for a site::
 
@@ -114,12 +189,14 @@ class SiteBuilder:
         show_how_to_buttons=True,
         site_section_builders=None,
         runtime_environment=None,
+        max_workers=None,
         **kwargs,
     ):
         self.site_name = site_name
         self.data_context = data_context
         self.store_backend = store_backend
         self.show_how_to_buttons = show_how_to_buttons
+        self.max_workers = max_workers
 
         usage_statistics_config = data_context.anonymous_usage_statistics
         data_context_id = None
@@ -221,6 +298,7 @@ class SiteBuilder:
                     "custom_views_directory": custom_views_directory,
                     "data_context_id": self.data_context_id,
                     "show_how_to_buttons": self.show_how_to_buttons,
+                    "max_workers": self.max_workers,
                 },
                 config_defaults={"name": site_section_name, "module_name": module_name},
             )
@@ -313,6 +391,9 @@ class SiteBuilder:
 
 
 class DefaultSiteSectionBuilder:
+    # The number of resources read from the source store with each call to get_many
+    GET_MANY_BATCH_SIZE = 100
+
     def __init__(
         self,
         name,
@@ -327,15 +408,25 @@ class DefaultSiteSectionBuilder:
         renderer=None,
         view=None,
         data_context_id=None,
+        max_workers=None,
         **kwargs,
     ):
         self.name = name
+        self.max_workers = max_workers
         self.source_store = data_context.stores[source_store_name]
         self.target_store = target_store
         self.run_name_filter = run_name_filter
         self.validation_results_limit = validation_results_limit
         self.data_context_id = data_context_id
         self.show_how_to_buttons = show_how_to_buttons
+        self._renderer_version = self._get_renderer_version(
+            renderer,
+            view,
+            custom_styles_directory,
+            custom_views_directory,
+            show_how_to_buttons,
+            data_context_id,
+        )
 
         if renderer is None:
             raise exceptions.InvalidConfigError(
@@ -380,7 +471,20 @@ class DefaultSiteSectionBuilder:
             )
 
     def build(self, resource_identifiers=None):
+        """Render the pages of the resources of the source store that are new or changed since the last build.
+
+        The target store keeps a manifest of the rendered resources with a hash of their content and the version of
+        the renderer: resources with the same content hash are not rendered again, and a new version of the renderer
+        (or a change to its configuration) rebuilds every page. When building every resource, the pages of the
+        resources that were removed from the source store are removed as well.
+        """
         source_store_keys = self.source_store.list_keys()
+        manifest = self._read_manifest()
+        if resource_identifiers is None:
+            self._prune(manifest, source_store_keys)
+        else:
+            resource_identifiers = set(resource_identifiers)
+
         if self.name == "validations" and self.validation_results_limit:
             source_store_keys = sorted(
                 source_store_keys, key=lambda x: x.run_id.run_time, reverse=True
@@ -390,6 +494,7 @@ class DefaultSiteSectionBuilder:
             [isinstance(ri, ExpectationSuiteIdentifier) for ri in resource_identifiers]
         ) if resource_identifiers is not None else False
 
+        resource_keys = []
         for resource_key in source_store_keys:
 
             # All expectation suites are always rendered unless resource_identifiers contains ExpectationSuiteIdentifier(s).
@@ -408,71 +513,311 @@ class DefaultSiteSectionBuilder:
                     resource_key, self.run_name_filter
                 ):
                     continue
-            try:
-                resource = self.source_store.get(resource_key)
-            except exceptions.InvalidKeyError:
-                logger.warning(
-                    f"Object with Key: {str(resource_key)} could not be retrieved. Skipping..."
-                )
-                continue
+            resource_keys.append(resource_key)
 
-            if isinstance(resource_key, ExpectationSuiteIdentifier):
-                expectation_suite_name = resource_key.expectation_suite_name
-                logger.debug(
-                    "        Rendering expectation suite {}".format(
-                        expectation_suite_name
+        changed_resources = self._get_changed_resources(resource_keys, manifest)
+        if self.max_workers is None or self.max_workers <= 1:
+            for resource_key, resource, manifest_key, content_hash in changed_resources:
+                self._log_rendering(resource_key)
+                try:
+                    self._write_page(
+                        resource_key,
+                        _render_page(
+                            self.renderer_class,
+                            self.view_class,
+                            resource,
+                            self.data_context_id,
+                            self.show_how_to_buttons,
+                            self._get_sections_data_url(resource_key),
+                        ),
                     )
-                )
-            elif isinstance(resource_key, ValidationResultIdentifier):
-                run_id = resource_key.run_id
-                run_name = run_id.run_name
-                run_time = run_id.run_time
-                expectation_suite_name = (
-                    resource_key.expectation_suite_identifier.expectation_suite_name
-                )
-                if self.name == "profiling":
-                    logger.debug(
-                        "        Rendering profiling for batch {}".format(
-                            resource_key.batch_identifier
-                        )
+                    if content_hash is not None:
+                        manifest[manifest_key] = content_hash
+                except Exception as e:
+                    self._log_rendering_exception(e)
+        else:
+            self._build_pages_concurrently(changed_resources, manifest)
+
+        self._write_manifest(manifest)
+
+    def _get_changed_resources(self, resource_keys, manifest):
+        """Yield the resources whose content changed since they were rendered, with their manifest key and hash."""
+        for resource_key, resource in self._get_resources(resource_keys):
+            manifest_key = tuple(self.source_store.key_to_tuple(resource_key))
+            content_hash = self._get_content_hash(resource)
+            if content_hash is not None and manifest.get(manifest_key) == content_hash:
+                logger.debug(f"        Skipping unchanged resource {str(resource_key)}")
+                continue
+            manifest.pop(manifest_key, None)
+            yield resource_key, resource, manifest_key, content_hash
+
+    def _build_pages_concurrently(self, changed_resources, manifest):
+        """Render pages on a pool of max_workers processes, and write them to the target store from a pool of
+        max_workers threads."""
+        if isinstance(self.view_class, DefaultJinjaView):
+            # Compile the templates once, before the processes are forked, instead of once in each process
+            self.view_class.precompile_templates()
+
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            initializer=_initialize_page_rendering_process,
+            initargs=(
+                self.renderer_class,
+                self.view_class,
+                self.data_context_id,
+                self.show_how_to_buttons,
+            ),
+        ) as render_executor, concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_workers
+        ) as write_executor:
+            # Only a few pages per process are in flight, so that resources are read as the pages are rendered
+            # instead of all being held in memory
+            rendering = collections.deque()
+            writing = []
+
+            def write_rendered_page():
+                resource_key, manifest_key, content_hash, future = rendering.popleft()
+                try:
+                    page = future.result()
+                except Exception as e:
+                    self._log_rendering_exception(e)
+                    return
+                writing.append(
+                    (
+                        manifest_key,
+                        content_hash,
+                        write_executor.submit(self._write_page, resource_key, page),
                     )
-                else:
-
-                    logger.debug(
-                        "        Rendering validation: run name: {}, run time: {}, suite {} for batch {}".format(
-                            run_name,
-                            run_time,
-                            expectation_suite_name,
-                            resource_key.batch_identifier,
-                        )
+                )
+
+            for resource_key, resource, manifest_key, content_hash in changed_resources:
+                self._log_rendering(resource_key)
+                rendering.append(
+                    (
+                        resource_key,
+                        manifest_key,
+                        content_hash,
+                        render_executor.submit(
+                            _render_page_in_process,
+                            resource,
+                            self._get_sections_data_url(resource_key),
+                        ),
                     )
+                )
+                if len(rendering) > 2 * self.max_workers:
+                    write_rendered_page()
+            while rendering:
+                write_rendered_page()
 
-            try:
-                rendered_content = self.renderer_class.render(resource)
-                viewable_content = self.view_class.render(
-                    rendered_content,
-                    data_context_id=self.data_context_id,
-                    show_how_to_buttons=self.show_how_to_buttons,
+            for manifest_key, content_hash, future in writing:
+                try:
+                    future.result()
+                except Exception as e:
+                    self._log_rendering_exception(e)
+                    continue
+                if content_hash is not None:
+                    manifest[manifest_key] = content_hash
+
+    def _get_sections_data_url(self, resource_key):
+        """Return the URL the page of a resource loads its sections from, or None if it holds all its sections."""
+        if isinstance(self.view_class, DefaultJinjaLazyPageView) and isinstance(
+            resource_key, ValidationResultIdentifier
+        ):
+            return self.target_store.get_sections_data_relative_url(resource_key)
+        return None
+
+    def _write_page(self, resource_key, page):
+        viewable_content, sections_data = page
+        key = SiteSectionIdentifier(
+            site_section_name=self.name, resource_identifier=resource_key,
+        )
+        # The sections data is written first, so that the page never refers to sections data that is missing
+        if sections_data is not None:
+            self.target_store.set_sections_data(key, sections_data)
+        self.target_store.set(key, viewable_content)
+
+    def _log_rendering(self, resource_key):
+        if isinstance(resource_key, ExpectationSuiteIdentifier):
+            expectation_suite_name = resource_key.expectation_suite_name
+            logger.debug(
+                "        Rendering expectation suite {}".format(expectation_suite_name)
+            )
+        elif isinstance(resource_key, ValidationResultIdentifier):
+            run_id = resource_key.run_id
+            run_name = run_id.run_name
+            run_time = run_id.run_time
+            expectation_suite_name = (
+                resource_key.expectation_suite_identifier.expectation_suite_name
+            )
+            if self.name == "profiling":
+                logger.debug(
+                    "        Rendering profiling for batch {}".format(
+                        resource_key.batch_identifier
+                    )
                 )
+            else:
 
-                self.target_store.set(
-                    SiteSectionIdentifier(
-                        site_section_name=self.name, resource_identifier=resource_key,
-                    ),
-                    viewable_content,
+                logger.debug(
+                    "        Rendering validation: run name: {}, run time: {}, suite {} for batch {}".format(
+                        run_name,
+                        run_time,
+                        expectation_suite_name,
+                        resource_key.batch_identifier,
+                    )
                 )
-            except Exception as e:
-                exception_message = f"""\
+
+    @staticmethod
+    def _log_rendering_exception(e):
+        exception_message = f"""\
 An unexpected Exception occurred during data docs rendering.  Because of this error, certain parts of data docs will \
 not be rendered properly and/or may not appear altogether.  Please use the trace, included in this message, to \
 diagnose and repair the underlying issue.  Detailed information follows:
                 """
-                exception_traceback = traceback.format_exc()
-                exception_message += (
-                    f'{type(e).__name__}: "{str(e)}".  '
-                    f'Traceback: "{exception_traceback}".'
+        exception_traceback = traceback.format_exc()
+        exception_message += (
+            f'{type(e).__name__}: "{str(e)}".  ' f'Traceback: "{exception_traceback}".'
+        )
+        logger.error(exception_message, e, exc_info=True)
+
+    @staticmethod
+    def _get_renderer_version(
+        renderer,
+        view,
+        custom_styles_directory,
+        custom_views_directory,
+        show_how_to_buttons,
+        data_context_id,
+    ):
+        """Identify everything besides the resource itself that goes into a rendered page, so that changing any of
+        it renders all the pages again. The custom styles and views are identified by the contents of their files,
+        so that editing a custom template renders the pages again without cleaning the site."""
+        from great_expectations import __version__ as ge_version
+
+        return hashlib.md5(
+            json.dumps(
+                [
+                    ge_version,
+                    renderer,
+                    view,
+                    custom_styles_directory,
+                    DefaultSiteSectionBuilder._get_directory_content_hash(
+                        custom_styles_directory
+                    ),
+                    custom_views_directory,
+                    DefaultSiteSectionBuilder._get_directory_content_hash(
+                        custom_views_directory
+                    ),
+                    show_how_to_buttons,
+                    data_context_id,
+                ],
+                sort_keys=True,
+                default=str,
+            ).encode("utf-8")
+        ).hexdigest()
+
+    @staticmethod
+    def _get_directory_content_hash(directory):
+        """Hash the relative paths and contents of the files under a directory, or return None if it does not
+        exist."""
+        if directory is None or not os.path.isdir(directory):
+            return None
+        content_hash = hashlib.md5()
+        for root, dirs, files in os.walk(directory):
+            dirs.sort()
+            for file_name in sorted(files):
+                file_path = os.path.join(root, file_name)
+                content_hash.update(
+                    os.path.relpath(file_path, directory).encode("utf-8")
                 )
-                logger.error(exception_message, e, exc_info=True)
+                with open(file_path, "rb") as f:
+                    content_hash.update(hashlib.md5(f.read()).digest())
+        return content_hash.hexdigest()
+
+    @staticmethod
+    def _get_content_hash(resource):
+        try:
+            serialized_resource = json.dumps(
+                resource.to_json_dict(), sort_keys=True, default=str
+            )
+        except Exception:
+            # Resources that cannot be hashed are always rendered
+            return None
+        return hashlib.md5(serialized_resource.encode("utf-8")).hexdigest()
+
+    def _read_manifest(self):
+        """Return the content hashes of the rendered resources, by key tuple."""
+        try:
+            manifest = self.target_store.get_manifest(self.name)
+        except Exception as e:
+            logger.warning(
+                f"Unable to read the data docs manifest of section {self.name}: {str(e)}. Rebuilding all pages."
+            )
+            return {}
+        if (
+            manifest is None
+            or manifest.get("renderer_version") != self._renderer_version
+        ):
+            return {}
+        return {tuple(key): content_hash for key, content_hash in manifest["resources"]}
+
+    def _write_manifest(self, manifest):
+        self.target_store.set_manifest(
+            self.name,
+            {
+                "renderer_version": self._renderer_version,
+                "resources": [
+                    [list(key), content_hash] for key, content_hash in manifest.items()
+                ],
+            },
+        )
+
+    def _prune(self, manifest, source_store_keys):
+        """Remove the pages, and manifest entries, of the resources that are no longer in the source store."""
+        source_store_key_tuples = {
+            tuple(self.source_store.key_to_tuple(key)) for key in source_store_keys
+        }
+        removed_key_tuples = [
+            key for key in manifest if key not in source_store_key_tuples
+        ]
+        if not removed_key_tuples:
+            return
+        logger.debug(
+            f"        Removing {len(removed_key_tuples)} pages of deleted resources"
+        )
+        self.target_store.remove_many(
+            [
+                SiteSectionIdentifier(
+                    site_section_name=self.name,
+                    resource_identifier=self.source_store.tuple_to_key(key),
+                )
+                for key in removed_key_tuples
+            ]
+        )
+        for key in removed_key_tuples:
+            del manifest[key]
+
+    def _get_resources(self, resource_keys):
+        """Yield the (key, resource) pairs of the resources that can be retrieved from the source store, reading
+        them in batches of GET_MANY_BATCH_SIZE keys."""
+        for start in range(0, len(resource_keys), self.GET_MANY_BATCH_SIZE):
+            batch = resource_keys[start : start + self.GET_MANY_BATCH_SIZE]
+            try:
+                resources = self.source_store.get_many(batch)
+            except Exception:
+                # Fall back to reading the keys one by one to skip only the ones that cannot be retrieved
+                resources = None
+            if resources is not None:
+                yield from zip(batch, resources)
+                continue
+            for resource_key in batch:
+                try:
+                    resource = self.source_store.get(resource_key)
+                except exceptions.InvalidKeyError:
+                    logger.warning(
+                        f"Object with Key: {str(resource_key)} could not be retrieved. Skipping..."
+                    )
+                    continue
+                yield resource_key, resource
 
 
 class DefaultSiteIndexBuilder:
@@ -1,6 +1,7 @@
 from .view import (
     DefaultJinjaComponentView,
     DefaultJinjaIndexPageView,
+    DefaultJinjaLazyPageView,
     DefaultJinjaPageView,
     DefaultJinjaSectionView,
     DefaultMarkdownPageView,
@@ -1,5 +1,6 @@
 import datetime
 import json
+import logging
 import re
 from collections import OrderedDict
 from string import Template as pTemplate
@@ -9,6 +10,7 @@ import mistune
 from jinja2 import (
     ChoiceLoader,
     Environment,
+    FileSystemBytecodeCache,
     FileSystemLoader,
     PackageLoader,
     contextfilter,
@@ -22,6 +24,26 @@ from great_expectations.render.types import (
     RenderedDocumentContent,
 )
 
+logger = logging.getLogger(__name__)
+
+# Jinja environments are cached by view class and custom directories, so that their templates are only loaded
+# and compiled once per process
+_jinja_environments = {}
+_bytecode_cache = None
+
+
+def _get_bytecode_cache():
+    """Return the on-disk cache of compiled templates shared by the Jinja environments, or False if there is
+    none."""
+    global _bytecode_cache
+    if _bytecode_cache is None:
+        try:
+            _bytecode_cache = FileSystemBytecodeCache()
+        except Exception as e:
+            logger.debug(f"Unable to use a Jinja bytecode cache: {str(e)}")
+            _bytecode_cache = False
+    return _bytecode_cache
+
 
 class NoOpTemplate:
     def render(self, document):
@@ -72,6 +94,20 @@ class DefaultJinjaView:
         if template is None:
             return NoOpTemplate
 
+        return self._get_environment().get_template(template)
+
+    def _get_environment(self):
+        """Return the Jinja environment of the view, which is built once per process for each view class and set of
+        custom directories: the state of a view is its custom directories, so its filters can be those of any view
+        with the same ones."""
+        key = (type(self), self.custom_styles_directory, self.custom_views_directory)
+        env = _jinja_environments.get(key)
+        if env is None:
+            env = self._build_environment()
+            _jinja_environments[key] = env
+        return env
+
+    def _build_environment(self):
         templates_loader = PackageLoader("great_expectations", "render/view/templates")
         styles_loader = PackageLoader("great_expectations", "render/view/static/styles")
 
@@ -86,6 +122,7 @@ class DefaultJinjaView:
             loader=ChoiceLoader(loaders),
             autoescape=select_autoescape(["html", "xml"]),
             extensions=["jinja2.ext.do"],
+            bytecode_cache=_get_bytecode_cache() or None,
         )
         env.filters["render_string_template"] = self.render_string_template
         env.filters[
@@ -104,11 +141,23 @@ class DefaultJinjaView:
         env.filters["render_bootstrap_table_data"] = self.render_bootstrap_table_data
         env.globals["ge_version"] = ge_version
         env.filters["add_data_context_id_to_url"] = self.add_data_context_id_to_url
+        env.globals["now"] = lambda: datetime.datetime.now(datetime.timezone.utc)
 
-        template = env.get_template(template)
-        template.globals["now"] = lambda: datetime.datetime.now(datetime.timezone.utc)
+        return env
 
-        return template
+    def precompile_templates(self):
+        """Load and compile every template of the view's environment, e.g. before rendering a large site.
+
+        Returns:
+            the number of templates compiled
+        """
+        env = self._get_environment()
+        template_names = env.list_templates(
+            filter_func=lambda name: name.endswith((".j2", ".css"))
+        )
+        for template_name in template_names:
+            env.get_template(template_name)
+        return len(template_names)
 
     @contextfilter
     def add_data_context_id_to_url(self, jinja_context, url, add_datetime=True):
@@ -431,6 +480,55 @@ class DefaultJinjaPageView(DefaultJinjaView):
         assert isinstance(document, RenderedDocumentContent)
 
 
+class DefaultJinjaLazyPageView(DefaultJinjaPageView):
+    """
+    Renders pages whose sections after the first one (the overview) are loaded lazily: they are rendered into a
+    separate sections data file, which the page loads and displays page_size sections at a time. Browsers then only
+    build the part of very large pages (e.g. validation results of thousands of expectations) that is displayed.
+
+    The sections data is a script that passes the JSON of the rendered sections to the page, rather than a JSON
+    file, so that pages opened from the filesystem can load it.
+    """
+
+    def __init__(
+        self, custom_styles_directory=None, custom_views_directory=None, page_size=20
+    ):
+        super().__init__(
+            custom_styles_directory=custom_styles_directory,
+            custom_views_directory=custom_views_directory,
+        )
+        self.page_size = page_size
+
+    def render(self, document, template=None, sections_data_url=None, **kwargs):
+        """Render the page, loading its sections from sections_data_url; without one, the page holds every
+        section."""
+        if sections_data_url is not None:
+            kwargs.update(sections_data_url=sections_data_url, page_size=self.page_size)
+        return super().render(document, template=template, **kwargs)
+
+    def render_sections_data(self, document, **kwargs):
+        """Render the sections data of a page, a script that passes the lazily loaded sections to the page."""
+        self._validate_document(document)
+        document = document.to_json_dict()
+        section_template = self._get_template("section.j2")
+        sections = []
+        # Sections are numbered as they would be on a page holding every section
+        for index, section in enumerate(document["sections"][1:], start=2):
+            section_loop = {"index": index}
+            sections.append(
+                section_template.render(
+                    document,
+                    section=section,
+                    section_loop=section_loop,
+                    loop=section_loop,
+                    **kwargs,
+                )
+            )
+        return "geLoadSections({});".format(
+            json.dumps({"sections": sections}, separators=(",", ":"))
+        )
+
+
 class DefaultJinjaIndexPageView(DefaultJinjaPageView):
     _template = "index_page.j2"
 
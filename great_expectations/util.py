@@ -215,6 +215,37 @@ def read_csv(
         )
 
 
+def read_csv_in_chunks(
+    filename, chunksize, dataset_class=None, expectation_suite=None, *args, **kwargs,
+):
+    """Return a dataset validating a csv file chunksize rows at a time, for files that do not fit in memory.
+
+    The file is read with Pandas read_csv each time the dataset is validated. See ChunkedPandasDataset for the
+    expectations it supports and the approximations it makes.
+
+    Args:
+        filename (string): path to file to read
+        chunksize (int): number of rows to read at a time
+        dataset_class (PandasDataset): If specified, the PandasDataset subclass used to evaluate expectations on
+            each chunk
+        expectation_suite (string): path to great_expectations expectation suite file
+
+    Returns:
+        ChunkedPandasDataset
+    """
+    import pandas as pd
+
+    from great_expectations.dataset import ChunkedPandasDataset, PandasDataset
+
+    dataset = ChunkedPandasDataset(
+        lambda: pd.read_csv(filename, *args, chunksize=chunksize, **kwargs),
+        dataset_class=dataset_class or PandasDataset,
+    )
+    if expectation_suite is not None:
+        dataset._initialize_expectations(expectation_suite)
+    return dataset
+
+
 def read_json(
     filename,
     class_name="PandasDataset",
@@ -1,3 +1,4 @@
+import concurrent.futures
 import logging
 import warnings
 from collections import OrderedDict
@@ -125,6 +126,15 @@ An instance of ActionListValidationOperator is included in the default configura
         action:
           class_name: UpdateDataDocsAction
 
+    # optional: validate batches and run their actions concurrently on this many threads
+    max_workers: 8
+
+With ``max_workers`` set, the results of all batches are still merged into a single ValidationOperatorResult, in the
+order of ``assets_to_validate``. A batch that fails does not prevent the other batches from being validated; the first
+error is raised once all of them are done. ``stop_on_first_error`` is best-effort with ``max_workers``: the batches
+that have not started are skipped, but the ones that were already running or done have run their actions, and their
+results are included.
+
 
 **Invocation**
 
@@ -193,10 +203,12 @@ The ``run`` method returns a ValidationOperatorResult object:
         action_list,
         name,
         result_format={"result_format": "SUMMARY"},
+        max_workers=None,
     ):
         super().__init__()
         self.data_context = data_context
         self.name = name
+        self.max_workers = max_workers
 
         result_format = parse_result_format(result_format)
         assert result_format["result_format"] in [
@@ -244,6 +256,7 @@ The ``run`` method returns a ValidationOperatorResult object:
                 "kwargs": {
                     "action_list": self.action_list,
                     "result_format": self.result_format,
+                    "max_workers": self.max_workers,
                 },
             }
         return self._validation_operator_config
@@ -307,9 +320,7 @@ The ``run`` method returns a ValidationOperatorResult object:
         elif not isinstance(run_id, RunIdentifier):
             run_id = RunIdentifier(run_name=run_name, run_time=run_time)
 
-        run_results = {}
-
-        for item in assets_to_validate:
+        def run_batch(item):
             run_result_obj = {}
             batch = self._build_batch_from_item(item)
             expectation_suite_identifier = ExpectationSuiteIdentifier(
@@ -335,7 +346,9 @@ The ``run`` method returns a ValidationOperatorResult object:
             )
 
             run_result_obj["actions_results"] = batch_actions_results
-            run_results[validation_result_id] = run_result_obj
+            return {validation_result_id: run_result_obj}, False
+
+        run_results = self._run_batches(assets_to_validate, run_batch)
 
         return ValidationOperatorResult(
             run_id=run_id,
@@ -344,6 +357,51 @@ The ``run`` method returns a ValidationOperatorResult object:
             evaluation_parameters=evaluation_parameters,
         )
 
+    def _run_batches(self, assets_to_validate, run_batch):
+        """
+        Calls run_batch on each item of assets_to_validate and merges the run results it returns.
+
+        run_batch returns a tuple of (run results of the item, whether to stop). Items are processed in order, or
+        concurrently on a pool of max_workers threads if configured. In the concurrent case an item that raises does
+        not prevent the other items from being processed; the first error is raised once all of them are done.
+        Stopping is then best-effort: the items that have not started when an item asks to stop are skipped, but
+        the ones already running or done have run their actions, so their run results are kept.
+
+        :param assets_to_validate:
+        :param run_batch:
+        :return: a dictionary: {ValidationResultIdentifier -> run result}, in the order of assets_to_validate
+        """
+        run_results = {}
+        if self.max_workers is None or self.max_workers <= 1:
+            for item in assets_to_validate:
+                batch_run_results, stop = run_batch(item)
+                run_results.update(batch_run_results)
+                if stop:
+                    break
+            return run_results
+
+        errors = []
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_workers
+        ) as executor:
+            futures = [executor.submit(run_batch, item) for item in assets_to_validate]
+            stopped = False
+            for future in futures:
+                if stopped and future.cancel():
+                    continue
+                try:
+                    batch_run_results, stop = future.result()
+                except Exception as e:
+                    logger.exception("Error validating batch")
+                    errors.append(e)
+                    continue
+                run_results.update(batch_run_results)
+                stopped = stopped or stop
+
+        if errors:
+            raise errors[0]
+        return run_results
+
     def _run_actions(
         self,
         batch,
@@ -551,8 +609,9 @@ The value of "success" is True if no critical expectation suites ("failure") fai
         notify_on="all",
         notify_with=None,
         result_format={"result_format": "SUMMARY"},
+        max_workers=None,
     ):
-        super().__init__(data_context, action_list, name)
+        super().__init__(data_context, action_list, name, max_workers=max_workers)
 
         if expectation_suite_name_suffixes is None:
             expectation_suite_name_suffixes = [".failure", ".warning"]
@@ -593,6 +652,7 @@ The value of "success" is True if no critical expectation suites ("failure") fai
                     "notify_on": self.notify_on,
                     "notify_with": self.notify_with,
                     "result_format": self.result_format,
+                    "max_workers": self.max_workers,
                 },
             }
         return self._validation_operator_config
@@ -728,13 +788,12 @@ The value of "success" is True if no critical expectation suites ("failure") fai
                 )
             base_expectation_suite_name = self.base_expectation_suite_name
 
-        run_results = {}
+        def run_batch(item):
+            run_results = {}
 
-        for item in assets_to_validate:
             batch = self._build_batch_from_item(item)
 
             batch_id = batch.batch_id
-            run_id = run_id
 
             assert not batch_id is None
             assert not run_id is None
@@ -788,7 +847,7 @@ The value of "success" is True if no critical expectation suites ("failure") fai
                 run_results[failure_validation_result_id] = failure_run_result_obj
 
                 if not failure_validation_result.success and self.stop_on_first_error:
-                    break
+                    return run_results, True
 
             warning_expectation_suite_identifier = ExpectationSuiteIdentifier(
                 expectation_suite_name=base_expectation_suite_name
@@ -833,6 +892,10 @@ The value of "success" is True if no critical expectation suites ("failure") fai
                 warning_run_result_obj["actions_results"] = warning_actions_results
                 run_results[warning_validation_result_id] = warning_run_result_obj
 
+            return run_results, False
+
+        run_results = self._run_batches(assets_to_validate, run_batch)
+
         validation_operator_result = ValidationOperatorResult(
             run_id=run_id,
             run_results=run_results,
@@ -1,11 +1,15 @@
 # TODO: ADD TESTS ONCE GET_BATCH IS INTEGRATED!
 
+import threading
+
 import pandas as pd
+import pytest
 from freezegun import freeze_time
 
 import great_expectations as ge
 from great_expectations.data_context import BaseDataContext
 from great_expectations.validation_operators.validation_operators import (
+    ActionListValidationOperator,
     WarningAndFailureExpectationSuitesValidationOperator,
 )
 
@@ -180,3 +184,99 @@ def test_errors_warnings_validation_operator_run_slack_query(
     print(json.dumps(slack_query, indent=2))
     print(json.dumps(expected_slack_query, indent=2))
     assert slack_query == expected_slack_query
+
+
+def test_action_list_validation_operator_run_with_max_workers(
+    basic_data_context_config_for_validation_operator, tmp_path_factory,
+):
+    project_path = str(tmp_path_factory.mktemp("great_expectations"))
+    data_context = BaseDataContext(
+        basic_data_context_config_for_validation_operator, project_path,
+    )
+
+    batches = []
+    for idx in range(6):
+        batch = ge.dataset.PandasDataset(
+            pd.DataFrame({"x": [1, 2, 3, 4, idx]}),
+            batch_kwargs={"ge_batch_id": "batch_{}".format(idx)},
+        )
+        batch.expect_column_values_to_be_between(column="x", min_value=1, max_value=4)
+        batches.append(batch)
+
+    action_list = [
+        {
+            "name": "store_validation_result",
+            "action": {
+                "class_name": "StoreValidationResultAction",
+                "target_store_name": "validation_result_store",
+            },
+        },
+    ]
+    serial_vo = ActionListValidationOperator(
+        data_context=data_context, action_list=action_list, name="serial",
+    )
+    concurrent_vo = ActionListValidationOperator(
+        data_context=data_context,
+        action_list=action_list,
+        name="concurrent",
+        max_workers=3,
+    )
+
+    serial_result = serial_vo.run(assets_to_validate=batches, run_name="serial")
+    concurrent_result = concurrent_vo.run(
+        assets_to_validate=batches, run_name="concurrent"
+    )
+
+    # Results are merged in the order of the assets to validate
+    assert [key.batch_identifier for key in concurrent_result.run_results.keys()] == [
+        key.batch_identifier for key in serial_result.run_results.keys()
+    ]
+    assert [
+        run_result["validation_result"].success
+        for run_result in concurrent_result.run_results.values()
+    ] == [
+        run_result["validation_result"].success
+        for run_result in serial_result.run_results.values()
+    ]
+    assert concurrent_result.success is False
+
+    # A batch that cannot be built does not prevent the others from being validated
+    with pytest.raises(ValueError):
+        concurrent_vo.run(
+            assets_to_validate=batches[:2] + ["not a batch"] + batches[2:],
+            run_name="with_error",
+        )
+    stored_keys = data_context.stores["validation_result_store"].list_keys()
+    assert len([key for key in stored_keys if key.run_id.run_name == "with_error"]) == 6
+
+
+def test_run_batches_keeps_the_results_of_batches_run_after_a_stop(
+    basic_data_context_config_for_validation_operator, tmp_path_factory,
+):
+    project_path = str(tmp_path_factory.mktemp("great_expectations"))
+    data_context = BaseDataContext(
+        basic_data_context_config_for_validation_operator, project_path,
+    )
+    vo = ActionListValidationOperator(
+        data_context=data_context, action_list=[], name="concurrent", max_workers=2,
+    )
+
+    third_batch_done = threading.Event()
+    ran = []
+
+    def run_batch(item):
+        if item == 0:
+            # the first batch asks to stop once the next two, run on the other thread, are done
+            third_batch_done.wait(10)
+        ran.append(item)
+        if item == 2:
+            third_batch_done.set()
+        return {item: "result {}".format(item)}, item == 0
+
+    run_results = vo._run_batches(range(6), run_batch)
+
+    # every batch that ran, and so ran its actions, is reported, in order; whether the batches after the third
+    # one were skipped depends on the timing of the threads
+    assert {0, 1, 2} <= set(ran)
+    assert list(run_results.keys()) == sorted(ran)
+    assert run_results[1] == "result 1"
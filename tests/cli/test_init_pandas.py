@@ -113,6 +113,10 @@ def test_cli_init_on_new_project(
         data_docs/
             local_site/
                 index.html
+                .ge_manifests/
+                    expectations.json
+                    profiling.json
+                    validations.json
                 expectations/
                     Titanic/
                         warning.html
@@ -588,6 +592,10 @@ def test_cli_init_on_new_project_with_broken_excel_file_try_again_with_different
         data_docs/
             local_site/
                 index.html
+                .ge_manifests/
+                    expectations.json
+                    profiling.json
+                    validations.json
                 expectations/
                     Titanic/
                         warning.html
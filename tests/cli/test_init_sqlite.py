@@ -127,6 +127,10 @@ great_expectations/
         data_docs/
             local_site/
                 index.html
+                .ge_manifests/
+                    expectations.json
+                    profiling.json
+                    validations.json
                 expectations/
                     warning.html
                 static/
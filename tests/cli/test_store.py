@@ -86,3 +86,31 @@ def test_store_list_with_multiple_stores(caplog, empty_data_context):
     assert result.output.strip() == expected_result
 
     assert_no_logging_messages_or_tracebacks(caplog, result)
+
+
+def test_store_rebuild_index(caplog, empty_data_context):
+    project_dir = empty_data_context.root_directory
+    context = DataContext(project_dir)
+    context._project_config.stores["validations_store"]["store_backend"][
+        "use_key_index"
+    ] = True
+    context._save_project_config()
+    runner = CliRunner(mix_stderr=False)
+
+    result = runner.invoke(
+        cli,
+        "store rebuild-index validations_store -d {}".format(project_dir),
+        catch_exceptions=False,
+    )
+    assert result.exit_code == 0
+    assert "Rebuilt the key index of store `validations_store`" in result.output
+
+    result = runner.invoke(
+        cli,
+        "store rebuild-index expectations_store -d {}".format(project_dir),
+        catch_exceptions=False,
+    )
+    assert result.exit_code == 1
+    assert "does not use a key index" in result.output
+
+    assert_no_logging_messages_or_tracebacks(caplog, result)
@@ -1,3 +1,5 @@
+from copy import deepcopy
+
 import pytest
 
 from great_expectations.core import ExpectationConfiguration, ExpectationSuite
@@ -410,3 +412,41 @@ def test_remove_all_expectations_of_type(
     assert suite_with_table_and_column_expectations.isEquivalentTo(
         suite_with_column_pair_and_table_expectations
     )
+
+
+def test_domain_index_follows_changes_to_the_suite(exp1, exp2, exp4, empty_suite):
+    empty_suite.add_expectation(exp1)
+    empty_suite.add_expectation(exp2)
+    assert empty_suite.find_expectation_indexes(exp4, "domain") == [1]
+
+    # Patching the domain kwargs of an expectation moves it to its new domain
+    empty_suite.patch_expectation(
+        exp2, op="replace", path="/column", value="c", match_type="runtime"
+    )
+    assert empty_suite.find_expectation_indexes(exp4, "domain") == []
+    moved_expectation = ExpectationConfiguration(
+        expectation_type=exp2.expectation_type, kwargs={"column": "c"}
+    )
+    assert empty_suite.find_expectation_indexes(moved_expectation, "domain") == [1]
+
+    # Modifying the expectations list directly is noticed too
+    empty_suite.expectations.insert(0, exp4)
+    assert empty_suite.find_expectation_indexes(exp4, "domain") == [0]
+    assert empty_suite.find_expectation_indexes(moved_expectation, "domain") == [2]
+    empty_suite.expectations = [exp1]
+    assert empty_suite.find_expectation_indexes(exp4, "domain") == []
+
+    copied_suite = deepcopy(empty_suite)
+    copied_suite.expectations.append(exp4)
+    assert copied_suite.find_expectation_indexes(exp4, "domain") == [1]
+    assert empty_suite.find_expectation_indexes(exp4, "domain") == []
+
+    # Expectations whose domain kwargs cannot be hashed are still found
+    unhashable_expectation = ExpectationConfiguration(
+        expectation_type="expect_column_values_to_be_in_set",
+        kwargs={"column": {"$PARAMETER": {"a", "b"}}},
+    )
+    copied_suite.add_expectation(unhashable_expectation)
+    assert copied_suite.find_expectation_indexes(unhashable_expectation, "domain") == [
+        2
+    ]
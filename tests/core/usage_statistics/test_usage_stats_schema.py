@@ -45,6 +45,7 @@ def test_comprehensive_list_of_messages():
         "cli.new_ds_choice",
         "cli.project.check_config",
         "cli.store.list",
+        "cli.store.rebuild_index",
         "cli.suite.demo",
         "cli.suite.edit",
         "cli.suite.list",
@@ -159,6 +160,7 @@ def test_usage_stats_empty_payload_messages():
         "cli.suite.new",
         "cli.suite.scaffold",
         "cli.store.list",
+        "cli.store.rebuild_index",
         "cli.project.check_config",
         "cli.validation_operator.list",
         "cli.validation_operator.run",
@@ -10,6 +10,7 @@ import pytest
 
 import great_expectations as ge
 from great_expectations.core import expectationSuiteSchema
+from great_expectations.data_asset.util import get_proportion_confidence_interval
 
 
 def test_recursively_convert_to_json_serializable():
@@ -152,3 +153,23 @@ def test_doc_inheritance():
             Unattainable abiding satisfaction.
         """
     )
+
+
+def test_get_proportion_confidence_interval():
+    assert get_proportion_confidence_interval(0, 0) is None
+
+    lower, upper = get_proportion_confidence_interval(10, 100)
+    assert lower < 0.1 < upper
+    # Wilson score interval of 10 / 100 at the 95% confidence level
+    assert lower == pytest.approx(0.0552, abs=1e-4)
+    assert upper == pytest.approx(0.1744, abs=1e-4)
+
+    narrower_lower, narrower_upper = get_proportion_confidence_interval(100, 1000)
+    assert lower < narrower_lower < narrower_upper < upper
+    wider_lower, wider_upper = get_proportion_confidence_interval(
+        10, 100, confidence_level=0.99
+    )
+    assert wider_lower < lower < upper < wider_upper
+
+    assert get_proportion_confidence_interval(0, 100)[0] == 0
+    assert get_proportion_confidence_interval(100, 100)[1] == 1
@@ -70,3 +70,34 @@ def test_database_store_backend_duplicate_key_violation(caplog, sa, test_backend
         store_backend.set(key, "world", allow_update=False)
 
     assert "Integrity error" in str(exc.value)
+
+
+@pytest.mark.parametrize("use_upsert_statement", [True, False])
+def test_database_store_backend_upserts(tmp_path, sa, use_upsert_statement):
+    store_backend = DatabaseStoreBackend(
+        credentials={"drivername": "sqlite", "database": str(tmp_path / "store.db")},
+        table_name="test_database_store_backend_upserts",
+        key_columns=["k1", "k2"],
+        engine_kwargs={"pool_pre_ping": True},
+    )
+    if not use_upsert_statement:
+        # Use the UPDATE and INSERT of the databases without a native upsert
+        store_backend._upsert_statement = None
+
+    store_backend.set(("a", "1"), "a1")
+    store_backend.set(("a", "2"), "a2")
+    store_backend.set(("a", "1"), "new_a1")
+    # Only the row of the full key is updated
+    assert store_backend.get(("a", "1")) == "new_a1"
+    assert store_backend.get(("a", "2")) == "a2"
+
+    store_backend.set_many(
+        [((str(i), "x"), str(i)) for i in range(1000)] + [(("a", "2"), "new_a2")]
+    )
+    store_backend.set_many([((str(i), "x"), "new") for i in range(500)])
+    assert len(store_backend.list_keys()) == 1002
+    assert store_backend.get_many([("0", "x"), ("999", "x"), ("a", "2")]) == [
+        "new",
+        "999",
+        "new_a2",
+    ]
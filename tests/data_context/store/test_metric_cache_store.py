@@ -0,0 +1,220 @@
+import datetime
+import decimal
+
+import pandas as pd
+import pytest
+
+from great_expectations.core.metric import BatchMetricIdentifier
+from great_expectations.data_context.store import MetricCacheStore, metric_store
+from great_expectations.dataset import PandasDataset
+
+
+def test_metric_cache_store_ttl_and_size_eviction(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(metric_store.time, "time", lambda: now[0])
+    store = MetricCacheStore(ttl_seconds=60, max_entries=10)
+
+    key = BatchMetricIdentifier("batch", "get_column_mean", "column=a")
+    assert store.get_cached_value(key) == (False, None)
+    assert store.set_cached_value(key, 1.5)
+    assert store.get_cached_value(key) == (True, 1.5)
+    assert store.get_cached_value(
+        BatchMetricIdentifier("batch", "get_row_count", None)
+    ) == (False, None)
+
+    series = pd.Series([3, 1], index=pd.Index(["x", "y"], name="value"), name="count")
+    series_key = BatchMetricIdentifier("batch", "get_column_value_counts", "b")
+    assert store.set_cached_value(series_key, series)
+    found, cached_series = store.get_cached_value(series_key)
+    assert found
+    pd.testing.assert_series_equal(cached_series, series)
+
+    # Values that cannot be serialized are not cached
+    assert not store.set_cached_value(
+        BatchMetricIdentifier("batch", "get_column_max", "c"), object()
+    )
+
+    now[0] += 61
+    assert store.get_cached_value(key) == (False, None)
+    assert len(store.list_keys()) == 1
+
+    for i in range(10):
+        now[0] += 1
+        store.set_cached_value(BatchMetricIdentifier("batch", "metric", str(i)), i)
+    # The expired series and the oldest entries were evicted down to 90% of max_entries
+    assert sorted(key.metric_kwargs_id for key in store.list_keys()) == [
+        str(i) for i in range(1, 10)
+    ]
+
+
+def test_repeated_validation_reads_metrics_from_the_cache(monkeypatch):
+    computed = []
+    get_column_mean = PandasDataset.get_column_mean
+
+    def counting_get_column_mean(self, column):
+        computed.append(column)
+        return get_column_mean(self, column)
+
+    monkeypatch.setattr(PandasDataset, "get_column_mean", counting_get_column_mean)
+    store = MetricCacheStore()
+
+    def get_dataset(load_time, fingerprint="abc"):
+        return PandasDataset(
+            {"a": [1, 2, 3]},
+            batch_kwargs={"path": "data.csv", "datasource": "files"},
+            batch_markers={
+                "ge_load_time": load_time,
+                "pandas_data_fingerprint": fingerprint,
+            },
+            metric_cache=store,
+        )
+
+    dataset = get_dataset("20200101T000000.000000Z")
+    dataset.expect_column_mean_to_be_between("a", 1, 3)
+    suite = dataset.get_expectation_suite()
+    assert computed == ["a"]
+
+    result = get_dataset("20200102T000000.000000Z").validate(expectation_suite=suite)
+    assert result.success
+    assert result.results[0].result["observed_value"] == 2
+    assert computed == ["a"]
+
+    # A batch with other data is a miss
+    get_dataset("20200102T000000.000000Z", fingerprint="def").validate(
+        expectation_suite=suite
+    )
+    assert computed == ["a", "a"]
+
+    # Ad-hoc datasets have no stable identity, so they are not cached
+    PandasDataset({"a": [1, 2, 3]}, metric_cache=store).get_column_mean("a")
+    assert computed == ["a", "a", "a"]
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        decimal.Decimal("12345678901234567890.123456789"),
+        datetime.datetime(2020, 1, 2, 3, 4, 5, 678901),
+        datetime.datetime(2020, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc),
+        datetime.date(2020, 1, 2),
+        pd.Timestamp("2020-01-02 03:04:05.123456789"),
+        pd.Timestamp("2020-01-02 03:04:05", tz="US/Eastern"),
+        [datetime.date(2020, 1, 2), None, decimal.Decimal("1.5")],
+    ],
+)
+def test_metric_cache_store_round_trips_sql_metric_types(value):
+    store = MetricCacheStore()
+    key = BatchMetricIdentifier("batch", "get_column_max", "column=a")
+
+    assert store.set_cached_value(key, value)
+    found, cached_value = store.get_cached_value(key)
+    assert found
+    assert cached_value == value
+    assert type(cached_value) == type(value)
+
+
+def test_metric_cache_store_round_trips_series_of_dates():
+    store = MetricCacheStore()
+    key = BatchMetricIdentifier("batch", "get_column_value_counts", "column=a")
+    series = pd.Series(
+        [2, 1],
+        index=pd.Index(
+            [datetime.date(2020, 1, 1), datetime.date(2020, 1, 2)], name="value"
+        ),
+        name="count",
+    )
+
+    assert store.set_cached_value(key, series)
+    found, cached_series = store.get_cached_value(key)
+    assert found
+    pd.testing.assert_series_equal(cached_series, series)
+
+
+def test_metric_cache_store_looks_up_values_with_a_single_get(monkeypatch):
+    store = MetricCacheStore()
+    key = BatchMetricIdentifier("batch", "get_column_mean", "column=a")
+
+    def has_key(key):
+        raise AssertionError("get_cached_value should not check for the key first")
+
+    monkeypatch.setattr(store._store_backend, "has_key", has_key)
+    assert store.get_cached_value(key) == (False, None)
+    store._store_backend.set(store.key_to_tuple(key), store.serialize(key, 1.5))
+    assert store.get_cached_value(key) == (True, 1.5)
+
+
+def test_metric_cache_store_looks_up_several_values_with_a_single_get_many(
+    monkeypatch,
+):
+    now = [1000.0]
+    monkeypatch.setattr(metric_store.time, "time", lambda: now[0])
+    store = MetricCacheStore(ttl_seconds=60)
+    keys = [
+        BatchMetricIdentifier("batch", "get_column_mean", "column=" + column)
+        for column in "abc"
+    ]
+    store.set_cached_value(keys[0], 1.5)
+    now[0] += 30
+    store.set_cached_value(keys[2], datetime.date(2020, 1, 2))
+    now[0] += 31
+
+    def get(key):
+        raise AssertionError("get_cached_values should not get the keys one by one")
+
+    monkeypatch.setattr(store._store_backend, "get", get)
+    # the first entry has expired
+    assert store.get_cached_values(keys) == [
+        (False, None),
+        (False, None),
+        (True, datetime.date(2020, 1, 2)),
+    ]
+    assert store.list_keys() == [keys[2]]
+
+
+def test_planned_sql_metrics_are_read_from_the_cache_with_a_single_lookup(monkeypatch,):
+    sa = pytest.importorskip("sqlalchemy")
+    from great_expectations.dataset import SqlAlchemyDataset
+
+    engine = sa.create_engine("sqlite://")
+    pd.DataFrame({"a": [1, 2, 3], "b": [4, 5, None]}).to_sql(
+        "test_cached_metrics", con=engine, index=False
+    )
+    store = MetricCacheStore()
+
+    def get_dataset():
+        return SqlAlchemyDataset(
+            "test_cached_metrics",
+            engine=engine,
+            batch_kwargs={"table": "test_cached_metrics", "datasource": "db"},
+            batch_markers={"pandas_data_fingerprint": "abc"},
+            metric_cache=store,
+        )
+
+    dataset = get_dataset()
+    dataset.expect_column_mean_to_be_between("a", 1, 3)
+    dataset.expect_column_max_to_be_between("b", 4, 5)
+    suite = dataset.get_expectation_suite()
+    assert get_dataset().validate(expectation_suite=suite).success
+
+    lookups = []
+    for method in ["get", "get_many"]:
+        backend_method = getattr(store._store_backend, method)
+
+        def counting_method(*args, backend_method=backend_method, **kwargs):
+            lookups.append(backend_method.__name__)
+            return backend_method(*args, **kwargs)
+
+        monkeypatch.setattr(store._store_backend, method, counting_method)
+
+    statements = []
+    sa.event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+    result = get_dataset().validate(expectation_suite=suite)
+    assert result.success
+    assert result.results[0].result["observed_value"] == 2
+    # every planned metric was cached: one lookup, and no query to compute them
+    assert lookups == ["get_many"]
+    assert not any("avg" in statement.lower() for statement in statements)
@@ -1,6 +1,8 @@
 import pytest
 
+from great_expectations.core import ExpectationConfiguration, ExpectationSuite
 from great_expectations.data_context.store.query_store import SqlAlchemyQueryStore
+from great_expectations.dataset import PandasDataset
 
 
 @pytest.fixture()
@@ -20,3 +22,40 @@ def test_basic_query(basic_sqlalchemy_query_store):
     )
     res = basic_sqlalchemy_query_store.get_query_result("q2", {"table_name": "titanic"})
     assert res[0] == 1313
+
+
+def test_store_urns_are_resolved_once_per_validation(
+    basic_sqlalchemy_query_store, empty_data_context, monkeypatch
+):
+    queries = []
+    get_query_result = SqlAlchemyQueryStore.get_query_result
+
+    def counting_get_query_result(self, key, query_parameters=None):
+        queries.append(key)
+        return get_query_result(self, key, query_parameters)
+
+    monkeypatch.setattr(
+        SqlAlchemyQueryStore, "get_query_result", counting_get_query_result
+    )
+    empty_data_context.stores["my_query_store"] = basic_sqlalchemy_query_store
+
+    urn = {"$PARAMETER": "urn:great_expectations:stores:my_query_store:q1"}
+    suite = ExpectationSuite(
+        expectation_suite_name="query_store_suite",
+        expectations=[
+            ExpectationConfiguration(
+                expectation_type="expect_column_values_to_be_in_set",
+                kwargs={"column": column, "value_set": urn},
+            )
+            for column in ["a", "b"]
+        ],
+    )
+    dataset = PandasDataset({"a": [1313, 1313], "b": [1313, 1]})
+
+    result = dataset.validate(expectation_suite=suite, data_context=empty_data_context)
+    assert [r.success for r in result.results] == [True, False]
+    assert queries == ["q1"]
+
+    # Each validation resolves the URNs again, since the query results can change between them
+    dataset.validate(expectation_suite=suite, data_context=empty_data_context)
+    assert queries == ["q1", "q1"]
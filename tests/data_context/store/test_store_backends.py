@@ -8,6 +8,7 @@ from moto import mock_s3
 
 from great_expectations.core import RunIdentifier
 from great_expectations.data_context.store import (
+    DatabaseStoreBackend,
     InMemoryStoreBackend,
     TupleFilesystemStoreBackend,
     TupleGCSStoreBackend,
@@ -191,6 +192,87 @@ things0/
     assert set(my_store.list_keys()) == {("AAA",)}
 
 
+def test_TupleFilesystemStoreBackend_with_key_index(tmp_path_factory):
+    project_path = str(tmp_path_factory.mktemp("key_index"))
+    with open(os.path.join(project_path, "existing.json"), "w") as f:
+        f.write("{}")
+
+    my_store = TupleFilesystemStoreBackend(
+        root_directory=os.path.abspath("dummy_str"),
+        base_directory=project_path,
+        filepath_suffix=".json",
+        use_key_index=True,
+    )
+    # The index is built from the files already in the store
+    assert my_store.list_keys() == [("existing",)]
+
+    my_store.set(("a", "1"), "a1")
+    my_store.set(("a", "2"), "a2")
+    my_store.set(("b", "1"), "b1")
+    my_store.move(("b", "1"), ("ab", "1"))
+    my_store.remove_key(("a", "2"))
+    assert set(my_store.list_keys()) == {("existing",), ("a", "1"), ("ab", "1")}
+    assert my_store.list_keys(prefix=("a",)) == [("a", "1")]
+
+    # The index is read instead of the directory, until it is rebuilt
+    os.remove(os.path.join(project_path, "existing.json"))
+    assert ("existing",) in my_store.list_keys()
+    assert my_store.rebuild_key_index() == 2
+    assert set(my_store.list_keys()) == {("a", "1"), ("ab", "1")}
+
+    # Backends without an index ignore the index file
+    my_unindexed_store = TupleFilesystemStoreBackend(
+        root_directory=os.path.abspath("dummy_str"), base_directory=project_path,
+    )
+    assert set(my_unindexed_store.list_keys()) == {("a", "1.json"), ("ab", "1.json")}
+
+
+def test_bulk_operations(tmp_path_factory, sa):
+    project_path = str(tmp_path_factory.mktemp("bulk_operations"))
+    store_backends = [
+        InMemoryStoreBackend(),
+        TupleFilesystemStoreBackend(
+            root_directory=os.path.abspath("dummy_str"),
+            base_directory=project_path,
+            use_key_index=True,
+        ),
+        DatabaseStoreBackend(
+            credentials={
+                "drivername": "sqlite",
+                "database": str(
+                    tmp_path_factory.mktemp("bulk_operations_db") / "store.db"
+                ),
+            },
+            table_name="bulk_operations",
+            key_columns=["k1", "k2"],
+        ),
+    ]
+    for my_store in store_backends:
+        my_store.set(("a", "1"), "old")
+        my_store.set_many([(("a", "1"), "a1"), (("a", "2"), "a2"), (("b", "1"), "b1")])
+        assert my_store.get_many([("b", "1"), ("a", "1")]) == ["b1", "a1"]
+        assert my_store.get_many([]) == []
+        assert set(my_store.list_keys()) == {("a", "1"), ("a", "2"), ("b", "1")}
+        assert sorted(my_store.get_items(("a",))) == [
+            (("a", "1"), "a1"),
+            (("a", "2"), "a2"),
+        ]
+        assert len(my_store.get_items()) == 3
+
+        my_store.remove_many([("a", "1"), ("b", "1")])
+        assert my_store.list_keys() == [("a", "2")]
+        with pytest.raises((KeyError, InvalidKeyError, StoreError)):
+            my_store.get_many([("a", "1"), ("a", "2")])
+        assert my_store.get_many([("a", "1"), ("a", "2")], missing_ok=True) == [
+            None,
+            "a2",
+        ]
+
+        with pytest.raises(TypeError):
+            my_store.set_many([(("a", "3"), "a3"), ("a4", "a4")])
+        assert my_store.list_keys() == [("a", "2")]
+
+
 @mock_s3
 def test_TupleS3StoreBackend_with_prefix():
     """
@@ -264,6 +346,33 @@ def test_TupleS3StoreBackend_with_prefix():
     )
 
 
+@mock_s3
+def test_TupleS3StoreBackend_lists_all_pages_and_batches_requests():
+    bucket = "leakybucket"
+    prefix = "this_is_a_test_prefix"
+    conn = boto3.resource("s3", region_name="us-east-1")
+    conn.create_bucket(Bucket=bucket)
+    # An object next to the store, which must not be listed
+    conn.Object(bucket, prefix + "_other/x.json").put(Body=b"{}")
+
+    my_store = TupleS3StoreBackend(
+        bucket=bucket, prefix=prefix, filepath_suffix=".json", max_workers=4
+    )
+    # More objects in a single "directory" than fit in one page of a listing
+    key_value_pairs = [(("run", str(i)), str(i)) for i in range(1010)]
+    key_value_pairs += [(("other_run", "a"), "a"), (("top",), "top")]
+    my_store.set_many(key_value_pairs)
+
+    assert set(my_store.list_keys()) == {key for key, value in key_value_pairs}
+    keys = [("top",), ("run", "7"), ("other_run", "a")]
+    assert my_store.get_many(keys) == ["top", "7", "a"]
+    assert my_store.has_key(("run", "1009"))
+    assert not my_store.has_key(("run", "1010"))
+
+    my_store.remove_many([("run", str(i)) for i in range(1005)])
+    assert set(my_store.list_keys()) == {key for key, value in key_value_pairs[1005:]}
+
+
 @mock_s3
 def test_tuple_s3_store_backend_slash_conditions():
     bucket = "my_bucket"
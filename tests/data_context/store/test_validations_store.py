@@ -1,11 +1,13 @@
+import copy
 import datetime
+import os
 
 import boto3
 import pytest
 from freezegun import freeze_time
 from moto import mock_s3
 
-from great_expectations.core import ExpectationSuiteValidationResult
+from great_expectations.core import ExpectationSuiteValidationResult, RunIdentifier
 from great_expectations.data_context.store import ValidationsStore
 from great_expectations.data_context.types.resource_identifiers import (
     ExpectationSuiteIdentifier,
@@ -240,3 +242,85 @@ def test_ValidationsStore_with_DatabaseStoreBackend(sa):
         ns_1,
         ns_2,
     }
+
+
+@pytest.mark.parametrize("backend", ["filesystem", "database"])
+def test_ValidationsStore_latest_result_index(tmp_path_factory, monkeypatch, backend):
+    if backend == "filesystem":
+        path = str(tmp_path_factory.mktemp("latest_result_index"))
+        store_backend = {
+            "class_name": "TupleFilesystemStoreBackend",
+            "base_directory": "my_store/",
+        }
+    else:
+        pytest.importorskip("sqlalchemy")
+        path = str(tmp_path_factory.mktemp("latest_result_index_db"))
+        store_backend = {
+            "class_name": "DatabaseStoreBackend",
+            "credentials": {
+                "drivername": "sqlite",
+                "database": os.path.join(path, "validations.db"),
+            },
+        }
+
+    def get_store():
+        return ValidationsStore(
+            store_backend=copy.deepcopy(store_backend),
+            runtime_environment={"root_directory": path},
+            use_latest_result_index=True,
+        )
+
+    def get_key(expectation_suite_name, run_name, day, batch_identifier):
+        return ValidationResultIdentifier(
+            expectation_suite_identifier=ExpectationSuiteIdentifier(
+                expectation_suite_name
+            ),
+            run_id=RunIdentifier(
+                run_name=run_name,
+                run_time=datetime.datetime(2020, 1, day, tzinfo=datetime.timezone.utc),
+            ),
+            batch_identifier=batch_identifier,
+        )
+
+    my_store = get_store()
+    assert my_store.get_latest_key("asset.quarantine") is None
+
+    old = get_key("asset.quarantine", "old", 1, "batch_a")
+    latest_b = get_key("asset.quarantine", "latest_b", 3, "batch_b")
+    latest_a = get_key("asset.quarantine", "latest_a", 2, "batch_a")
+    other = get_key("other", "other", 4, "batch_a")
+    my_store.set(old, ExpectationSuiteValidationResult(success=True))
+    my_store.set_many(
+        [
+            (latest_b, ExpectationSuiteValidationResult(success=True)),
+            (latest_a, ExpectationSuiteValidationResult(success=True)),
+        ]
+    )
+    my_store.set(other, ExpectationSuiteValidationResult(success=True))
+    # The index is not listed with the results
+    assert set(my_store.list_keys()) == {old, latest_b, latest_a, other}
+
+    # A new store finds the latest results in the index, without listing the results
+    my_store = get_store()
+    list_keys = my_store.list_keys
+    monkeypatch.setattr(my_store, "list_keys", lambda: pytest.fail("listed keys"))
+    assert my_store.get_latest_key("asset.quarantine") == latest_b
+    assert my_store.get_latest_key("asset.quarantine", "batch_a") == latest_a
+    assert my_store.get_latest_key("other") == other
+    monkeypatch.setattr(my_store, "list_keys", list_keys)
+
+    # Removing the latest result falls back to the remaining ones
+    my_store.remove_many([latest_b])
+    assert my_store.get_latest_key("asset.quarantine") == latest_a
+    assert my_store.get_latest_key("asset.quarantine", "batch_b") is None
+
+    assert set(
+        my_store.list_keys_by_run_time(
+            start_time=datetime.datetime(2020, 1, 2),
+            end_time=datetime.datetime(2020, 1, 4),
+        )
+    ) == {latest_a}
+    assert set(my_store.list_keys_by_run_time(expectation_suite_name="other")) == {
+        other
+    }
+    assert set(my_store.list_keys_by_run_time(end_time="2020-01-02")) == {old}
@@ -1,3 +1,4 @@
+import datetime
 import json
 import os
 import shutil
@@ -292,6 +293,24 @@ def test_data_context_get_validation_result(titanic_data_context):
     assert len(failed_validation_result.results) == 8
 
 
+def test_data_context_get_latest_validation_result(titanic_data_context):
+    expectation_suite_name = "mydatasource.mygenerator.Titanic.BasicDatasetProfiler"
+    for day in [2, 1]:
+        titanic_data_context.profile_datasource(
+            "mydatasource",
+            run_id=RunIdentifier(
+                run_name="profiling_{}".format(day),
+                run_time=datetime.datetime(2020, 1, day, tzinfo=datetime.timezone.utc),
+            ),
+        )
+
+    validation_result = titanic_data_context.get_validation_result(
+        expectation_suite_name
+    )
+    assert validation_result.meta["run_id"]["run_name"] == "profiling_2"
+    assert titanic_data_context.get_validation_result("missing_suite") == {}
+
+
 def test_data_context_get_datasource(titanic_data_context):
     isinstance(titanic_data_context.get_datasource("mydatasource"), Datasource)
 
@@ -498,6 +517,10 @@ project_path/
 data_docs/
     local_site/
         index.html
+        .ge_manifests/
+            expectations.json
+            profiling.json
+            validations.json
         expectations/
             random/
                 subdir_reader/
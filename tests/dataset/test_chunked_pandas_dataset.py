@@ -0,0 +1,245 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import great_expectations as ge
+from great_expectations.dataset import ChunkedPandasDataset, PandasDataset
+from great_expectations.dataset.sketches import (
+    HyperLogLog,
+    QuantileSketch,
+    SpaceSavingCounter,
+)
+
+
+@pytest.fixture
+def chunked_test_df():
+    return pd.DataFrame(
+        {
+            "a": [1, 2, 3, None, 5, 6, 7, 8, 9, 10],
+            "b": ["a", "b", "c", "a", "b", "c", "a", "b", "c", "z"],
+            "c": [1.5, 2, 2, 3, None, None, 4, 5, 6, 7],
+        }
+    )
+
+
+@pytest.fixture
+def chunked_test_suite(chunked_test_df):
+    df = PandasDataset(chunked_test_df)
+    df.expect_column_values_to_be_in_set("b", ["a", "b"])
+    df.expect_column_values_to_be_between("a", 2, 8, mostly=0.5)
+    df.expect_column_values_to_not_be_null("a")
+    df.expect_column_values_to_be_of_type("a", "float")
+    df.expect_column_pair_values_A_to_be_greater_than_B("a", "c")
+    df.expect_table_row_count_to_equal(10)
+    df.expect_table_columns_to_match_ordered_list(["a", "b", "c"])
+    df.expect_column_to_exist("d")
+    df.expect_column_min_to_be_between("a", 0, 2)
+    df.expect_column_max_to_be_between("a", 0, 2)
+    df.expect_column_sum_to_be_between("a", 0, 3)
+    df.expect_column_median_to_be_between("a", 0, 3)
+    df.expect_column_quantile_values_to_be_between(
+        "a",
+        {
+            "quantiles": [0, 0.3, 0.5, 1],
+            "value_ranges": [[0, 1], [0, 1], [0, 1], [0, 1]],
+        },
+    )
+    df.expect_column_unique_value_count_to_be_between("b", 0, 3)
+    df.expect_column_distinct_values_to_be_in_set("b", ["a", "b"])
+    df.expect_column_most_common_value_to_be_in_set("b", ["a"])
+    return df.get_expectation_suite(discard_failed_expectations=False)
+
+
+@pytest.mark.parametrize("result_format", ["BASIC", "SUMMARY", "COMPLETE"])
+def test_chunked_validation_matches_in_memory_validation(
+    chunked_test_df, chunked_test_suite, result_format
+):
+    expected = PandasDataset(chunked_test_df).validate(
+        expectation_suite=chunked_test_suite, result_format=result_format
+    )
+    chunked_df = ChunkedPandasDataset(
+        lambda: (chunked_test_df.iloc[i : i + 3] for i in range(0, 10, 3))
+    )
+    result = chunked_df.validate(
+        expectation_suite=chunked_test_suite, result_format=result_format
+    )
+
+    assert result.success == expected.success
+    assert result.statistics == expected.statistics
+    for chunked_result, expected_result in zip(result.results, expected.results):
+        assert chunked_result.to_json_dict() == expected_result.to_json_dict()
+
+
+def test_chunked_validation_of_mean_and_stdev(chunked_test_df):
+    df = PandasDataset(chunked_test_df)
+    df.expect_column_mean_to_be_between("c", 0, 10)
+    df.expect_column_stdev_to_be_between("c", 0, 10)
+    suite = df.get_expectation_suite()
+
+    chunked_df = ChunkedPandasDataset(
+        chunked_test_df.iloc[i : i + 4] for i in range(0, 10, 4)
+    )
+    result = chunked_df.validate(expectation_suite=suite)
+
+    assert result.success
+    assert result.results[0].result["observed_value"] == pytest.approx(
+        chunked_test_df["c"].mean()
+    )
+    assert result.results[1].result["observed_value"] == pytest.approx(
+        chunked_test_df["c"].std()
+    )
+
+    # the chunks were an iterator, which can only be read once
+    with pytest.raises(ValueError):
+        chunked_df.validate(expectation_suite=suite, catch_exceptions=False)
+
+
+def test_chunked_validation_catches_metric_errors():
+    data = pd.DataFrame({"a": [1, 2, 3, 4, 5], "s": ["x", "y", "x", "z", "y"]})
+    df = PandasDataset(data)
+    df.expect_column_values_to_be_between("a", 0, 10)
+    df.expect_column_mean_to_be_between("s", 0, 10, catch_exceptions=True)
+    df.expect_column_stdev_to_be_between("s", 0, 10, catch_exceptions=True)
+    df.expect_column_max_to_be_between("s", "a", "z")
+    suite = df.get_expectation_suite(discard_failed_expectations=False)
+
+    expected = PandasDataset(data).validate(expectation_suite=suite)
+    chunked_df = ChunkedPandasDataset(data.iloc[i : i + 2] for i in range(0, 5, 2))
+    result = chunked_df.validate(expectation_suite=suite)
+
+    assert result.statistics == expected.statistics
+    assert result.results[0].to_json_dict() == expected.results[0].to_json_dict()
+    assert result.results[3].to_json_dict() == expected.results[3].to_json_dict()
+    # the mean and the stdev need the same metric, which could not be computed for a string column
+    for metric_result in result.results[1:3]:
+        assert not metric_result.success
+        assert metric_result.exception_info["raised_exception"]
+        assert "Metric moments of column s" in (
+            metric_result.exception_info["exception_message"]
+        )
+
+
+def test_chunked_validation_of_unsupported_expectation(chunked_test_df):
+    df = PandasDataset(chunked_test_df)
+    df.expect_column_values_to_be_unique("a")
+    suite = df.get_expectation_suite()
+
+    result = ChunkedPandasDataset([chunked_test_df]).validate(expectation_suite=suite)
+
+    assert not result.success
+    assert result.results[0].exception_info["raised_exception"]
+
+
+def test_read_csv_in_chunks(tmp_path):
+    rng = np.random.RandomState(0)
+    df = pd.DataFrame(
+        {"x": rng.normal(size=20000), "k": rng.randint(0, 100, size=20000)}
+    )
+    filename = str(tmp_path / "data.csv")
+    df.to_csv(filename, index=False)
+
+    expected_df = ge.read_csv(filename)
+    expected_df.expect_column_values_to_be_between("x", -2, 2)
+    expected_df.expect_column_unique_value_count_to_be_between("k", 0, 100)
+    expected_df.expect_column_median_to_be_between("x", -1, 1)
+    suite = expected_df.get_expectation_suite(discard_failed_expectations=False)
+    expected = expected_df.validate(expectation_suite=suite, result_format="SUMMARY")
+
+    result = ge.read_csv_in_chunks(
+        filename, chunksize=3000, expectation_suite=suite
+    ).validate(result_format="SUMMARY")
+
+    results = {r.expectation_config.expectation_type: r.result for r in result.results}
+    expected_results = {
+        r.expectation_config.expectation_type: r.result for r in expected.results
+    }
+    assert (
+        results["expect_column_unique_value_count_to_be_between"]
+        == expected_results["expect_column_unique_value_count_to_be_between"]
+    )
+    # about 900 distinct values are unexpected, more than the counter of unexpected values keeps, so their counts
+    # are approximate; the other parts of the result are exact
+    between = dict(results["expect_column_values_to_be_between"])
+    expected_between = dict(expected_results["expect_column_values_to_be_between"])
+    partial_unexpected_counts = between.pop("partial_unexpected_counts")
+    expected_between.pop("partial_unexpected_counts")
+    assert between == expected_between
+    assert len(partial_unexpected_counts) == 20
+    assert all(counts["count"] >= 1 for counts in partial_unexpected_counts)
+    # 20000 values do not fit in the quantile sketch, so the median is approximate
+    assert results["expect_column_median_to_be_between"][
+        "observed_value"
+    ] == pytest.approx(
+        expected_results["expect_column_median_to_be_between"]["observed_value"],
+        abs=0.05,
+    )
+
+
+def test_space_saving_counter():
+    counter = SpaceSavingCounter(3)
+    counter.update({"a": 5, "b": 2})
+    counter.update([("a", 1), ("c", 1)])
+    assert counter.is_exact
+    assert counter.most_common(2) == [("a", 6), ("b", 2)]
+
+    # a new value replaces the least common one and starts from its count
+    counter.update({"d": 1})
+    assert not counter.is_exact
+    assert counter.most_common() == [("a", 6), ("b", 2), ("d", 2)]
+
+    # frequent values are kept however many rare ones are counted
+    counter = SpaceSavingCounter(10)
+    counter.update(("frequent" if i % 3 == 0 else i, 1) for i in range(3000))
+    value, count = counter.most_common(1)[0]
+    assert value == "frequent"
+    assert count >= 1000
+
+
+def test_chunked_validation_counts_unexpected_values_across_chunks():
+    data = pd.DataFrame({"a": ["x", "y", "bad", "worse", "bad"] * 20})
+    df = PandasDataset(data)
+    df.expect_column_values_to_be_in_set("a", ["x", "y"])
+    suite = df.get_expectation_suite(discard_failed_expectations=False)
+
+    expected = PandasDataset(data).validate(
+        expectation_suite=suite, result_format="SUMMARY"
+    )
+    result = ChunkedPandasDataset(
+        data.iloc[i : i + 7] for i in range(0, 100, 7)
+    ).validate(expectation_suite=suite, result_format="SUMMARY")
+
+    assert result.results[0].result == expected.results[0].result
+    assert result.results[0].result["partial_unexpected_counts"] == [
+        {"value": "bad", "count": 40},
+        {"value": "worse", "count": 20},
+    ]
+
+
+def test_sketches_are_exact_for_small_data_and_close_for_large_data():
+    rng = np.random.RandomState(0)
+    values = rng.randint(0, 50000, size=200000)
+
+    distinct = HyperLogLog()
+    quantiles = QuantileSketch()
+    for chunk in np.array_split(values, 7):
+        chunk_distinct = HyperLogLog()
+        chunk_distinct.update(chunk)
+        distinct.merge(chunk_distinct)
+        quantiles.update(chunk)
+
+    assert not distinct.is_exact
+    assert distinct.count() == pytest.approx(len(np.unique(values)), rel=0.03)
+    assert not quantiles.is_exact
+    for quantile, value in zip([0.1, 0.5, 0.9], quantiles.quantiles([0.1, 0.5, 0.9])):
+        assert np.mean(values <= value) == pytest.approx(quantile, abs=0.01)
+
+    small_distinct = HyperLogLog()
+    small_distinct.update(pd.Series([1, 2, 2, None]))
+    small_distinct.update(pd.Series([2.0, 3.0]))
+    assert small_distinct.is_exact
+    assert small_distinct.count() == 3
+
+    small_quantiles = QuantileSketch()
+    small_quantiles.update(pd.Series([3, 1, None, 2, 5]))
+    assert small_quantiles.quantiles([0, 0.5, 1]) == [1, 3, 5]
+    assert small_quantiles.median() == 2.5
@@ -1,6 +1,7 @@
 import datetime
 import json
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -901,3 +902,143 @@ def test_expect_values_quantiles_to_be_between():
             "A", {"quantiles": quantiles, "value_ranges": value_ranges,}
         )
         assert validation.success is success
+
+
+def test_expect_column_values_to_be_between_vectorized_matches_elementwise():
+    """
+    Numeric and datetime columns are compared with bounds of a matching type all at once; the results must be the
+    same as comparing the values one by one, which is what happens for object columns.
+    """
+    df = ge.dataset.PandasDataset(
+        {
+            "numeric": [1, 2, 3, 4, 5, None],
+            "object": [1, 2, 3, 4, 5, None],
+            "dates": pd.to_datetime(
+                ["2020-01-01", "2020-01-02", "2020-01-03", None, "2020-01-05", None]
+            ),
+        }
+    )
+    df["object"] = df["object"].astype(object)
+    assert df["numeric"].dtype == "float64"
+
+    for strict_min in [False, True]:
+        for strict_max in [False, True]:
+            for min_value, max_value in [(2, 4), (None, 4), (2, None)]:
+                kwargs = {
+                    "min_value": min_value,
+                    "max_value": max_value,
+                    "strict_min": strict_min,
+                    "strict_max": strict_max,
+                    "result_format": "COMPLETE",
+                }
+                vectorized = df.expect_column_values_to_be_between("numeric", **kwargs)
+                elementwise = df.expect_column_values_to_be_between("object", **kwargs)
+                assert vectorized.result == elementwise.result
+
+    result = df.expect_column_values_to_be_between(
+        "dates",
+        min_value="2020-01-02",
+        max_value="2020-01-03",
+        parse_strings_as_datetimes=True,
+        result_format="COMPLETE",
+    ).result
+    assert result["unexpected_index_list"] == [0, 4]
+
+
+def test_expect_column_values_to_be_in_type_list_with_mixed_types():
+    df = ge.dataset.PandasDataset(
+        {
+            "mixed": [1, "a", 2.5, True, None, "b"],
+            "strings": ["a", "b", "c", None, "d", "e"],
+        }
+    )
+
+    result = df.expect_column_values_to_be_in_type_list(
+        "mixed", ["int", "str"], result_format="COMPLETE"
+    ).result
+    # bool is a subclass of int
+    assert result["unexpected_index_list"] == [2]
+
+    assert df.expect_column_values_to_be_of_type("strings", "str").success
+    result = df.expect_column_values_to_be_of_type(
+        "mixed", "float", result_format="COMPLETE"
+    ).result
+    assert result["unexpected_index_list"] == [0, 1, 3, 5]
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        ["a", "b", None, "c"],
+        [np.str_("a"), "b", None],
+        [b"a", b"b"],
+        [1, 2, 3],
+        [1.5, None, 2.5],
+        [True, False],
+        list(pd.to_datetime(["2020-01-01", "2020-01-02"])),
+        [1, "a", 2.5, None],
+        [],
+    ],
+)
+@pytest.mark.parametrize(
+    "comp_types", [(str,), (np.str_,), (bytes,), (int,), (float, np.floating)]
+)
+def test_values_are_instances_matches_per_value_check(values, comp_types):
+    column = pd.Series(values, dtype=object if not values else None)
+    column = column[column.notnull()]
+    expected = column.map(lambda value: isinstance(value, comp_types)).astype(bool)
+    result = ge.dataset.PandasDataset._values_are_instances(column, comp_types)
+    assert result.tolist() == expected.tolist()
+    assert result.index.tolist() == column.index.tolist()
+
+
+def test_validate_sample_reports_confidence_intervals():
+    df = ge.dataset.PandasDataset(
+        {"a": list(range(1000)), "b": ["x", "y", "z", None] * 250}
+    )
+    df.expect_column_values_to_be_between("a", 0, 949, mostly=0.9)
+    df.expect_column_values_to_be_in_set("b", ["x", "y"], mostly=0.5)
+    df.expect_column_values_to_not_be_null("a")
+    df.expect_table_columns_to_match_ordered_list(["a", "b"])
+
+    result = df.validate(sample_fraction=0.2, sample_seed=42)
+    assert result.success
+    assert result.meta["sampling"] == {
+        "method": "DataFrame.sample",
+        "seed": 42,
+        "fraction": 0.2,
+        "confidence_level": 0.95,
+    }
+    assert result.meta["batch_kwargs"] == df.batch_kwargs
+
+    results = {r.expectation_config.expectation_type: r.result for r in result.results}
+    between = results["expect_column_values_to_be_between"]
+    assert between["element_count"] == 200
+    sampling = between["details"]["sampling"]
+    assert sampling["unexpected_fraction"] == between["unexpected_count"] / 200
+    lower, upper = sampling["unexpected_fraction_interval"]
+    assert lower < 0.05 < upper
+    assert sampling["conclusive"]
+
+    # No sampled null values cannot show that the whole column has none
+    assert (
+        results["expect_column_values_to_not_be_null"]["details"]["sampling"][
+            "unexpected_fraction_interval"
+        ][0]
+        == 0
+    )
+    assert not results["expect_column_values_to_not_be_null"]["details"]["sampling"][
+        "conclusive"
+    ]
+    assert "details" not in results["expect_table_columns_to_match_ordered_list"]
+
+    # The same seed draws the same sample
+    assert (
+        df.validate(sample_fraction=0.2, sample_seed=42).to_json_dict()["results"]
+        == result.to_json_dict()["results"]
+    )
+    # Without sampling the results have no sampling details
+    assert "details" not in df.validate().results[0].result
+
+    with pytest.raises(ValueError):
+        df.validate(sample_fraction=1.5)
@@ -424,3 +424,34 @@ def test_expect_column_values_to_be_json_parseable(spark_session):
         out = D.expect_column_values_to_be_json_parseable(**t["in"])
         assert t["out"]["success"] == out.success
         assert t["out"]["unexpected_list"] == out.result["unexpected_list"]
+
+
+@pytest.mark.skipif(
+    importlib.util.find_spec("pyspark") is None, reason="requires the Spark library"
+)
+def test_fused_column_map_evaluation_matches_individual_jobs(
+    spark_session, test_dataframe
+):
+    columns = list(test_dataframe.spark_df.columns)
+    test_dataframe.expect_column_values_to_be_in_set("name", ["Alice", "Bob"])
+    test_dataframe.expect_column_values_to_be_between("age", 2, 3, mostly=0.5)
+    test_dataframe.expect_column_values_to_not_be_null("address.city")
+    test_dataframe.expect_column_values_to_match_regex("name_duplicate", "^[A-C]")
+    test_dataframe.expect_column_values_to_be_unique("name_with_duplicates")
+    suite = test_dataframe.get_expectation_suite(discard_failed_expectations=False)
+    # evaluating expectations does not add columns to the dataset
+    assert test_dataframe.spark_df.columns == columns
+
+    fused_results = SparkDFDataset(test_dataframe.spark_df).validate(
+        expectation_suite=suite, result_format="SUMMARY"
+    )
+    unfused_results = SparkDFDataset(
+        test_dataframe.spark_df, fuse_column_map_jobs=False
+    ).validate(expectation_suite=suite, result_format="SUMMARY")
+
+    assert fused_results.success == unfused_results.success
+    for fused_result, unfused_result in zip(
+        fused_results.results, unfused_results.results
+    ):
+        assert fused_result.success == unfused_result.success
+        assert fused_result.result == unfused_result.result
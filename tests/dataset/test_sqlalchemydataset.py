@@ -5,7 +5,11 @@ except ImportError:
 import pandas as pd
 import pytest
 
-from great_expectations.dataset import MetaSqlAlchemyDataset, SqlAlchemyDataset
+from great_expectations.dataset import (
+    MetaSqlAlchemyDataset,
+    PandasDataset,
+    SqlAlchemyDataset,
+)
 from great_expectations.util import is_library_loadable
 from tests.test_utils import get_dataset
 
@@ -335,9 +339,344 @@ def test_expect_compound_columns_to_be_unique(sa):
     assert dataset.expect_compound_columns_to_be_unique(
         ["col1", "col2", "col3"]
     ).success
-    assert not dataset.expect_compound_columns_to_be_unique(
-        ["col1", "col2", "col4"], ignore_row_if="any_value_is_missing",
-    ).success
+    # Rows are ignored as they are by a PandasDataset: (2, 2, None) is duplicated unless rows with any missing
+    # value are ignored
     assert dataset.expect_compound_columns_to_be_unique(
-        ["col1", "col2", "col4"]
+        ["col1", "col2", "col4"], ignore_row_if="any_value_is_missing",
     ).success
+    result = dataset.expect_compound_columns_to_be_unique(
+        ["col1", "col2", "col4"], result_format="COMPLETE"
+    )
+    assert not result.success
+    assert result.result["unexpected_count"] == 2
+    assert result.result["unexpected_list"] == [
+        {"col1": 2, "col2": 2, "col4": None},
+        {"col1": 2, "col2": 2, "col4": None},
+    ]
+
+
+def test_column_pair_and_multicolumn_map_expectations_match_pandas(sa):
+    engine = sa.create_engine("sqlite://")
+
+    data = pd.DataFrame(
+        {
+            "a": [1, 2, 3, None, 5, None],
+            "b": [1, 1, 4, 2, None, None],
+            "c": [2, 3, 3, 1, 1, None],
+        }
+    )
+    data.to_sql(name="test_multicolumn", con=engine, index=False)
+
+    def add_expectations(dataset):
+        dataset.expect_column_pair_values_to_be_equal("a", "b")
+        dataset.expect_column_pair_values_to_be_equal(
+            "b", "c", ignore_row_if="either_value_is_missing"
+        )
+        dataset.expect_column_pair_values_A_to_be_greater_than_B(
+            "a", "b", or_equal=True, ignore_row_if="never"
+        )
+        dataset.expect_column_pair_values_to_be_in_set(
+            "a", "c", [(1, 2), (2, 3), (None, 1)]
+        )
+        dataset.expect_select_column_values_to_be_unique_within_record(
+            ["a", "b", "c"], mostly=0.1
+        )
+        dataset.expect_select_column_values_to_be_unique_within_record(
+            ["a", "b"], ignore_row_if="any_value_is_missing"
+        )
+        dataset.expect_multicolumn_sum_to_equal(["a", "b", "c"], 4)
+        dataset.expect_compound_columns_to_be_unique(["b", "c"])
+        return dataset.get_expectation_suite(discard_failed_expectations=False)
+
+    def replace_nan(value):
+        if isinstance(value, (list, tuple)):
+            return type(value)(replace_nan(item) for item in value)
+        if isinstance(value, dict):
+            return {key: replace_nan(item) for key, item in value.items()}
+        return None if pd.isnull(value) else value
+
+    suite = add_expectations(PandasDataset(data))
+    assert len(suite.expectations) == 8
+    expected = PandasDataset(data).validate(
+        expectation_suite=suite, result_format="COMPLETE"
+    )
+
+    statements = []
+
+    @sa.event.listens_for(engine, "before_cursor_execute")
+    def count_statements(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    result = SqlAlchemyDataset("test_multicolumn", engine=engine).validate(
+        expectation_suite=suite, result_format="COMPLETE"
+    )
+
+    assert result.statistics == expected.statistics
+    for sql_result, pandas_result in zip(result.results, expected.results):
+        # Row indexes are only known to pandas, and unexpected pairs that include a missing value can only be
+        # counted when missing values are NaN, which sort, rather than None
+        for key in [
+            "unexpected_index_list",
+            "partial_unexpected_index_list",
+            "partial_unexpected_counts",
+        ]:
+            del pandas_result.result[key]
+            sql_result.result.pop(key)
+        for dataset_result in [sql_result.result, pandas_result.result]:
+            dataset_result.pop("details", None)
+        assert sql_result.result == replace_nan(pandas_result.result)
+    # The column pair and multicolumn map expectations are counted with a single query
+    assert len([s for s in statements if "unexpected_count_0" in s]) == 1
+
+
+def test_fused_column_map_evaluation_matches_individual_queries(sa):
+    engine = sa.create_engine("sqlite://")
+
+    data = pd.DataFrame(
+        {
+            "a": [1, 2, 3, 4, None],
+            "b": ["cat", "dog", "fish", "dog", None],
+            "c": [1, 1, 2, 3, 4],
+        }
+    )
+    data.to_sql(name="test_fused", con=engine, index=False)
+
+    statements = []
+
+    @sa.event.listens_for(engine, "before_cursor_execute")
+    def count_statements(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    results = {}
+    for fuse in [True, False]:
+        dataset = SqlAlchemyDataset(
+            "test_fused", engine=engine, fuse_column_map_queries=fuse
+        )
+        dataset.expect_column_values_to_be_between("a", min_value=1, max_value=3)
+        dataset.expect_column_values_to_be_in_set("b", ["cat", "dog"])
+        dataset.expect_column_values_to_not_be_null("b")
+        dataset.expect_column_values_to_be_unique("c")
+        dataset.expect_column_value_lengths_to_equal("b", 3, mostly=0.5)
+
+        del statements[:]
+        validation_result = dataset.validate(result_format="SUMMARY")
+        results[fuse] = (validation_result, len(statements))
+
+    fused_result, fused_statement_count = results[True]
+    unfused_result, unfused_statement_count = results[False]
+    assert fused_result.results == unfused_result.results
+    assert fused_result.statistics == unfused_result.statistics
+    assert fused_result.statistics["unsuccessful_expectations"] == 4
+    # One fused count query, plus one unexpected values query per expectation
+    # that found unexpected values
+    assert fused_statement_count == 1 + 5
+    assert unfused_statement_count == 5 + 5
+
+
+def test_planned_aggregate_metrics_match_individual_queries(sa):
+    engine = sa.create_engine("sqlite://")
+
+    data = pd.DataFrame(
+        {"a": [1, 2, 3, 4, None], "b": ["cat", "dog", "fish", "dog", None]}
+    )
+    data.to_sql(name="test_planned", con=engine, index=False)
+
+    statements = []
+
+    @sa.event.listens_for(engine, "before_cursor_execute")
+    def count_statements(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    results = {}
+    for plan in [True, False]:
+        dataset = SqlAlchemyDataset(
+            "test_planned", engine=engine, plan_aggregate_metrics=plan
+        )
+        dataset.expect_table_row_count_to_equal(5)
+        dataset.expect_column_min_to_be_between("a", min_value=1, max_value=2)
+        dataset.expect_column_max_to_be_between("a", min_value=1, max_value=2)
+        dataset.expect_column_mean_to_be_between("a", min_value=2, max_value=3)
+        dataset.expect_column_sum_to_be_between("a", min_value=10, max_value=10)
+        dataset.expect_column_unique_value_count_to_be_between(
+            "b", min_value=3, max_value=3
+        )
+        dataset.expect_column_proportion_of_unique_values_to_be_between(
+            "b", min_value=0.5, max_value=1
+        )
+
+        # Start from an empty cache, as a newly loaded batch would
+        dataset = SqlAlchemyDataset(
+            "test_planned",
+            engine=engine,
+            plan_aggregate_metrics=plan,
+            expectation_suite=dataset.get_expectation_suite(
+                discard_failed_expectations=False
+            ),
+        )
+        del statements[:]
+        validation_result = dataset.validate(result_format="SUMMARY")
+        results[plan] = (validation_result, len(statements))
+
+    planned_result, planned_statement_count = results[True]
+    unplanned_result, unplanned_statement_count = results[False]
+    assert planned_result.results == unplanned_result.results
+    assert planned_result.statistics == unplanned_result.statistics
+    assert planned_result.statistics["unsuccessful_expectations"] == 1
+    assert planned_statement_count == 1
+    assert unplanned_statement_count > planned_statement_count
+
+
+def test_approximate_metrics_are_computed_with_sketches(sa):
+    engine = sa.create_engine("sqlite://")
+
+    data = pd.DataFrame(
+        {"a": [1, 2, 3, 4, None, 4] * 5000, "b": list(range(30000, 0, -1))}
+    )
+    data.to_sql(name="test_approximate", con=engine, index=False)
+
+    with pytest.raises(ValueError):
+        SqlAlchemyDataset("test_approximate", engine=engine, approximate_metrics=2)
+
+    dataset = SqlAlchemyDataset(
+        "test_approximate", engine=engine, approximate_metrics=True
+    )
+    # Few distinct values are counted exactly
+    result = dataset.expect_column_unique_value_count_to_be_between(
+        "a", min_value=4, max_value=4, result_format="SUMMARY"
+    )
+    assert result.success
+    assert result.result["details"] == {
+        "approximation": {"method": "HyperLogLog", "relative_error": 0.0}
+    }
+
+    result = dataset.expect_column_unique_value_count_to_be_between(
+        "b", min_value=29000, max_value=31000, result_format="SUMMARY"
+    )
+    assert result.success
+    assert result.result["details"]["approximation"]["relative_error"] <= 0.01
+
+    result = dataset.expect_column_median_to_be_between(
+        "b", min_value=14500, max_value=15500, result_format="SUMMARY"
+    )
+    assert result.success
+    approximation = result.result["details"]["approximation"]
+    assert approximation["method"] == "QuantileSketch"
+    assert 0 < approximation["relative_error"] <= 0.01
+
+    # sqlite has no percentile_disc, so quantiles can only be computed approximately
+    result = dataset.expect_column_quantile_values_to_be_between(
+        "b",
+        {"quantiles": [0.1, 0.9], "value_ranges": [[2700, 3300], [26700, 27300]],},
+        result_format="SUMMARY",
+    )
+    assert result.success
+    assert result.result["details"]["approximation"] == approximation
+
+    # The sketch is sized without counting the column in a scan of its own
+    def fail(column):
+        raise AssertionError("the column was counted before it was sketched")
+
+    dataset.get_column_nonnull_count = fail
+    sketch = dataset._get_column_quantile_sketch("b")
+    assert sketch.count == 30000
+    assert 0 < sketch.relative_error <= 0.01
+
+    # Without approximate metrics the results have no approximation details
+    exact_dataset = SqlAlchemyDataset("test_approximate", engine=engine)
+    result = exact_dataset.expect_column_unique_value_count_to_be_between(
+        "b", min_value=30000, max_value=30000, result_format="SUMMARY"
+    )
+    assert result.success
+    assert "details" not in result.result
+
+
+def test_validate_sample_with_hash_filter(sa):
+    engine = sa.create_engine("sqlite://")
+
+    data = pd.DataFrame({"a": list(range(10000)), "b": ["x", "y", "z", "w"] * 2500})
+    data.to_sql(name="test_sample", con=engine, index=False)
+
+    dataset = SqlAlchemyDataset("test_sample", engine=engine)
+    dataset.expect_column_values_to_be_between("a", 0, 8999, mostly=0.8)
+    dataset.expect_column_values_to_be_in_set("b", ["x", "y", "z"], mostly=0.7)
+    dataset.expect_table_columns_to_match_ordered_list(["a", "b"])
+
+    result = dataset.validate(sample_fraction=0.1, sample_seed=7)
+    assert result.success
+    assert result.meta["sampling"]["method"] == "hash filter"
+    assert result.meta["sampling"]["seed"] == 7
+    assert result.meta["sampling"]["reproducible"]
+
+    between = result.results[0].result
+    # The sample is spread over the whole table, not taken from its head
+    assert 900 <= between["element_count"] <= 1100
+    sampling = between["details"]["sampling"]
+    lower, upper = sampling["unexpected_fraction_interval"]
+    assert lower < 0.1 < upper
+    assert sampling["conclusive"]
+
+    assert (
+        dataset.validate(sample_fraction=0.1, sample_seed=7).results[0].result
+        == between
+    )
+
+
+def test_hash_filter_samples_differ_by_seed(sa):
+    engine = sa.create_engine("sqlite://")
+
+    data = pd.DataFrame({"a": list(range(10000))})
+    data.to_sql(name="test_sample", con=engine, index=False)
+
+    dataset = SqlAlchemyDataset("test_sample", engine=engine)
+
+    def sample_values(seed):
+        sample, sampling = dataset._get_validation_sample(0.1, seed)
+        # the rows of sqlite tables are identified by their rowid
+        assert sampling == {"method": "hash filter", "seed": seed, "reproducible": True}
+        rows = sample.engine.execute(
+            sa.select([sa.column("a")]).select_from(sample._table)
+        ).fetchall()
+        return {row[0] for row in rows}
+
+    first = sample_values(7)
+    assert first == sample_values(7)
+    second = sample_values(8)
+    assert 900 <= len(first) <= 1100
+    assert 900 <= len(second) <= 1100
+    # Samples drawn with different seeds overlap about as much as independent samples would
+    assert len(first & second) < 200
+    # and are not spaced evenly through the table
+    gaps = {b - a for a, b in zip(sorted(first), sorted(first)[1:])}
+    assert len(gaps) > 20
+
+
+def test_hash_filter_sample_row_keys(sa):
+    engine = sa.create_engine("sqlite://")
+    engine.execute("CREATE TABLE test_int_key (id INTEGER PRIMARY KEY, a INTEGER)")
+    engine.execute("CREATE TABLE test_text_key (id TEXT PRIMARY KEY, a INTEGER)")
+    for i in range(2000):
+        engine.execute("INSERT INTO test_int_key VALUES (?, ?)", (-1000 + 7 * i, i))
+        engine.execute("INSERT INTO test_text_key VALUES (?, ?)", ("k%d" % i, i))
+    engine.execute("CREATE VIEW test_view AS SELECT a FROM test_text_key")
+
+    def sample_values(table_name, seed):
+        sample, sampling = SqlAlchemyDataset(
+            table_name, engine=engine
+        )._get_validation_sample(0.2, seed)
+        rows = sample.engine.execute(
+            sa.select([sa.column("a")]).select_from(sample._table)
+        ).fetchall()
+        return {row[0] for row in rows}, sampling
+
+    for table_name in ["test_int_key", "test_text_key"]:
+        values, sampling = sample_values(table_name, 3)
+        assert sampling["reproducible"]
+        # negative keys are sampled too
+        assert 300 <= len(values) <= 500
+        assert values == sample_values(table_name, 3)[0]
+        assert values != sample_values(table_name, 4)[0]
+
+    # a view has no key, so its rows are numbered in the order they are read
+    values, sampling = sample_values("test_view", 3)
+    assert not sampling["reproducible"]
+    assert 300 <= len(values) <= 500
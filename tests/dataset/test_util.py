@@ -1,9 +1,13 @@
 import numpy as np
+import pandas as pd
 import pytest
+from scipy import stats
 
-from great_expectations.dataset import SqlAlchemyDataset
+from great_expectations.dataset import PandasDataset, SqlAlchemyDataset
 from great_expectations.dataset.util import (
     build_continuous_partition_object,
+    get_bootstrapped_ks_test_pass_count,
+    get_partition_counts,
     is_valid_continuous_partition_object,
 )
 
@@ -50,3 +54,70 @@ def test_build_continuous_partition_object(
     assert np.allclose(partition["weights"], weights / n)
     assert np.allclose(partition["bins"], bin_edges)
     assert is_valid_continuous_partition_object(partition)
+
+
+def test_get_partition_counts_matches_histogram():
+    data = np.array([-3.0, -1.0, 0.0, 0.5, 1.0, 1.0, 2.0, 2.5, np.nan, 7.0])
+    bins = [-1.0, 0.0, 1.0, 2.0]
+
+    counts = get_partition_counts(data, bins)
+    hist, _ = np.histogram(data[~np.isnan(data)], bins)
+
+    assert counts[0] == 1
+    assert counts[1:-1].tolist() == hist.tolist() == [1, 2, 3]
+    assert counts[-1] == 2
+    assert get_partition_counts(data, [-np.inf, 0, np.inf]).tolist() == [0, 2, 7, 0]
+
+
+def test_get_bootstrapped_ks_test_pass_count_matches_individual_tests():
+    data = np.random.RandomState(0).normal(size=500)
+
+    def cdf(x):
+        return stats.norm.cdf(x, scale=1.2)
+
+    np.random.seed(1)
+    p_values = [
+        stats.kstest(np.random.choice(data, size=20), cdf)[1] for _ in range(300)
+    ]
+    for p in [0, 0.05, 0.5, 0.9, 1]:
+        np.random.seed(1)
+        assert get_bootstrapped_ks_test_pass_count(data, cdf, p, 300, 20) == sum(
+            p_value >= p for p_value in p_values
+        )
+
+
+def test_get_column_histogram_matches_partition_and_hist(sa):
+    data = pd.DataFrame({"x": [0.5, 1, 2, 2, 3.5, None, 4, 8, 9, 10]})
+    engine = sa.create_engine("sqlite://")
+    data.to_sql(name="test_histogram", con=engine, index=False)
+
+    statements = []
+
+    @sa.event.listens_for(engine, "before_cursor_execute")
+    def count_statements(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    expected_hist, expected_bins = np.histogram(data["x"].dropna(), bins=4)
+    sql_dataset = SqlAlchemyDataset("test_histogram", engine=engine, caching=False)
+    del statements[:]
+    histogram = sql_dataset.get_column_histogram("x", bins="uniform", n_bins=4)
+    # One query for the number of values and extrema, and one for the histogram
+    assert len(statements) == 2
+
+    for dataset in [PandasDataset(data), sql_dataset]:
+        histogram = dataset.get_column_histogram("x", bins="uniform", n_bins=4)
+
+        assert histogram["nonnull_count"] == 9
+        assert histogram["min"] == 0.5
+        assert histogram["max"] == 10
+        assert histogram["bins"] == pytest.approx(expected_bins.tolist())
+        assert histogram["hist"] == expected_hist.tolist()
+        assert dataset.get_column_hist("x", tuple(histogram["bins"])) == list(
+            histogram["hist"]
+        )
+
+    partition_object = build_continuous_partition_object(
+        PandasDataset(data), "x", bins="ntile", n_bins=3
+    )
+    assert partition_object["bins"] == [0.5, 2, 4, 10]
+    assert partition_object["weights"] == pytest.approx([2 / 9, 3 / 9, 4 / 9])
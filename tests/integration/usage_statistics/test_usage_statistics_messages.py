@@ -450,6 +450,18 @@ valid_usage_statistics_messages = {
             "ge_version": "0.11.9.manual_testing",
         }
     ],
+    "cli.store.rebuild_index": [
+        {
+            "event": "cli.store.rebuild_index",
+            "event_payload": {},
+            "success": True,
+            "version": "1.0.0",
+            "event_time": "2020-08-03T23:56:53.908Z",
+            "data_context_id": "00000000-0000-0000-0000-000000000002",
+            "data_context_instance_id": "10000000-0000-0000-0000-000000000002",
+            "ge_version": "0.11.9.manual_testing",
+        }
+    ],
     "cli.suite.demo": [
         {
             "event": "cli.suite.demo",
@@ -1,8 +1,10 @@
 import os
 
+import pandas as pd
 import pytest
 
 import great_expectations.exceptions as ge_exceptions
+from great_expectations.dataset import SqlAlchemyDataset
 from great_expectations.dataset.pandas_dataset import PandasDataset
 from great_expectations.datasource import PandasDatasource
 from great_expectations.profile.base import DatasetProfiler, Profiler
@@ -408,3 +410,68 @@ def test_context_profiler_without_generator_name_arg_on_datasource_with_no_gener
     )
 
     assert profiling_result == {"success": False, "error": {"code": 4}}
+
+
+def test_BasicDatasetProfiler_computes_cardinality_metrics_with_single_query(sa):
+    engine = sa.create_engine("sqlite://")
+    data = pd.DataFrame(
+        {
+            "a": [1, 2, 3, 4, 5, 6],
+            "b": ["cat", "dog", "cat", "dog", "cat", None],
+            "c": [1.5, 2.5, 3.5, 4.5, 5.5, 6.5],
+        }
+    )
+    data.to_sql(name="test_profiling", con=engine, index=False)
+
+    statements = []
+
+    @sa.event.listens_for(engine, "before_cursor_execute")
+    def count_statements(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    results = {}
+    for plan in [True, False]:
+        dataset = SqlAlchemyDataset(
+            "test_profiling", engine=engine, plan_aggregate_metrics=plan
+        )
+        del statements[:]
+        expectation_suite = BasicDatasetProfiler._profile(dataset)
+        results[plan] = (expectation_suite, len(statements))
+
+    planned_suite, planned_statement_count = results[True]
+    unplanned_suite, unplanned_statement_count = results[False]
+    assert planned_suite.expectations == unplanned_suite.expectations
+    # Besides the table row count expectation, the nonnull and unique counts of every column come from one query
+    assert planned_statement_count == 2
+    assert unplanned_statement_count == 7
+
+
+def test_BasicDatasetProfiler_counts_pandas_columns_in_one_pass():
+    dataset = PandasDataset(
+        {
+            "a": [1, 2, 3, 4, 5, 6],
+            "b": ["cat", "dog", "cat", "dog", "cat", None],
+            "c": [1.5, 2.5, 3.5, 4.5, 5.5, 6.5],
+        }
+    )
+    expected_suite = BasicDatasetProfiler._profile(PandasDataset(dataset))
+
+    def fail(*args, **kwargs):
+        raise AssertionError("value counts were computed outside the profiling pass")
+
+    dataset.get_column_value_counts = fail
+    expectation_suite = BasicDatasetProfiler._profile(dataset)
+    assert expectation_suite.expectations == expected_suite.expectations
+    assert dataset._profiling_metrics == {}
+
+
+def test_BasicDatasetProfiler_finishes_profiling_when_a_column_fails():
+    dataset = PandasDataset({"a": [1, 2, 3], "b": ["cat", "dog", None]})
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("column failed")
+
+    dataset.expect_column_values_to_not_be_null = fail
+    with pytest.raises(RuntimeError):
+        BasicDatasetProfiler._profile(dataset)
+    assert dataset._profiling_metrics == {}
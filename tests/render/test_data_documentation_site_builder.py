@@ -1,4 +1,6 @@
+import json
 import os
+import re
 import shutil
 
 import pytest
@@ -15,7 +17,10 @@ from great_expectations.data_context.util import (
     file_relative_path,
     instantiate_class_from_config,
 )
-from great_expectations.render.renderer.site_builder import SiteBuilder
+from great_expectations.render.renderer.site_builder import (
+    DefaultSiteSectionBuilder,
+    SiteBuilder,
+)
 
 
 def assert_how_to_buttons(
@@ -573,6 +578,177 @@ def test_configuration_driven_site_builder_without_how_to_buttons(
     )
 
 
+def test_site_builder_only_renders_new_or_changed_resources(
+    site_builder_data_context_with_html_store_titanic_random,
+):
+    context = site_builder_data_context_with_html_store_titanic_random
+    context.profile_datasource("titanic")
+    local_site_config = context._project_config.data_docs_sites["local_site"]
+    site_builder = SiteBuilder(
+        data_context=context,
+        runtime_environment={"root_directory": context.root_directory},
+        **local_site_config
+    )
+    site_builder.build()
+
+    rendered = []
+    for site_section_builder in site_builder.site_section_builders.values():
+        renderer_class = site_section_builder.renderer_class
+
+        def render(resource, render=renderer_class.render):
+            rendered.append(resource)
+            return render(resource)
+
+        renderer_class.render = render
+
+    site_builder.build()
+    assert rendered == []
+
+    suite_keys = context.stores["expectations_store"].list_keys()
+    suite = context.get_expectation_suite(suite_keys[0].expectation_suite_name)
+    suite.meta["notes"] = "changed"
+    context.save_expectation_suite(suite)
+    context.stores["expectations_store"].remove_key(suite_keys[1])
+    site_builder.build()
+    assert len(rendered) == 1
+    assert rendered[0].expectation_suite_name == suite.expectation_suite_name
+
+    # The page of the removed suite is pruned along with its manifest entry
+    expectation_suite_html_pages = {
+        ExpectationSuiteIdentifier.from_tuple(suite_tuple)
+        for suite_tuple in site_builder.target_store.store_backends[
+            ExpectationSuiteIdentifier
+        ].list_keys()
+    }
+    assert expectation_suite_html_pages == set(suite_keys) - {suite_keys[1]}
+    manifest = site_builder.target_store.get_manifest("expectations")
+    assert len(manifest["resources"]) == len(suite_keys) - 1
+
+    # The how-to buttons are part of every page, so toggling them renders all the pages again
+    site_builder_without_buttons = SiteBuilder(
+        data_context=context,
+        runtime_environment={"root_directory": context.root_directory},
+        **dict(local_site_config, show_how_to_buttons=False)
+    )
+    for name, site_section_builder in site_builder.site_section_builders.items():
+        assert (
+            site_section_builder._renderer_version
+            != site_builder_without_buttons.site_section_builders[
+                name
+            ]._renderer_version
+        )
+
+
+def test_renderer_version_changes_when_a_custom_template_changes(tmp_path_factory):
+    custom_views_directory = str(tmp_path_factory.mktemp("custom_views"))
+    template_path = os.path.join(custom_views_directory, "page.j2")
+
+    def get_renderer_version():
+        return DefaultSiteSectionBuilder._get_renderer_version(
+            renderer={"class_name": "ExpectationSuitePageRenderer"},
+            view=None,
+            custom_styles_directory=None,
+            custom_views_directory=custom_views_directory,
+            show_how_to_buttons=True,
+            data_context_id=None,
+        )
+
+    empty_directory_version = get_renderer_version()
+    with open(template_path, "w") as f:
+        f.write("{{ title }}")
+    template_version = get_renderer_version()
+    assert template_version != empty_directory_version
+    assert get_renderer_version() == template_version
+
+    with open(template_path, "w") as f:
+        f.write("<h1>{{ title }}</h1>")
+    assert get_renderer_version() != template_version
+
+
+def test_site_builder_renders_pages_in_parallel(
+    site_builder_data_context_with_html_store_titanic_random,
+):
+    context = site_builder_data_context_with_html_store_titanic_random
+    context.profile_datasource("titanic")
+    local_site_config = context._project_config.data_docs_sites["local_site"]
+
+    def build_pages(max_workers):
+        site_builder = SiteBuilder(
+            data_context=context,
+            runtime_environment={"root_directory": context.root_directory},
+            max_workers=max_workers,
+            **local_site_config
+        )
+        site_builder.clean_site()
+        site_builder.build()
+        pages = {}
+        for resource_type in [ExpectationSuiteIdentifier, ValidationResultIdentifier]:
+            store_backend = site_builder.target_store.store_backends[resource_type]
+            for key in store_backend.list_keys():
+                # Pages link to the logo with the time they were rendered at, and have random element ids
+                pages[key] = re.sub(
+                    r"\?d=[0-9T.]+Z|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}",
+                    "",
+                    store_backend.get(key),
+                )
+        return pages
+
+    pages = build_pages(max_workers=None)
+    assert len(pages) == 11
+    assert build_pages(max_workers=2) == pages
+
+
+def test_site_builder_renders_lazy_validation_result_pages(
+    site_builder_data_context_with_html_store_titanic_random,
+):
+    context = site_builder_data_context_with_html_store_titanic_random
+    context.profile_datasource("titanic")
+    lazy_view_config = {
+        "view": {"class_name": "DefaultJinjaLazyPageView", "page_size": 5}
+    }
+    local_site_config = dict(
+        context._project_config.data_docs_sites["local_site"],
+        site_section_builders={
+            "validations": lazy_view_config,
+            "profiling": lazy_view_config,
+        },
+    )
+    site_builder = SiteBuilder(
+        data_context=context,
+        runtime_environment={"root_directory": context.root_directory},
+        **local_site_config
+    )
+    site_builder.clean_site()
+    site_builder.build()
+
+    store_backends = site_builder.target_store.store_backends
+    sections_data_store_backend = store_backends["validation_sections_data"]
+    validation_keys = store_backends[ValidationResultIdentifier].list_keys()
+    assert len(validation_keys) > 0
+    assert sorted(sections_data_store_backend.list_keys()) == sorted(validation_keys)
+
+    for key in validation_keys:
+        page = store_backends[ValidationResultIdentifier].get(key)
+        # The page holds the overview, and loads the other sections from its sections data
+        assert 'id="section-1"' in page
+        assert 'id="section-2"' not in page
+        assert '<script src="{}.sections.js"></script>'.format(key[-1]) in page
+        assert "var geLazySectionsPageSize = 5;" in page
+
+        sections_data = sections_data_store_backend.get(key)
+        assert sections_data.startswith("geLoadSections(")
+        assert sections_data.endswith(");")
+        sections = json.loads(sections_data[len("geLoadSections(") : -2])["sections"]
+        assert len(sections) > 0
+        for index, section in enumerate(sections, start=2):
+            assert 'id="section-{}"'.format(index) in section
+
+    # Removing a validation result removes the sections data of its page
+    context.stores["validations_store"].store_backend.remove_key(validation_keys[0])
+    site_builder.build()
+    assert validation_keys[0] not in sections_data_store_backend.list_keys()
+
+
 def test_site_builder_with_custom_site_section_builders_config(tmp_path_factory):
     """Test that site builder can handle partially specified custom site_section_builders config"""
     base_dir = str(tmp_path_factory.mktemp("project_dir"))
@@ -17,7 +17,10 @@ from great_expectations.render.types import (
     TextContent,
     ValueListContent,
 )
-from great_expectations.render.view import DefaultJinjaPageView
+from great_expectations.render.view import (
+    DefaultJinjaComponentView,
+    DefaultJinjaPageView,
+)
 
 
 @pytest.fixture()
@@ -602,3 +605,17 @@ def test_render_text():
         .replace("\t", "")
         .replace("\n", "")
     )
+
+
+def test_jinja_environment_is_shared_by_views_with_the_same_directories(tmp_path):
+    view = DefaultJinjaPageView()
+    env = view._get_environment()
+    assert DefaultJinjaPageView()._get_environment() is env
+    assert (
+        DefaultJinjaPageView(custom_views_directory=str(tmp_path))._get_environment()
+        is not env
+    )
+    assert DefaultJinjaComponentView()._get_environment() is not env
+
+    assert view.precompile_templates() > 0
+    assert view._get_template("page.j2") is view._get_template("page.j2")
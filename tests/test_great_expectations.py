@@ -823,6 +823,28 @@ def test_validate():
     assert validation_results.to_json_dict() == expected_results.to_json_dict()
 
 
+@freeze_time("11/05/1955")
+def test_validate_with_max_workers():
+    with open(
+        file_relative_path(__file__, "./test_sets/titanic_expectations.json")
+    ) as f:
+        my_expectation_suite = expectationSuiteSchema.loads(f.read())
+
+    with mock.patch("uuid.uuid1") as uuid:
+        uuid.return_value = "1234"
+        my_df = ge.read_csv(
+            file_relative_path(__file__, "./test_sets/Titanic.csv"),
+            expectation_suite=my_expectation_suite,
+        )
+    my_df.set_default_expectation_argument("result_format", "COMPLETE")
+
+    sequential_results = my_df.validate(catch_exceptions=False)
+    parallel_results = my_df.validate(catch_exceptions=False, max_workers=4)
+
+    # Results come back in the same order as a sequential run
+    assert parallel_results.to_json_dict() == sequential_results.to_json_dict()
+
+
 @mock.patch(
     "great_expectations.core.ExpectationValidationResult.validate_result_dict",
     return_value=False,
@@ -640,15 +640,15 @@ def candidate_test_is_on_temporary_notimplemented_list(context, expectation_type
             "expect_column_bootstrapped_ks_test_p_value_to_be_greater_than",
             # "expect_column_kl_divergence_to_be_less_than",
             "expect_column_parameterized_distribution_ks_test_p_value_to_be_greater_than",
-            "expect_column_pair_values_to_be_equal",
-            "expect_column_pair_values_A_to_be_greater_than_B",
-            "expect_column_pair_values_to_be_in_set",
-            "expect_select_column_values_to_be_unique_within_record",
-            "expect_compound_columns_to_be_unique",
-            "expect_multicolumn_values_to_be_unique",
+            # "expect_column_pair_values_to_be_equal",
+            # "expect_column_pair_values_A_to_be_greater_than_B",
+            # "expect_column_pair_values_to_be_in_set",
+            # "expect_select_column_values_to_be_unique_within_record",
+            # "expect_compound_columns_to_be_unique",
+            # "expect_multicolumn_values_to_be_unique",
             "expect_column_pair_cramers_phi_value_to_be_less_than",
             # "expect_table_row_count_to_equal_other_table",
-            "expect_multicolumn_sum_to_equal",
+            # "expect_multicolumn_sum_to_equal",
         ]
     if context == "SparkDFDataset":
         return expectation_type in [